@@ -0,0 +1,145 @@
+"""
+Wire bytes per call, measured against the fake server.
+
+Serves synthetic contacts from FakeHighLevelServer with gzip responses on, as
+the API does, and counts the request and response body bytes that actually
+cross the socket for contact pages and contact upserts, for:
+
+- baseline: a plain requests.Session sending calls the way the client did
+  before (requests' default `Accept-Encoding: gzip, deflate`, `json=` bodies)
+- client: HighLevelClient with its defaults (compact bodies)
+- client_gzip: HighLevelClient(compress_requests=True), which gzips bodies
+  above HighLevelConfig.REQUEST_COMPRESSION_MIN_BYTES
+
+    python -m benchmarks.bench_compression --pages 5 --limit 100 > compression.json
+
+The fake server only speaks gzip, so brotli and zstd, which the client asks
+for when their decoders are installed, are not measured here.
+"""
+
+import argparse
+import json
+import sys
+
+import requests
+
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.models import Location
+from highlevel_sdk.testing import FakeHighLevelServer, SyntheticDataset
+
+TOKEN_DATA = {"access_token": "bench"}
+
+
+def upsert_payloads(dataset, count):
+    payloads = []
+    for i in range(count):
+        contact = dict(dataset.contact(i))
+        contact.pop("id", None)
+        contact["email"] = "bench%d@example.com" % i
+        payloads.append(contact)
+    return payloads
+
+
+def run_baseline(server, dataset, pages, limit, payloads):
+    """
+    Sends the calls the way the client did before compression was negotiated.
+    """
+    session = requests.Session()
+    headers = {
+        "Content-Type": "application/json",
+        "version": HighLevelConfig.VERSION,
+        "Authorization": "Bearer " + TOKEN_DATA["access_token"],
+    }
+    params = {"locationId": dataset.location_id, "limit": limit}
+    server.reset_stats()
+    for _ in range(pages):
+        response = session.get(
+            server.url + "/contacts/", headers=headers, params=params
+        )
+        meta = response.json()["meta"]
+        if not meta.get("startAfterId"):
+            break
+        params = dict(
+            params, startAfter=meta["startAfter"], startAfterId=meta["startAfterId"]
+        )
+    page_bytes = dict(server.wire_bytes)
+
+    server.reset_stats()
+    for payload in payloads:
+        session.post(
+            server.url + "/contacts/upsert",
+            headers=headers,
+            json=dict(payload, locationId=dataset.location_id),
+        )
+    session.close()
+    return page_bytes, dict(server.wire_bytes)
+
+
+def run_client(server, dataset, pages, limit, payloads, **kwargs):
+    with HighLevelClient(base_url=server.url, **kwargs) as client:
+        location = Location(token_data=TOKEN_DATA, id=dataset.location_id, api=client)
+        server.reset_stats()
+        for number, _ in enumerate(location.get_contacts(limit=limit).iter_pages(), 1):
+            if number == pages:
+                break
+        page_bytes = dict(server.wire_bytes)
+
+        server.reset_stats()
+        for payload in payloads:
+            location.upsert_contact(payload)
+        return page_bytes, dict(server.wire_bytes)
+
+
+def summarize(page_bytes, upsert_bytes, pages, upserts):
+    return {
+        "page_response_bytes": round(page_bytes.get("sent", 0) / pages, 1),
+        "upsert_request_bytes": round(upsert_bytes.get("received", 0) / upserts, 1),
+        "upsert_response_bytes": round(upsert_bytes.get("sent", 0) / upserts, 1),
+    }
+
+
+def measure(pages, limit, upserts, custom_fields, seed):
+    dataset = SyntheticDataset(
+        contacts=pages * limit, custom_fields=custom_fields, seed=seed
+    )
+    payloads = upsert_payloads(dataset, upserts)
+    modes = {
+        "baseline": lambda server: run_baseline(
+            server, dataset, pages, limit, payloads
+        ),
+        "client": lambda server: run_client(server, dataset, pages, limit, payloads),
+        "client_gzip": lambda server: run_client(
+            server, dataset, pages, limit, payloads, compress_requests=True
+        ),
+    }
+    results = {}
+    with FakeHighLevelServer(dataset, gzip=True) as server:
+        for name, run in modes.items():
+            results[name] = summarize(*run(server), pages, upserts)
+    return {
+        "pages": pages,
+        "limit": limit,
+        "upserts": upserts,
+        "request_compression_min_bytes": HighLevelConfig.REQUEST_COMPRESSION_MIN_BYTES,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--upserts", type=int, default=20)
+    parser.add_argument("--custom-fields", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    report = measure(
+        args.pages, args.limit, args.upserts, args.custom_fields, args.seed
+    )
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+"""
+Throughput and peak memory of pagination, parsing, extraction and DataFrame building.
+
+Every case runs at each requested size over synthetic contacts and opportunities
+carrying realistic `customFields` and `attributions`. Pages are served by an
+in-process transport, so the numbers measure the SDK rather than the network.
+Each case is timed without tracing (best of `--repeat`), then run once under
+tracemalloc for its peak memory.
+
+    python -m benchmarks.bench_suite --sizes 10000,100000,1000000 --output results.json
+    python -m benchmarks.bench_suite --baseline results.json --threshold 0.15
+
+With `--baseline`, the run exits with status 1 if any case lost more than
+`--threshold` of its throughput or grew its peak memory by more than that share.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from urllib.parse import parse_qsl, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.models import Contact, Opportunity, Location
+from highlevel_sdk.object_parser import ObjectParser
+from highlevel_sdk.models.abstract_object import AbstractObject
+from highlevel_sdk.serialization import dumps, loads
+from highlevel_sdk.testing.synthetic import SyntheticDataset
+from highlevel_sdk.testing.transports import raw_response
+
+PAGE_SIZE = 100
+# distinct pages generated per collection; later pages reuse their records
+TEMPLATE_PAGES = 20
+TOKEN_DATA = {"access_token": "bench"}
+
+
+class SyntheticPageAdapter(HTTPAdapter):
+    """
+    Answers `/contacts/` and `/opportunities/search` with synthetic pages of a
+    given total size, without sockets. Page bodies are assembled from a few
+    pre-serialized record batches and a per-page `meta`, so serving a million
+    records costs almost nothing next to the SDK work being measured.
+    """
+
+    COLLECTIONS = {
+        "/contacts/": "contacts",
+        "/opportunities/search": "opportunities",
+    }
+
+    def __init__(self, dataset, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.dataset = dataset
+        self._templates = {}
+
+    def _records(self, kind, limit, page):
+        key = (kind, limit, page % TEMPLATE_PAGES)
+        template = self._templates.get(key)
+        if template is None:
+            record = (
+                self.dataset.contact if kind == "contacts" else self.dataset.opportunity
+            )
+            start = key[2] * limit
+            template = self._templates[key] = dumps(
+                [record(i) for i in range(start, start + limit)]
+            )
+        return template
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        kind = self.COLLECTIONS[parts.path]
+        query = dict(parse_qsl(parts.query))
+        total = getattr(self.dataset, kind)
+        limit = int(query.get("limit", 20))
+        start = self.dataset.index_after(query.get("startAfter"))
+        end = min(total, start + limit)
+        if end <= start:
+            body = b'{"%s":[],"meta":{"nextPage":null}}' % kind.encode()
+        else:
+            records = self._records(kind, end - start, start // limit)
+            meta = {
+                "total": total,
+                "nextPage": start // limit + 2 if end < total else None,
+                "startAfter": self.dataset.added_at(end - 1),
+                "startAfterId": "bench%015d" % end,
+            }
+            body = b'{"%s":%s,"meta":%s}' % (kind.encode(), records, dumps(meta))
+        return self.build_response(
+            request, raw_response(200, {"Content-Type": "application/json"}, body)
+        )
+
+
+def bench_client(dataset):
+    client = HighLevelClient(
+        rate_limiter=False, coalesce=False, base_url="http://bench.invalid"
+    )
+    client.mount(SyntheticPageAdapter(dataset))
+    return client
+
+
+def page_bytes(dataset, kind, size):
+    """
+    Returns the serialized pages of a collection, cycling the template pages.
+    """
+    record = dataset.contact if kind == "contacts" else dataset.opportunity
+    templates = [
+        b'{"%s":%s,"meta":{}}'
+        % (
+            kind.encode(),
+            dumps([record(p * PAGE_SIZE + i) for i in range(PAGE_SIZE)]),
+        )
+        for p in range(min(TEMPLATE_PAGES, -(-size // PAGE_SIZE)))
+    ]
+    return [templates[p % len(templates)] for p in range(size // PAGE_SIZE)]
+
+
+# cases: each takes (dataset, size), does its setup, and returns a callable
+# running the measured work once.
+
+
+def case_cursor(kind):
+    def setup(dataset, size):
+        client = bench_client(dataset)
+        location = Location(token_data=TOKEN_DATA, id=dataset.location_id, api=client)
+
+        def run():
+            if kind == "contacts":
+                cursor = location.get_contacts(limit=PAGE_SIZE)
+            else:
+                cursor = location.get_opportunities(limit=PAGE_SIZE)
+            count = 0
+            for _ in cursor:
+                count += 1
+            return count
+
+        return run
+
+    return setup
+
+
+def case_parse_multiple(kind):
+    target = Contact if kind == "contacts" else Opportunity
+
+    def setup(dataset, size):
+        pages = page_bytes(dataset, kind, size)
+
+        def run():
+            parsed = []
+            for page in pages:
+                parsed.extend(
+                    ObjectParser.parse_multiple(loads(page), target, TOKEN_DATA)
+                )
+            return len(parsed)
+
+        return run
+
+    return setup
+
+
+def case_create_object(kind):
+    target = Contact if kind == "contacts" else Opportunity
+
+    def setup(dataset, size):
+        pages = page_bytes(dataset, kind, size)
+
+        def run():
+            created = []
+            for page in pages:
+                for record in loads(page)[kind]:
+                    created.append(
+                        AbstractObject.create_object(record, target, TOKEN_DATA)
+                    )
+            return len(created)
+
+        return run
+
+    return setup
+
+
+def case_extractor(name):
+    def setup(dataset, size):
+        from highlevel_sdk.api import endpoints
+
+        extractor = getattr(endpoints, name)
+        records = _extractor_input(dataset, name, size)
+
+        def run():
+            extracted = extractor(records).extract()
+            if isinstance(extracted, tuple):
+                extracted = extracted[0]
+            return len(extracted)
+
+        return run
+
+    return setup
+
+
+def _extractor_input(dataset, name, size):
+    if name == "ContactsExtractor":
+        return [
+            AbstractObject.create_object(dataset.contact(i), Contact, TOKEN_DATA)
+            for i in range(size)
+        ]
+    if name == "OpportunityExtractor":
+        return [
+            AbstractObject.create_object(
+                dataset.opportunity(i), Opportunity, TOKEN_DATA
+            )
+            for i in range(size)
+        ]
+    if name == "CalendarDataExtractor":
+        from highlevel_sdk.models import CalendarEvent
+
+        spacing = 86400000 // dataset.events_per_day
+        events = dataset.events(0, dataset.added_at(0) + size * spacing)
+        return [
+            AbstractObject.create_object(event, CalendarEvent, TOKEN_DATA)
+            for event, _ in zip(events, range(size))
+        ]
+    if name == "PipelinesExtractor":
+        # five stages per pipeline
+        pipelines = dataset.pipelines()
+        return [pipelines[i % len(pipelines)] for i in range(size // 5)]
+    factory = {
+        "UserDataExtractor": dataset.user,
+        "CustomFieldsExtractor": dataset.custom_field,
+        "CustomValuesExtractor": dataset.custom_value,
+    }[name]
+    return [factory(i) for i in range(size)]
+
+
+def case_dataframe(kind):
+    def setup(dataset, size):
+        from highlevel_sdk.api.endpoints import GoHighLevelService
+
+        client = bench_client(dataset)
+
+        def run():
+            service = GoHighLevelService("bench", dataset.location_id, client=client)
+            if kind == "contacts":
+                frame = service.get_contacts_dataframe()
+            else:
+                frame = service.get_opportunities_dataframe()
+            return len(frame)
+
+        return run
+
+    return setup
+
+
+CASES = {
+    "cursor_contacts": case_cursor("contacts"),
+    "cursor_opportunities": case_cursor("opportunities"),
+    "parse_multiple_contacts": case_parse_multiple("contacts"),
+    "parse_multiple_opportunities": case_parse_multiple("opportunities"),
+    "create_object_contacts": case_create_object("contacts"),
+    "create_object_opportunities": case_create_object("opportunities"),
+    "extract_users": case_extractor("UserDataExtractor"),
+    "extract_custom_fields": case_extractor("CustomFieldsExtractor"),
+    "extract_calendar_events": case_extractor("CalendarDataExtractor"),
+    "extract_custom_values": case_extractor("CustomValuesExtractor"),
+    "extract_pipelines": case_extractor("PipelinesExtractor"),
+    "extract_contacts": case_extractor("ContactsExtractor"),
+    "extract_opportunities": case_extractor("OpportunityExtractor"),
+    "dataframe_contacts": case_dataframe("contacts"),
+    "dataframe_opportunities": case_dataframe("opportunities"),
+}
+
+
+def measure(name, size, repeat, memory, seed):
+    dataset = SyntheticDataset(contacts=size, opportunities=size, seed=seed)
+    run = CASES[name](dataset, size)
+
+    seconds = None
+    records = 0
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        records = run()
+        elapsed = time.perf_counter() - started
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    result = {
+        "name": name,
+        "size": size,
+        "records": records,
+        "seconds": round(seconds, 6),
+        "records_per_second": round(records / seconds, 1) if seconds else None,
+    }
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the cases that regressed against a baseline run.
+    """
+    previous = {(r["name"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get((result["name"], result["size"]))
+        if before is None:
+            continue
+        if before.get("records_per_second") and result["records_per_second"]:
+            change = result["records_per_second"] / before["records_per_second"] - 1
+            if change < -threshold:
+                regressions.append(
+                    dict(
+                        metric="records_per_second",
+                        change=round(change, 4),
+                        **_id(result),
+                    )
+                )
+        if before.get("peak_bytes") and result.get("peak_bytes"):
+            change = result["peak_bytes"] / before["peak_bytes"] - 1
+            if change > threshold:
+                regressions.append(
+                    dict(metric="peak_bytes", change=round(change, 4), **_id(result))
+                )
+    return regressions
+
+
+def _id(result):
+    return {"name": result["name"], "size": result["size"]}
+
+
+def environment():
+    try:
+        commit = (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    extras = {}
+    for module in ("orjson", "ijson", "pandas"):
+        try:
+            extras[module] = __import__(module).__version__
+        except (ImportError, AttributeError):
+            extras[module] = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "extras": extras,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument(
+        "--cases", default=None, help="comma-separated case names, all by default"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="write results here, not stdout")
+    parser.add_argument("--baseline", default=None, help="results of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    names = args.cases.split(",") if args.cases else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        for name in names:
+            result = measure(name, size, args.repeat, not args.no_memory, args.seed)
+            results.append(result)
+            print(
+                "%-30s %9d %12s rec/s %12s peak bytes"
+                % (
+                    name,
+                    size,
+                    result["records_per_second"],
+                    result.get("peak_bytes", "-"),
+                ),
+                file=sys.stderr,
+            )
+
+    report = {"environment": environment(), "results": results}
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+        report["baseline"] = baseline["environment"]
+        report["threshold"] = args.threshold
+        report["regressions"] = compare(results, baseline, args.threshold)
+        for regression in report["regressions"]:
+            print("REGRESSION %s" % json.dumps(regression), file=sys.stderr)
+        status = 1 if report["regressions"] else 0
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+            fp.write("\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
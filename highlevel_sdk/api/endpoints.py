@@ -6,6 +6,8 @@ import uuid
 
 from highlevel_sdk.models.models import *
 from highlevel_sdk.date import *
+from highlevel_sdk.exceptions import HighLevelError
+from highlevel_sdk.utils import timestamp_ms
 
 
 class GoHighLevelAPI:
@@ -13,11 +15,11 @@ class GoHighLevelAPI:
     Interface for communication with the GoHighLevel API.
     Responsible for making requests and returning data in a standardized format.
     """
-    def __init__(self, token: str, id_location: str):
+    def __init__(self, token: str, id_location: str, client=None):
         self.token_data = {"access_token": token}
         self.id_location = id_location
-        self.location_obj = Location(token_data=self.token_data, id=self.id_location)
-        self.calendar_obj = Calendar(token_data=self.token_data, id=self.id_location)
+        self.location_obj = Location(token_data=self.token_data, id=self.id_location, api=client)
+        self.calendar_obj = Calendar(token_data=self.token_data, id=self.id_location, api=client)
 
     def get_users(self):
         """
@@ -61,32 +63,35 @@ class GoHighLevelAPI:
             log.error(f"Error fetching custom_values: {e}")
             return []
     
-    def get_calendars_events(self, date, users):
+    def get_calendars_events(self, date, users, end_date=None, concurrency=None):
         """
         Fetches calendar events from the API for specified users and date range.
+        Users are queried concurrently, and events listed under several users
+        are returned once.
         
         Args:
-            date: Reference date for the query
+            date: Reference date for the query ('YYYY-MM-DD')
             users: List of user objects containing IDs
+            end_date: End of the range ('YYYY-MM-DD', exclusive). Defaults to 7 days after `date`.
+            concurrency: Queries at once, HighLevelConfig.CALENDAR_EVENT_WORKERS by default.
             
         Returns:
             list: List of dictionaries containing calendar events data.
         """
-        data_calendars = []
         try:
             start_timestamp, end_timestamp = DateUtil.get_next_seven_days_timestamp(date)
-            for user in users:
-                user_id = user.get('id')
-                if user_id:
-                    events = self.calendar_obj.get_events(
-                        start_date=start_timestamp, 
-                        end_date=end_timestamp, 
-                        user_id=user_id
-                    )
-                    if events:
-                        data_calendars.extend(events)
-                        
-            return data_calendars
+            if end_date:
+                end_timestamp = DateUtil.convert_date_to_timestamp(end_date)
+            user_ids = [user.get('id') for user in users if user.get('id')]
+            if not user_ids:
+                return []
+            events = self.location_obj.get_calendar_events(
+                start=start_timestamp,
+                end=end_timestamp,
+                user_ids=user_ids,
+                concurrency=concurrency,
+            )
+            return list(events)
         except Exception as e:
             log.error(f"Error fetching calendar events: {e}")
             return []
@@ -107,13 +112,14 @@ class GoHighLevelAPI:
 
     def get_contacts(self):
         """
-        Fetches contacts data from the API with a default limit of 100 records.
+        Fetches contacts data from the API, 100 records per page while the API
+        keeps up, smaller pages when it slows down or throttles.
         
         Returns:
             list: List of dictionaries containing contacts data.
         """
         try:
-            contacts_cursor = self.location_obj.get_contacts(limit=100)
+            contacts_cursor = self.location_obj.get_contacts(limit=100).adaptive()
             all_contacts = []
             for contact in contacts_cursor:
                 all_contacts.append(contact)
@@ -125,13 +131,14 @@ class GoHighLevelAPI:
 
     def get_opportunities(self):
         """
-        Fetches opportunities data from the API with a default limit of 100 records.
+        Fetches opportunities data from the API, 100 records per page while the
+        API keeps up, smaller pages when it slows down or throttles.
         
         Returns:
             list: List of dictionaries containing opportunities data.
         """
         try:
-            data_opportunities = self.location_obj.get_opportunities(limit=100)
+            data_opportunities = self.location_obj.get_opportunities(limit=100).adaptive()
             all_opportunities = []
             for opportunity in data_opportunities:
                 all_opportunities.append(opportunity)
@@ -140,7 +147,74 @@ class GoHighLevelAPI:
         except Exception as e:
             log.error(f"Error fetching opportunities: {e}")
             return []
-    
+
+    def get_contacts_updated_since(self, updated_since=None):
+        """
+        Fetches the contacts updated at or after `updated_since`, using the
+        API's dateUpdated filter. Errors are raised, so a watermark is never
+        advanced past records that were not fetched.
+
+        Returns:
+            list: Contact objects, least recently updated first.
+        """
+        return list(self.location_obj.get_contacts_updated_since(updated_since))
+
+    def get_opportunities_updated_since(self, updated_since=None, shards=None):
+        """
+        Returns the opportunities updated at or after `updated_since`. Not an
+        incremental fetch: the API can't filter or sort opportunities by update
+        date, so every page is downloaded (concurrently with `shards`) and
+        filtered client-side, as many calls as a full export.
+
+        Returns:
+            list: Opportunity objects.
+        """
+        return list(
+            self.location_obj.get_opportunities_updated_since(updated_since, shards=shards)
+        )
+
+    def iter_contact_pages(self, limit=100, prefetch=1, adaptive=False):
+        """
+        Fetches contacts page by page, without keeping earlier pages around.
+        Errors are raised, so an export is never silently truncated.
+
+        Args:
+            limit: Records per page.
+            prefetch: Pages downloaded ahead while the current one is processed.
+            adaptive: Let the page size follow latency and payload size, from `limit`.
+
+        Yields:
+            Page: each page of contacts.
+        """
+        cursor = self.location_obj.get_contacts(limit=limit).prefetch(prefetch)
+        if adaptive:
+            cursor.adaptive()
+        try:
+            yield from cursor.iter_pages()
+        finally:
+            cursor.close()
+
+    def iter_opportunity_pages(self, limit=100, prefetch=1, adaptive=False):
+        """
+        Fetches opportunities page by page, without keeping earlier pages around.
+        Errors are raised, so an export is never silently truncated.
+
+        Args:
+            limit: Records per page.
+            prefetch: Pages downloaded ahead while the current one is processed.
+            adaptive: Let the page size follow latency and payload size, from `limit`.
+
+        Yields:
+            Page: each page of opportunities.
+        """
+        cursor = self.location_obj.get_opportunities(limit=limit).prefetch(prefetch)
+        if adaptive:
+            cursor.adaptive()
+        try:
+            yield from cursor.iter_pages()
+        finally:
+            cursor.close()
+
 class UserDataExtractor:
     """
     Responsible for extracting specific data from user objects and returning them in a structured format.
@@ -454,8 +528,19 @@ class GoHighLevelService:
     """
     Main service that orchestrates the request, extraction, and formatting of data from GoHighLevel API.
     """
-    def __init__(self, token: str, id_location: str):
-        self.api = GoHighLevelAPI(token, id_location)
+    def __init__(self, token: str, id_location: str, client=None, watermarks=None):
+        """
+        Args:
+            token: Access token.
+            id_location: Location id.
+            client (optional): HighLevelClient to send calls with.
+            watermarks (optional): Store keeping the high-water marks of incremental
+                syncs, e.g. highlevel_sdk.checkpoint.SQLiteCheckpointStore.
+        """
+        self.api = GoHighLevelAPI(token, id_location, client=client)
+        self.id_location = id_location
+        self.watermarks = watermarks
+        self.pending_watermarks = {}
         self.user_list = []
         self.atributions_list = []
         self.custom_field_values_list = []
@@ -476,18 +561,19 @@ class GoHighLevelService:
           
         return pd.DataFrame()  # Returns empty DataFrame in case of error
       
-    def get_calendars_events_dataframe(self, date):
+    def get_calendars_events_dataframe(self, date, end_date=None):
         """
         Retrieves calendar events and converts them to a DataFrame.
 
         Args:
             date: Reference date for the query
+            end_date: End of the range ('YYYY-MM-DD', exclusive). Defaults to 7 days after `date`.
 
         Returns:
             pd.DataFrame: DataFrame containing calendar events.
         """
         try:
-            calendars = self.api.get_calendars_events(date, self.user_list)
+            calendars = self.api.get_calendars_events(date, self.user_list, end_date)
             if calendars:
                 extractor = CalendarDataExtractor(calendars)
                 extracted_data = extractor.extract()
@@ -604,6 +690,213 @@ class GoHighLevelService:
             log.error(f"Error fetching opportunities: {e}")
             return pd.DataFrame()
 
+    def sync_contacts_dataframe(self, commit=True):
+        """
+        Retrieves only the contacts updated since the last sync and converts
+        them to a DataFrame of upserts, to merge into the previous snapshot with
+        merge_upserts. Attributions and custom field values of those contacts
+        are stored like get_contacts_dataframe does. The first sync fetches
+        every contact.
+
+        Args:
+            commit: Advance the stored watermark to the newest `dateUpdated`
+                seen. With False, call commit_watermarks() once the upserts are merged.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the updated contacts.
+        """
+        key = self._watermark_key("contacts")
+        updated_since = self._load_watermark(key)
+        try:
+            contacts = self.api.get_contacts_updated_since(updated_since)
+            if not contacts:
+                return pd.DataFrame()
+            extractor = ContactsExtractor(contacts)
+            extracted_data, atributions_list, self.custom_field_values_list = extractor.extract()
+            self._set_atributions(atributions_list)
+            formatter = DataFrameFormatter(extracted_data)
+            dataframe = formatter.to_dataframe()
+            # only once the upserts exist, so a failed sync is retried next time
+            self._advance_watermark(key, contacts, "dateUpdated", commit)
+            return dataframe
+        except Exception as e:
+            log.error(f"Error syncing contacts: {e}")
+            return pd.DataFrame()
+
+    def sync_opportunities_dataframe(self, commit=True, shards=None):
+        """
+        Returns the opportunities updated since the last sync as a DataFrame
+        of upserts (see sync_contacts_dataframe). Unlike contacts this is not
+        incremental: the opportunities search has no update filter or sort, so
+        every opportunity is downloaded each time and the unchanged ones are
+        dropped here. It saves the processing and the merge, not the calls;
+        pass `shards` to scan concurrently.
+
+        Returns:
+            pd.DataFrame: DataFrame containing the updated opportunities.
+        """
+        key = self._watermark_key("opportunities")
+        updated_since = self._load_watermark(key)
+        try:
+            opportunities = self.api.get_opportunities_updated_since(updated_since, shards=shards)
+            if not opportunities:
+                return pd.DataFrame()
+            extractor = OpportunityExtractor(opportunities)
+            extracted_data, atributions_list = extractor.extract()
+            self._set_atributions(atributions_list)
+            formatter = DataFrameFormatter(extracted_data)
+            dataframe = formatter.to_dataframe()
+            # only once the upserts exist, so a failed sync is retried next time
+            self._advance_watermark(key, opportunities, "updatedAt", commit)
+            return dataframe
+        except Exception as e:
+            log.error(f"Error syncing opportunities: {e}")
+            return pd.DataFrame()
+
+    def commit_watermarks(self):
+        """
+        Saves the watermarks of syncs run with commit=False.
+        """
+        for key, watermark in self.pending_watermarks.items():
+            self.watermarks.save(key, watermark)
+        self.pending_watermarks = {}
+
+    @staticmethod
+    def merge_upserts(snapshot, upserts, key="id"):
+        """
+        Merges the upserts of a sync into a previous snapshot, the updated rows
+        replacing the old ones.
+
+        Returns:
+            pd.DataFrame: the new snapshot.
+        """
+        if snapshot is None or snapshot.empty:
+            return upserts.reset_index(drop=True)
+        if upserts.empty:
+            return snapshot
+        merged = pd.concat([snapshot, upserts], ignore_index=True)
+        return merged.drop_duplicates(subset=key, keep="last").reset_index(drop=True)
+
+    def _watermark_key(self, entity):
+        return f"{entity}:{self.id_location}"
+
+    def _load_watermark(self, key):
+        if self.watermarks is None:
+            raise HighLevelError("Incremental syncs need a watermarks store")
+        return self.pending_watermarks.get(key) or self.watermarks.load(key)
+
+    def _advance_watermark(self, key, records, field, commit):
+        newest = max(
+            (record.get(field) for record in records if record.get(field)),
+            key=timestamp_ms,
+            default=None,
+        )
+        previous = self._load_watermark(key)
+        if newest is None or (previous and timestamp_ms(previous) >= timestamp_ms(newest)):
+            return
+        if commit:
+            self.watermarks.save(key, newest)
+        else:
+            self.pending_watermarks[key] = newest
+
+    def iter_contacts_dataframes(self, pages_per_chunk=10, limit=100, prefetch=1):
+        """
+        Retrieves contacts in chunks of pages and converts each chunk to
+        DataFrames, so memory stays flat however many contacts the location has.
+        Unlike get_contacts_dataframe, nothing is stored on the service.
+
+        Args:
+            pages_per_chunk: Pages of `limit` contacts converted at a time.
+            limit: Records per page.
+            prefetch: Pages downloaded ahead while a chunk is processed.
+
+        Yields:
+            tuple: contacts, attributions and custom field values DataFrames.
+        """
+        for chunk in self._iter_chunks(self.api.iter_contact_pages(limit, prefetch), pages_per_chunk):
+            contacts, atributions, custom_field_values = ContactsExtractor(chunk).extract()
+            yield (
+                DataFrameFormatter(contacts).to_dataframe(),
+                DataFrameFormatter(atributions).to_dataframe(),
+                DataFrameFormatter(custom_field_values).to_dataframe(),
+            )
+
+    def iter_opportunities_dataframes(self, pages_per_chunk=10, limit=100, prefetch=1):
+        """
+        Retrieves opportunities in chunks of pages and converts each chunk to
+        DataFrames, so memory stays flat however many opportunities there are.
+
+        Args:
+            pages_per_chunk: Pages of `limit` opportunities converted at a time.
+            limit: Records per page.
+            prefetch: Pages downloaded ahead while a chunk is processed.
+
+        Yields:
+            tuple: opportunities and attributions DataFrames.
+        """
+        for chunk in self._iter_chunks(self.api.iter_opportunity_pages(limit, prefetch), pages_per_chunk):
+            opportunities, atributions = OpportunityExtractor(chunk).extract()
+            yield (
+                DataFrameFormatter(opportunities).to_dataframe(),
+                DataFrameFormatter(atributions).to_dataframe(),
+            )
+
+    def export_contacts_csv(self, directory, pages_per_chunk=10, limit=100, prefetch=1):
+        """
+        Exports all contacts to `contacts.csv`, `contact_attributions.csv` and
+        `contact_custom_field_values.csv` in `directory`, one chunk at a time.
+
+        Returns:
+            int: Number of contacts exported.
+        """
+        names = ("contacts.csv", "contact_attributions.csv", "contact_custom_field_values.csv")
+        frames = self.iter_contacts_dataframes(pages_per_chunk, limit, prefetch)
+        return self._export_csv(directory, names, frames)
+
+    def export_opportunities_csv(self, directory, pages_per_chunk=10, limit=100, prefetch=1):
+        """
+        Exports all opportunities to `opportunities.csv` and
+        `opportunity_attributions.csv` in `directory`, one chunk at a time.
+
+        Returns:
+            int: Number of opportunities exported.
+        """
+        names = ("opportunities.csv", "opportunity_attributions.csv")
+        frames = self.iter_opportunities_dataframes(pages_per_chunk, limit, prefetch)
+        return self._export_csv(directory, names, frames)
+
+    @staticmethod
+    def _iter_chunks(pages, pages_per_chunk):
+        chunk = []
+        count = 0
+        for page in pages:
+            chunk.extend(page.records)
+            count += 1
+            if count == pages_per_chunk:
+                yield chunk
+                chunk = []
+                count = 0
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _export_csv(directory, names, frames):
+        os.makedirs(directory, exist_ok=True)
+        paths = [os.path.join(directory, name) for name in names]
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+        written = set()
+        exported = 0
+        for chunk in frames:
+            exported += len(chunk[0])
+            for path, df in zip(paths, chunk):
+                if df.empty:
+                    continue
+                df.to_csv(path, mode="a", header=path not in written, index=False)
+                written.add(path)
+        return exported
+
     def get_attributions_dataframe(self):
         """
         Retrieves stored attributions and converts them to a DataFrame.
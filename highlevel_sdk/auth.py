@@ -0,0 +1,388 @@
+import asyncio
+import logging
+import threading
+import time
+
+import requests
+
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.exceptions import HighLevelError, HighLevelRequestException
+from highlevel_sdk.singleflight import SingleFlight
+
+logger = logging.getLogger("highlevel_sdk")
+
+
+def refresh_token(
+    refresh_token, user_type=None, base_url=None, session=None, timeout=None
+):
+    """
+    Exchanges a refresh token for a new access token.
+
+    Args:
+        refresh_token : The refresh token of an OAuth grant.
+        user_type (optional): "Location" or "Company", as returned with the grant.
+        base_url (optional): API root, defaults to HighLevelConfig.API_BASE_URL.
+        session (optional): requests.Session to send the call with.
+        timeout (optional): Seconds to wait for the token endpoint,
+            HighLevelConfig.REQUEST_TIMEOUT by default.
+
+    Returns:
+        dict: the new token data, with `expires_at` (epoch seconds) added.
+    """
+    if not refresh_token:
+        raise HighLevelError("Token data has no refresh_token")
+    data = {
+        "client_id": HighLevelConfig.CLIENT_ID,
+        "client_secret": HighLevelConfig.CLIENT_SECRET,
+        "grant_type": "refresh_token",
+        "refresh_token": refresh_token,
+    }
+    if user_type:
+        data["user_type"] = user_type
+    path = "/oauth/token"
+    url = (base_url or HighLevelConfig.API_BASE_URL).rstrip("/") + path
+    response = (session or requests).post(
+        url,
+        data=data,
+        headers={"Accept": "application/json"},
+        timeout=timeout or HighLevelConfig.REQUEST_TIMEOUT,
+    )
+    if response.status_code >= 400:
+        raise HighLevelRequestException(
+            "Token refresh failed",
+            {"method": "POST", "path": path},
+            response.status_code,
+            response.headers,
+            response.text,
+        )
+    return with_expiry(response.json())
+
+
+def with_expiry(token_data, now=None):
+    """
+    Returns token data with an absolute `expires_at` derived from `expires_in`.
+    """
+    if "expires_at" not in token_data and token_data.get("expires_in") is not None:
+        token_data = dict(token_data)
+        token_data["expires_at"] = (now or time.time()) + float(
+            token_data["expires_in"]
+        )
+    return token_data
+
+
+class TokenManager(object):
+    """
+    Keeps access tokens fresh for every object sharing a client.
+
+    Tokens are keyed by grant: their refresh token, or the access token when
+    there is none. All objects created from the same token data share one
+    dict, which the manager updates in place, so a refresh is seen by all of
+    them at once; copies of a token catch up with it, while other tokens, even
+    for the same location, are never touched. Tokens are refreshed
+    in the background once they are within `refresh_margin` of expiring and in
+    the foreground once expired; concurrent refreshes of a token run once.
+    """
+
+    def __init__(
+        self, refresh_margin=None, refresh_fn=None, base_url=None, timeout=None
+    ) -> None:
+        """
+        Args:
+            refresh_margin (optional): Seconds before expiry at which a background
+                refresh starts. Defaults to HighLevelConfig.TOKEN_REFRESH_MARGIN.
+            refresh_fn (optional): Callable receiving the current token data and
+                returning new token data. Defaults to the OAuth refresh_token grant.
+            base_url (optional): API root used by the default refresh.
+            timeout (optional): Seconds the default refresh waits for the token endpoint.
+        """
+        if refresh_margin is None:
+            refresh_margin = HighLevelConfig.TOKEN_REFRESH_MARGIN
+        self.refresh_margin = refresh_margin
+        self.refresh_fn = refresh_fn
+        self.base_url = base_url
+        self.timeout = timeout
+        self._tokens = {}
+        # access tokens replaced by a refresh, to their shared token data; only
+        # the last one of each token is kept
+        self._superseded = {}
+        self._predecessors = {}
+        # tokens acquired for a location or company id
+        self._acquired = {}
+        self._refreshers = {}
+        self._refreshing = set()
+        self._backoff_until = {}
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+
+    @staticmethod
+    def key_for(token_data):
+        """
+        Returns the key a token is shared under: its refresh token, or the
+        access token itself when it has none. Distinct tokens for one location
+        are tracked apart.
+        """
+        refresh = token_data.get("refresh_token")
+        if refresh:
+            return ("refresh", refresh)
+        return ("access", token_data.get("access_token"))
+
+    def track(self, token_data, refresh_fn=None):
+        """
+        Registers token data, optionally with its own refresh callable (e.g.
+        minting a new location token from the agency token).
+
+        Returns:
+            dict: the shared token data of the same token.
+        """
+        token_data.update(with_expiry(token_data))
+        canonical = self._canonical(token_data)
+        if refresh_fn is not None:
+            with self._lock:
+                self._refreshers[self.key_for(canonical)] = refresh_fn
+        return canonical
+
+    def _canonical(self, token_data):
+        key = self.key_for(token_data)
+        access_token = token_data.get("access_token")
+        with self._lock:
+            canonical = self._tokens.get(key)
+            if canonical is None:
+                canonical = self._superseded.get(access_token)
+            if canonical is None:
+                self._tokens[key] = token_data
+                return token_data
+            superseded = access_token in self._superseded
+        if (
+            canonical is not token_data
+            and canonical.get("access_token") != access_token
+        ):
+            if superseded or self._is_older(token_data, canonical):
+                # another copy of this token was refreshed, catch up
+                token_data.update(canonical)
+            else:
+                # a newer copy of the token (same refresh token) replaces the shared one
+                with self._lock:
+                    self._supersede(canonical.get("access_token"), canonical)
+                canonical.update(token_data)
+        return canonical
+
+    @staticmethod
+    def _is_older(token_data, canonical):
+        expires_at = token_data.get("expires_at")
+        return (
+            expires_at is not None
+            and canonical.get("expires_at") is not None
+            and expires_at <= canonical["expires_at"]
+        )
+
+    def _supersede(self, access_token, canonical):
+        # called with the lock held
+        key = self.key_for(canonical)
+        previous = self._predecessors.get(key)
+        if previous is not None and self._superseded.get(previous) is canonical:
+            del self._superseded[previous]
+        self._superseded[access_token] = canonical
+        self._predecessors[key] = access_token
+
+    def get(self, key):
+        """
+        Returns the token data acquired for a location or company id, or None
+        if it is unknown or about to expire.
+        """
+        with self._lock:
+            token_data = self._acquired.get(key)
+        if token_data is None:
+            return None
+        expires_at = token_data.get("expires_at")
+        if expires_at is not None and expires_at - time.time() <= self.refresh_margin:
+            return None
+        return token_data
+
+    def acquire(self, key, mint_fn):
+        """
+        Returns live token data for a location or company id, minting it with
+        `mint_fn()` if unknown or about to expire. Concurrent calls for one key
+        mint once, and the token is kept fresh with `mint_fn` from then on.
+        """
+        token_data = self.get(key)
+        if token_data is not None:
+            return token_data
+
+        def run():
+            token_data = self.get(key)
+            if token_data is not None:
+                return token_data
+            token_data = self.track(
+                with_expiry(mint_fn()), refresh_fn=lambda _: mint_fn()
+            )
+            with self._lock:
+                self._acquired[key] = token_data
+            return token_data
+
+        return self._flight.do(("mint", key), run)
+
+    async def acquire_async(self, key, mint_fn):
+        """
+        Same as acquire, for a coroutine function `mint_fn` of an async client.
+        Refreshes run the mint on the running loop from the refresh thread.
+        """
+        token_data = self.get(key)
+        if token_data is not None:
+            return token_data
+        loop = asyncio.get_running_loop()
+
+        def refresh_fn(_):
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                raise HighLevelError(
+                    "Tokens of an async client refresh off its event loop"
+                )
+            return asyncio.run_coroutine_threadsafe(mint_fn(), loop).result()
+
+        async def run():
+            token_data = self.get(key)
+            if token_data is not None:
+                return token_data
+            token_data = self.track(with_expiry(await mint_fn()), refresh_fn=refresh_fn)
+            with self._lock:
+                self._acquired[key] = token_data
+            return token_data
+
+        return await self._flight.do_async(("mint", key), run)
+
+    def can_refresh(self, token_data):
+        return bool(
+            self.refresh_fn
+            or token_data.get("refresh_token")
+            or self.key_for(token_data) in self._refreshers
+        )
+
+    def due(self, token_data):
+        """
+        Returns True if a token is expired or about to, and can be refreshed.
+        """
+        if not token_data:
+            return False
+        expires_at = token_data.get("expires_at")
+        if expires_at is None and token_data.get("expires_in") is not None:
+            return True
+        return (
+            expires_at is not None
+            and expires_at - time.time() <= self.refresh_margin
+            and self.can_refresh(token_data)
+        )
+
+    def prepare(self, token_data):
+        """
+        Called before each API call. Refreshes an expired token before
+        returning, and starts a background refresh of one about to expire.
+        """
+        if not token_data:
+            return
+        if "expires_at" not in token_data and "expires_in" in token_data:
+            token_data.update(with_expiry(token_data))
+        canonical = self._canonical(token_data)
+        expires_at = canonical.get("expires_at")
+        if expires_at is None or not self.can_refresh(canonical):
+            return
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            self.refresh(token_data, canonical.get("access_token"))
+        elif remaining <= self.refresh_margin:
+            self._refresh_in_background(canonical)
+
+    def on_unauthorized(self, token_data, access_token):
+        """
+        Called when a call made with `access_token` was answered with a 401.
+
+        Returns:
+            bool: True if the token was refreshed and the call can be replayed.
+        """
+        if not token_data or not self.can_refresh(self._canonical(token_data)):
+            return False
+        self.refresh(token_data, access_token)
+        return token_data.get("access_token") != access_token
+
+    def refresh(self, token_data, stale_access_token=None):
+        """
+        Refreshes a token, unless it was already refreshed since
+        `stale_access_token` was read. Concurrent calls share one refresh.
+
+        Returns:
+            dict: the token data, updated in place.
+        """
+        canonical = self._canonical(token_data)
+        if stale_access_token is None:
+            stale_access_token = canonical.get("access_token")
+        key = self.key_for(canonical)
+
+        def run():
+            if canonical.get("access_token") != stale_access_token:
+                return canonical
+            refresh_fn = self._refreshers.get(key) or self.refresh_fn
+            if refresh_fn is None:
+                fresh = refresh_token(
+                    canonical.get("refresh_token"),
+                    user_type=canonical.get("userType"),
+                    base_url=self.base_url,
+                    timeout=self.timeout,
+                )
+            else:
+                fresh = refresh_fn(canonical)
+            self._apply(canonical, with_expiry(fresh))
+            return canonical
+
+        self._flight.do(("refresh", key), run)
+        if token_data is not canonical:
+            token_data.update(canonical)
+        return token_data
+
+    def _apply(self, canonical, fresh):
+        old_key = self.key_for(canonical)
+        old_access_token = canonical.get("access_token")
+        if "expires_at" not in fresh:
+            canonical.pop("expires_at", None)
+            canonical.pop("expires_in", None)
+        canonical.update(fresh)
+        with self._lock:
+            new_key = self.key_for(canonical)
+            if new_key != old_key:
+                self._tokens.pop(old_key, None)
+                self._tokens[new_key] = canonical
+                if old_key in self._refreshers:
+                    self._refreshers[new_key] = self._refreshers.pop(old_key)
+                if old_key in self._predecessors:
+                    self._predecessors[new_key] = self._predecessors.pop(old_key)
+            if old_access_token != canonical.get("access_token"):
+                self._supersede(old_access_token, canonical)
+
+    def _refresh_in_background(self, canonical):
+        key = self.key_for(canonical)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            if time.monotonic() < self._backoff_until.get(key, 0):
+                return
+            self._refreshing.add(key)
+        access_token = canonical.get("access_token")
+
+        def run():
+            try:
+                self.refresh(canonical, access_token)
+            except Exception:
+                # the token is still valid, a later call tries again
+                logger.warning("Background token refresh failed", exc_info=True)
+                with self._lock:
+                    self._backoff_until[key] = (
+                        time.monotonic() + HighLevelConfig.TOKEN_REFRESH_BACKOFF
+                    )
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(
+            target=run, name="highlevel-token-refresh", daemon=True
+        ).start()
@@ -0,0 +1,316 @@
+import threading
+from collections import Counter
+from time import sleep
+
+from highlevel_sdk.client import TRANSPORT_ERRORS
+from highlevel_sdk.concurrency import imap_bounded
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.exceptions import HighLevelError, HighLevelRequestException
+from highlevel_sdk.models.models import Contact, Opportunity
+
+# record kinds a BulkWriter takes: object class and response key
+KINDS = {
+    "contacts": (Contact, "contact"),
+    "opportunities": (Opportunity, "opportunity"),
+}
+
+
+def write_key(kind, payload):
+    """
+    Returns the operation a payload maps to ("update", "upsert" or "create")
+    and the key identifying its record, for merging writes to the same record.
+    Creates have no key: they are never merged.
+    """
+    if payload.get("id"):
+        return "update", ("id", payload["id"])
+    if kind == "contacts":
+        if payload.get("email"):
+            return "upsert", ("email", payload["email"].strip().lower())
+        if payload.get("phone"):
+            return "upsert", ("phone", payload["phone"])
+    elif payload.get("pipelineId") and payload.get("contactId"):
+        return "upsert", ("pipeline", payload["pipelineId"], payload["contactId"])
+    return "create", None
+
+
+class WriteResult(object):
+    """
+    Outcome of one write: the merged payload sent, and the record the API
+    returned or the error it failed with.
+    """
+
+    def __init__(self, kind, operation, key, payload) -> None:
+        self.kind = kind
+        self.operation = operation
+        self.key = key
+        self.payload = dict(payload)
+        # input payloads merged into this write
+        self.merged = 1
+        self.attempts = 0
+        self.record = None
+        self.status = None
+        self.error = None
+
+    @property
+    def ok(self):
+        return self.attempts > 0 and self.error is None
+
+    @property
+    def id(self):
+        if self.record and self.record.get("id"):
+            return self.record["id"]
+        return self.payload.get("id")
+
+    def merge(self, payload):
+        # last write wins, field by field
+        self.payload.update(payload)
+        self.merged += 1
+
+    def __repr__(self):
+        outcome = "ok" if self.ok else f"failed {self.status or self.error!r}"
+        return f"<WriteResult {self.kind} {self.operation} {self.id} {outcome}>"
+
+
+class BulkWriter(object):
+    """
+    Writes contacts and opportunities in bulk: payloads with an `id` update
+    their record, contacts with an email or phone and opportunities with a
+    pipeline and contact are upserted, anything else is created.
+
+    Payloads are gathered in batches, where writes to the same record are
+    merged into one call (last write wins, field by field). A batch is sent
+    `concurrency` calls at a time through the client, under its rate limiter.
+    Each call is sent once by the client; a failed write is retried here, on
+    its own, when the client's RetryPolicy allows it (attempts and retry
+    budget), after a backoff honoring Retry-After. Creates are retried only
+    after a 429, as anything else may have created the record already. Every
+    write gets a WriteResult.
+
+    Use write() for a stream of payloads, or put() to queue writes that a
+    background thread sends in batches (write-behind), then close(). put()
+    blocks while `max_pending` writes are queued, until a batch is taken.
+    """
+
+    def __init__(
+        self,
+        location,
+        concurrency=None,
+        batch_size=None,
+        max_attempts=None,
+        flush_interval=None,
+        on_result=None,
+        max_pending=None,
+    ) -> None:
+        """
+        Args:
+            location : The Location written to, with a sync client.
+            concurrency (optional): Writes at once, HighLevelConfig.BULK_WRITE_WORKERS by default.
+            batch_size (optional): Merged writes per batch, HighLevelConfig.BULK_WRITE_BATCH_SIZE by default.
+            max_attempts (optional): Attempts per write, at most the client's
+                RetryPolicy.max_attempts (the default).
+            flush_interval (optional): Seconds a queued write may wait for a full
+                batch, HighLevelConfig.BULK_WRITE_FLUSH_INTERVAL by default.
+            on_result (optional): Called with each WriteResult of queued writes.
+                An error it raises is re-raised by the next put() or close().
+            max_pending (optional): Queued writes put() waits below, `batch_size`
+                times HighLevelConfig.BULK_WRITE_MAX_PENDING_BATCHES by default.
+        """
+        if location.api.is_async:
+            raise HighLevelError("BulkWriter needs a sync client")
+        self.location = location
+        self.api = location.api
+        self.concurrency = concurrency or HighLevelConfig.BULK_WRITE_WORKERS
+        self.batch_size = batch_size or HighLevelConfig.BULK_WRITE_BATCH_SIZE
+        self.max_attempts = max_attempts
+        self.flush_interval = (
+            flush_interval or HighLevelConfig.BULK_WRITE_FLUSH_INTERVAL
+        )
+        self.on_result = on_result
+        self.max_pending = max_pending or (
+            self.batch_size * HighLevelConfig.BULK_WRITE_MAX_PENDING_BATCHES
+        )
+        self.stats = Counter()
+        self.failures = []
+        self._pending = {}
+        self._lock = threading.Lock()
+        # notified when a batch is taken off the queue
+        self._room = threading.Condition(self._lock)
+        self._send_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._flusher = None
+        self._error = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, payloads, kind="contacts"):
+        """
+        Writes a stream of payloads, one batch at a time.
+
+        Args:
+            payloads : Iterable of record dicts.
+            kind (optional): "contacts" or "opportunities".
+
+        Yields:
+            WriteResult: one per merged write, batch by batch.
+        """
+        batch = {}
+        for payload in payloads:
+            self._merge(batch, kind, payload)
+            if len(batch) >= self.batch_size:
+                yield from self._send(batch)
+                batch = {}
+        if batch:
+            yield from self._send(batch)
+
+    def put(self, kind, payload):
+        """
+        Queues a write, merged with any queued write to the same record. It is
+        sent with the next batch, once `batch_size` writes are queued or
+        `flush_interval` seconds have passed. Blocks while `max_pending` writes
+        are queued, until the background thread takes a batch.
+        """
+        self._raise_error()
+        if self._closed.is_set():
+            raise HighLevelError("BulkWriter is closed")
+        with self._room:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run, name="highlevel-bulk-writer", daemon=True
+                )
+                self._flusher.start()
+            while len(self._pending) >= self.max_pending:
+                self._wake.set()
+                self._room.wait()
+                if self._closed.is_set():
+                    # close() may already have sent its last batch
+                    raise HighLevelError("BulkWriter is closed")
+            self._merge(self._pending, kind, payload)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """
+        Sends the queued writes now, and returns their WriteResults.
+        """
+        with self._send_lock:
+            with self._room:
+                batch, self._pending = self._pending, {}
+                self._room.notify_all()
+            results = list(self._send(batch))
+        if self.on_result is not None:
+            for result in results:
+                self.on_result(result)
+        return results
+
+    def close(self):
+        """
+        Stops the background thread and sends the writes still queued.
+        """
+        self._closed.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        self._raise_error()
+
+    def _run(self):
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._closed.is_set():
+                return
+            try:
+                self.flush()
+            except Exception as e:
+                # reported by the next put() or close(), later batches still go out
+                if self._error is None:
+                    self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _merge(self, batch, kind, payload):
+        if kind not in KINDS:
+            raise HighLevelError(f"BulkWriter can't write {kind}")
+        operation, key = write_key(kind, payload)
+        batch_key = (kind, key) if key is not None else (kind, object())
+        result = batch.get(batch_key)
+        if result is None:
+            batch[batch_key] = WriteResult(kind, operation, key, payload)
+        else:
+            result.merge(payload)
+
+    def _send(self, batch):
+        for result in imap_bounded(self._write, batch.values(), self.concurrency):
+            self.stats["ok" if result.ok else "failed"] += 1
+            self.stats["merged"] += result.merged - 1
+            if not result.ok:
+                self.failures.append(result)
+            yield result
+
+    def _call(self, result):
+        # sent once: retries are decided in _write, not stacked on the client's
+        target_class, response_key = KINDS[result.kind]
+        payload = result.payload
+        if result.operation == "update":
+            body = {k: v for k, v in payload.items() if k != "id"}
+            record = target_class(
+                token_data=self.location.get_token_data(),
+                id=payload["id"],
+                api=self.api,
+            ).api_update(body, idempotent=False)
+        elif result.kind == "contacts":
+            if result.operation == "upsert":
+                record = self.location.upsert_contact(payload, idempotent=False)
+            else:
+                record = self.location.create_contact(payload)
+        elif result.operation == "upsert":
+            record = self.location.upsert_opportunity(payload, idempotent=False)
+        else:
+            record = self.location.create_opportunity(payload)
+        data = record.export_all_data()
+        return data.get(response_key, data)
+
+    def _write(self, result):
+        delay = None
+        while True:
+            result.attempts += 1
+            headers = None
+            try:
+                result.record = self._call(result)
+                result.status, result.error = None, None
+                return result
+            except HighLevelRequestException as e:
+                result.status, result.error = e.http_status(), e
+                headers = e.http_headers()
+                retry = self._may_retry(result, result.status, headers=headers)
+            except TRANSPORT_ERRORS as e:
+                result.status, result.error = None, e
+                retry = self._may_retry(result, exception=e)
+            if not retry:
+                return result
+            delay = self.api.retry_policy.backoff(delay, headers)
+            sleep(delay)
+
+    def _may_retry(self, result, status_code=None, exception=None, headers=None):
+        if self.max_attempts and result.attempts >= self.max_attempts:
+            return False
+        if result.operation == "create" and status_code != 429:
+            return False
+        # counts against the client's attempts and retry budget
+        return self.api.retry_policy.should_retry(
+            "POST",
+            result.attempts,
+            status_code=status_code,
+            exception=exception,
+            idempotent=True,
+            headers=headers,
+        )
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from highlevel_sdk.config import HighLevelConfig
+
+# reference data that changes about once a day
+DEFAULT_TTLS = {
+    r"^/locations/[^/]+/customFields/?$": 3600,
+    r"^/locations/[^/]+/customValues/?$": 3600,
+    r"^/opportunities/pipelines/?$": 3600,
+    r"^/users/?$": 3600,
+    r"^/calendars/?$": 3600,
+}
+
+
+class CacheEntry(object):
+    """
+    A cached response: raw body, headers and status, plus its expiry.
+    """
+
+    def __init__(self, body, headers, status_code, expires_at) -> None:
+        self.body = body
+        self.headers = headers
+        self.status_code = status_code
+        self.expires_at = expires_at
+        self.size = len(body)
+
+    def is_expired(self, now=None):
+        return (now or time.time()) >= self.expires_at
+
+
+class MemoryCacheBackend(object):
+    """
+    In-process LRU store, bounded by entry count and total body bytes.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None) -> None:
+        self.max_entries = max_entries or HighLevelConfig.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or HighLevelConfig.CACHE_MAX_BYTES
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.is_expired():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def size(self):
+        return len(self._entries), self._bytes
+
+
+class DiskCacheBackend(object):
+    """
+    SQLite-backed LRU store, so several worker processes share warm entries.
+    """
+
+    def __init__(self, path, max_entries=None, max_bytes=None) -> None:
+        """
+        Args:
+            path : SQLite database file, created if missing.
+            max_entries (optional): Maximum number of entries kept.
+            max_bytes (optional): Maximum total body bytes kept.
+        """
+        self.path = path
+        self.max_entries = max_entries or HighLevelConfig.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or HighLevelConfig.CACHE_MAX_BYTES
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, body BLOB, headers TEXT, status_code INTEGER,"
+                " expires_at REAL, size INTEGER, accessed_at REAL)"
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT body, headers, status_code, expires_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        entry = CacheEntry(bytes(row[0]), json.loads(row[1]), row[2], row[3])
+        with conn:
+            if entry.is_expired():
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return entry
+
+    def set(self, key, entry):
+        if entry.size > self.max_bytes:
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.body,
+                    json.dumps(dict(entry.headers)),
+                    entry.status_code,
+                    entry.expires_at,
+                    entry.size,
+                    time.time(),
+                ),
+            )
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            self._evict(conn)
+
+    def _evict(self, conn):
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            count -= 1
+            total -= size
+
+    def clear(self):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM responses")
+
+    def size(self):
+        return (
+            self._connect()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+
+
+class ResponseCache(object):
+    """
+    Opt-in TTL cache for GET responses of slowly-changing reference endpoints.
+
+    Entries are keyed by method, path, normalized params and location. Only
+    paths matching one of the configured TTLs are cached.
+    """
+
+    def __init__(self, ttls=None, default_ttl=None, backend=None) -> None:
+        """
+        Args:
+            ttls (optional): Mapping of path regex to TTL in seconds. Defaults to DEFAULT_TTLS.
+            default_ttl (optional): TTL for GET paths not matching `ttls`. Not cached if None.
+            backend (optional): MemoryCacheBackend (default) or DiskCacheBackend.
+        """
+        ttls = DEFAULT_TTLS if ttls is None else ttls
+        self._ttls = [(re.compile(pattern), ttl) for pattern, ttl in ttls.items()]
+        self.default_ttl = default_ttl
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, method, path):
+        if method != "GET":
+            return None
+        for pattern, ttl in self._ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def key(method, path, params, token_data):
+        """
+        Returns the cache key of a call. The token itself is hashed so it never
+        lands on disk.
+        """
+        token_data = token_data or {}
+        location = token_data.get("locationId") or token_data.get("companyId")
+        if not location:
+            access_token = token_data.get("access_token") or ""
+            location = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+        params = json.dumps(params or {}, sort_keys=True, default=str)
+        return f"{method} {path} {params} {location}"
+
+    def get(self, method, path, params, token_data):
+        """
+        Returns the cached CacheEntry for a call, or None.
+        """
+        if self.ttl_for(method, path) is None:
+            return None
+        entry = self.backend.get(self.key(method, path, params, token_data))
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, method, path, params, token_data, body, headers, status_code):
+        ttl = self.ttl_for(method, path)
+        if ttl is None or status_code >= 400:
+            return
+        entry = CacheEntry(body, dict(headers), status_code, time.time() + ttl)
+        self.backend.set(self.key(method, path, params, token_data), entry)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        """
+        Returns:
+            dict: hits, misses, entries and bytes currently cached.
+        """
+        entries, size = self.backend.size()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": size,
+        }
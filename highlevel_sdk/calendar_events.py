@@ -0,0 +1,112 @@
+from highlevel_sdk.concurrency import aflatmap_unordered, iflatmap_unordered
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.exceptions import HighLevelError
+from highlevel_sdk.utils import timestamp_ms
+
+# params /calendars/events can be scoped by, one per query
+EVENT_SCOPES = ("calendarId", "groupId", "userId")
+
+
+def split_windows(start, end, window_ms):
+    """
+    Returns the [start, end) windows of at most `window_ms` covering a range
+    of epoch milliseconds.
+    """
+    return [
+        (window_start, min(window_start + window_ms, end))
+        for window_start in range(start, end, window_ms)
+    ]
+
+
+class CalendarEventScan(object):
+    """
+    Fetches the calendar events of a date range, for several calendars,
+    groups or users at once.
+
+    The range is cut into windows the API accepts and one query runs per scope
+    and window, up to `concurrency` at a time, under the client's rate limiter.
+    Events are handed out as their queries complete, not in date order, and
+    only once: an event found under several scopes (e.g. a round-robin
+    appointment listed under each user) or windows is skipped after the first.
+    Iterate with `for` (or `async for` with an async client).
+    """
+
+    def __init__(
+        self,
+        fetch,
+        start,
+        end,
+        scopes,
+        window_ms=None,
+        concurrency=None,
+        is_async=False,
+    ) -> None:
+        """
+        Args:
+            fetch : Callable (scope_param, scope_id, start_ms, end_ms) returning a
+                cursor over the events of one query.
+            start : Start of the range, epoch milliseconds or an ISO 8601 date.
+            end : End of the range (exclusive), epoch milliseconds or an ISO 8601 date.
+            scopes : (param, id) pairs to query, param being one of EVENT_SCOPES.
+                An iterable (an async one for async scans), read as the scan goes.
+            window_ms (optional): Longest range of a query, HighLevelConfig.CALENDAR_EVENT_WINDOW_MS by default.
+            concurrency (optional): Queries at once, HighLevelConfig.CALENDAR_EVENT_WORKERS by default.
+            is_async (optional): Whether fetch returns AsyncCursors.
+        """
+        self._fetch = fetch
+        self.start = timestamp_ms(start)
+        self.end = timestamp_ms(end)
+        if self.start is None or self.end is None or self.start >= self.end:
+            raise HighLevelError("Calendar events need a start before the end")
+        self.scopes = scopes
+        self.window_ms = window_ms or HighLevelConfig.CALENDAR_EVENT_WINDOW_MS
+        self.concurrency = concurrency or HighLevelConfig.CALENDAR_EVENT_WORKERS
+        self.is_async = is_async
+
+    def _queries(self, param, scope_id):
+        """
+        Returns the (scope_param, scope_id, start_ms, end_ms) queries of a scope.
+        """
+        if param not in EVENT_SCOPES:
+            raise HighLevelError(f"Calendar events can't be scoped by {param}")
+        return [
+            (param, scope_id, window_start, window_end)
+            for window_start, window_end in split_windows(
+                self.start, self.end, self.window_ms
+            )
+        ]
+
+    def _run(self, query):
+        return self._fetch(*query)
+
+    def __iter__(self):
+        if self.is_async:
+            raise TypeError(
+                "CalendarEventScan over an async client must be consumed with `async for`"
+            )
+        queries = (query for scope in self.scopes for query in self._queries(*scope))
+        seen = set()
+        for _, event in iflatmap_unordered(self._run, queries, self.concurrency):
+            event_id = event.get("id")
+            if event_id is not None:
+                if event_id in seen:
+                    continue
+                seen.add(event_id)
+            yield event
+
+    async def __aiter__(self):
+        async def queries():
+            async for scope in self.scopes:
+                for query in self._queries(*scope):
+                    yield query
+
+        seen = set()
+        async for _, event in aflatmap_unordered(
+            self._run, queries(), self.concurrency
+        ):
+            event_id = event.get("id")
+            if event_id is not None:
+                if event_id in seen:
+                    continue
+                seen.add(event_id)
+            yield event
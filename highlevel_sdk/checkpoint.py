@@ -0,0 +1,140 @@
+import base64
+import binascii
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from highlevel_sdk.exceptions import HighLevelError
+
+CHECKPOINT_VERSION = 1
+
+
+def encode_checkpoint(state):
+    """
+    Returns the opaque, URL-safe token of a cursor position.
+    """
+    data = dict(state, v=CHECKPOINT_VERSION)
+    raw = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode("ascii")
+
+
+def decode_checkpoint(token):
+    """
+    Returns the cursor position held by a token.
+
+    Raises:
+        HighLevelError: if the token is malformed or from another version.
+    """
+    try:
+        state = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except (AttributeError, binascii.Error, UnicodeError, ValueError):
+        raise HighLevelError("Invalid cursor checkpoint")
+    if not isinstance(state, dict) or state.get("v") != CHECKPOINT_VERSION:
+        raise HighLevelError("Unsupported cursor checkpoint version")
+    return state
+
+
+class FileCheckpointStore(object):
+    """
+    Checkpoint tokens by job key in a JSON file, replaced atomically on each
+    save so a crash never leaves it half written.
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Args:
+            path : JSON file, created on the first save.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path) as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, checkpoints):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as fp:
+                json.dump(checkpoints, fp)
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, key):
+        """
+        Returns the last token saved under `key`, or None.
+        """
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key, token):
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = token
+            self._write(checkpoints)
+
+    def clear(self, key):
+        with self._lock:
+            checkpoints = self._read()
+            if checkpoints.pop(key, None) is not None:
+                self._write(checkpoints)
+
+
+class SQLiteCheckpointStore(object):
+    """
+    Checkpoint tokens by job key in a SQLite database, for jobs that already
+    keep their state there or run as several processes.
+    """
+
+    def __init__(self, path) -> None:
+        """
+        Args:
+            path : SQLite database file, created if missing.
+        """
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                " key TEXT PRIMARY KEY, token TEXT, updated_at REAL)"
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, key):
+        row = (
+            self._connect()
+            .execute("SELECT token FROM checkpoints WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def save(self, key, token):
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+                (key, token, time.time()),
+            )
+
+    def clear(self, key):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM checkpoints WHERE key = ?", (key,))
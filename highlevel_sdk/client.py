@@ -1,83 +1,827 @@
-from copy import deepcopy
-import json
-from requests import get, post, put, delete
-from time import sleep
+import asyncio
+from collections import deque
+from copy import copy, deepcopy
+import gzip
+import hashlib
+import inspect
+import queue
+import threading
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.request import ACCEPT_ENCODING
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
+from time import perf_counter, sleep
 
+from highlevel_sdk.auth import TokenManager
 from highlevel_sdk.config import HighLevelConfig
-from highlevel_sdk.exceptions import HighLevelRequestException
+from highlevel_sdk.exceptions import HighLevelError, HighLevelRequestException
+from highlevel_sdk.rate_limit import RateLimiter
+from highlevel_sdk.retry import RetryPolicy
+from highlevel_sdk.cache import ResponseCache
+from highlevel_sdk.checkpoint import decode_checkpoint, encode_checkpoint
+from highlevel_sdk.singleflight import SingleFlight
+from highlevel_sdk.serialization import dumps, loads
+from highlevel_sdk.streaming import iter_records
+from highlevel_sdk.instrumentation import Hooks, template_path
+from highlevel_sdk.page_size import AdaptivePageSize
+from highlevel_sdk.utils import (
+    META_PAGINATION,
+    PAGINATION_STRATEGIES,
+    apply_pagination,
+    page_meta,
+)
 
+# transport errors worth retrying; anything else is a bug on our side
+TRANSPORT_ERRORS = (ConnectionError, Timeout, ChunkedEncodingError)
 
-class HighLevelClient(object):
+
+class BaseHighLevelClient(object):
     """
-    Encapsulates session attributes and methods to make API calls.
+    State and helpers shared by the sync and async clients.
     """
 
-    def __init__(self) -> None:
-        pass
+    is_async = False
+
+    def __init__(
+        self,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        coalesce=True,
+        compress_requests=False,
+        base_url=None,
+        token_manager=None,
+        timeout=None,
+    ) -> None:
+        """
+        Args:
+            rate_limiter (optional): RateLimiter pacing calls per location/token.
+                Defaults to one sized from HighLevelConfig; pass False to disable pacing.
+            retry_policy (optional): RetryPolicy deciding which failed calls are retried.
+                Defaults to one with its own retry budget for this client.
+            cache (optional): ResponseCache for GETs of slowly-changing endpoints.
+                Disabled by default.
+            coalesce (optional): Share one network call between concurrent identical
+                GETs. Each waiter gets its own HighLevelResponse over the same bytes.
+            compress_requests (optional): gzip POST/PUT bodies larger than
+                HighLevelConfig.REQUEST_COMPRESSION_MIN_BYTES, for bulk writes.
+            base_url (optional): API root, defaults to HighLevelConfig.API_BASE_URL.
+                Point it at highlevel_sdk.testing.FakeHighLevelServer for offline runs.
+            token_manager (optional): TokenManager refreshing tokens ahead of expiry
+                and on 401s. Defaults to one for this client; pass False to disable.
+            timeout (optional): Seconds to wait for a connection or for data before a
+                call fails, HighLevelConfig.REQUEST_TIMEOUT by default.
+        """
+        self.base_url = (base_url or HighLevelConfig.API_BASE_URL).rstrip("/")
+        self._headers = {}
+        self._headers_lock = threading.Lock()
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+        self.rate_limiter = rate_limiter or None
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.cache = cache
+        self.single_flight = (
+            SingleFlight(share=HighLevelResponse.copy) if coalesce else None
+        )
+        self.compress_requests = compress_requests
+        self.timeout = timeout or HighLevelConfig.REQUEST_TIMEOUT
+        if token_manager is None:
+            token_manager = TokenManager(base_url=self.base_url, timeout=self.timeout)
+        self.token_manager = token_manager or None
+        self.hooks = Hooks()
+
+    def _emit_request(self, method, endpoint, attempt, token_data):
+        self.hooks.emit(
+            "on_request",
+            {
+                "method": method,
+                "path": template_path(endpoint),
+                "attempt": attempt,
+                "rate_limit_key": RateLimiter.key_for(token_data),
+            },
+        )
+
+    def _emit_retry(self, method, endpoint, attempt, delay, status=None, error=None):
+        self.hooks.emit(
+            "on_retry",
+            {
+                "method": method,
+                "path": template_path(endpoint),
+                "attempt": attempt,
+                "status": status,
+                "error": error,
+                "delay": delay,
+            },
+        )
+
+    def _emit_response(
+        self,
+        method,
+        endpoint,
+        token_data,
+        status,
+        response_headers,
+        elapsed=0.0,
+        ttfb=None,
+        download=None,
+        request_bytes=0,
+        response_bytes=None,
+        retries=0,
+        cached=False,
+    ):
+        wire_bytes = (
+            response_headers.get("Content-Length") if response_headers else None
+        )
+        self.hooks.emit(
+            "on_response",
+            {
+                "method": method,
+                "path": template_path(endpoint),
+                "status": status,
+                "elapsed": elapsed,
+                # connection setup is not exposed by the HTTP libraries, it is
+                # included in ttfb
+                "connect": None,
+                "ttfb": ttfb,
+                "download": download,
+                "request_bytes": request_bytes,
+                "response_bytes": response_bytes,
+                "wire_bytes": int(wire_bytes) if wire_bytes else None,
+                "retries": retries,
+                "rate_limit": {
+                    name: response_headers[name]
+                    for name in RateLimiter.HEADERS
+                    if response_headers and name in response_headers
+                },
+                "rate_limit_key": RateLimiter.key_for(token_data),
+                "cached": cached,
+            },
+        )
+
+    def _encode_body(self, data, headers):
+        """
+        Serializes a request payload compactly, gzipping large ones when enabled.
+
+        Returns:
+            tuple: the body bytes and the headers to send with them.
+        """
+        body = dumps(data)
+        if (
+            self.compress_requests
+            and len(body) >= HighLevelConfig.REQUEST_COMPRESSION_MIN_BYTES
+        ):
+            body = gzip.compress(body, compresslevel=6, mtime=0)
+            headers = dict(headers, **{"Content-Encoding": "gzip"})
+        return body, headers
+
+    def _flight_key(self, method, endpoint, token_data, data):
+        if self.single_flight is None or method != "GET":
+            return None
+        # the cache key is per location; only calls made with the same token
+        # may share an answer, as another token's can be a 401 or 403
+        access_token = (token_data or {}).get("access_token") or ""
+        digest = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+        return ResponseCache.key(method, endpoint, data, token_data), digest
+
+    def _cached_response(self, method, endpoint, token_data, data):
+        if self.cache is None:
+            return None
+        entry = self.cache.get(method, endpoint, data, token_data)
+        if entry is None:
+            return None
+        if self.hooks.on_response:
+            self._emit_response(
+                method,
+                endpoint,
+                token_data,
+                entry.status_code,
+                entry.headers,
+                response_bytes=entry.size,
+                cached=True,
+            )
+        return self._build_response(
+            method,
+            self.base_url + endpoint,
+            data,
+            None,
+            token_data,
+            body=entry.body,
+            response_headers=CaseInsensitiveDict(entry.headers),
+            status_code=entry.status_code,
+        )
+
+    def _store_response(self, method, endpoint, token_data, data, content, response):
+        if self.cache is None:
+            return
+        status_code = getattr(response, "status_code", None) or response.status
+        self.cache.set(
+            method, endpoint, data, token_data, content, response.headers, status_code
+        )
+
+    def _acquire(self, token_data):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(RateLimiter.key_for(token_data))
+
+    async def _acquire_async(self, token_data):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(RateLimiter.key_for(token_data))
+
+    def _release(self, token_data):
+        if self.rate_limiter is not None:
+            self.rate_limiter.release(RateLimiter.key_for(token_data))
+
+    def _observe(self, token_data, response_headers, status_code):
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(
+                RateLimiter.key_for(token_data), response_headers, status_code
+            )
+
+    def _refresh_unauthorized(self, token_data, access_token):
+        return self.token_manager is not None and self.token_manager.on_unauthorized(
+            token_data, access_token
+        )
+
+    def rate_limit_budget(self, token_data):
+        """
+        Returns the remaining rate-limit budget for a token, see RateLimiter.budget.
+        """
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.budget(RateLimiter.key_for(token_data))
 
-    def build_headers(access_token=None):
+    def build_headers(self, access_token=None):
+        """
+        Returns the request headers for a token. Headers are built once per
+        token and reused, so callers must not mutate the returned dict.
+        """
         assert access_token != None, "Must provide access token"
+        headers = self._headers.get(access_token)
+        if headers is not None:
+            return headers
+
         headers = {
             "Content-Type": "application/json",
             "version": HighLevelConfig.VERSION,
         }
         if access_token:
             headers["Authorization"] = f"Bearer {access_token}"
+
+        with self._headers_lock:
+            # tokens rotate, don't let stale ones pile up forever
+            if len(self._headers) >= HighLevelConfig.MAX_CACHED_HEADERS:
+                self._headers.clear()
+            self._headers[access_token] = headers
         return headers
 
+    def _build_response(
+        self,
+        method,
+        path,
+        data,
+        headers,
+        token_data,
+        body,
+        response_headers,
+        status_code,
+        encoding=None,
+    ):
+        highlevel_response = HighLevelResponse(
+            body=body,
+            headers=response_headers,
+            status_code=status_code,
+            call={"method": method, "path": path, "params": data, "headers": headers},
+            encoding=encoding,
+        )
+
+        # push token_data to response
+        highlevel_response.token_data = token_data
+
+        if highlevel_response.is_error():
+            raise highlevel_response.error()
+
+        return highlevel_response
+
+
+class HighLevelClient(BaseHighLevelClient):
+    """
+    Encapsulates session attributes and methods to make API calls.
+
+    Each client owns a pooled, keep-alive ``requests.Session`` so consecutive
+    calls (e.g. every page of a Cursor) reuse the same TCP/TLS connections.
+    Objects, requests and cursors all route their calls through the client
+    instance they were created with.
+    """
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        pool_connections=None,
+        pool_maxsize=None,
+        session=None,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        coalesce=True,
+        compress_requests=False,
+        base_url=None,
+        token_manager=None,
+        timeout=None,
+    ) -> None:
+        """
+        Args:
+            pool_connections (optional): Number of host pools to cache.
+            pool_maxsize (optional): Maximum number of connections kept alive per host.
+                Should be at least the number of threads sharing the client.
+            session (optional): A pre-configured requests.Session to use as is; the
+                pool sizes and Accept-Encoding only apply to the client's own session.
+            rate_limiter (optional): RateLimiter pacing calls, False to disable.
+            retry_policy (optional): RetryPolicy for failed calls.
+            cache (optional): ResponseCache for slowly-changing endpoints.
+            coalesce (optional): Coalesce concurrent identical GETs, True by default.
+            compress_requests (optional): gzip large POST/PUT bodies.
+            base_url (optional): API root, defaults to HighLevelConfig.API_BASE_URL.
+            token_manager (optional): TokenManager, False to disable token refreshes.
+            timeout (optional): Seconds to wait for a connection or for data.
+        """
+        super().__init__(
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce=coalesce,
+            compress_requests=compress_requests,
+            base_url=base_url,
+            token_manager=token_manager,
+            timeout=timeout,
+        )
+        if pool_connections is None:
+            pool_connections = HighLevelConfig.POOL_CONNECTIONS
+        if pool_maxsize is None:
+            pool_maxsize = HighLevelConfig.POOL_MAXSIZE
+
+        # a caller's session keeps its adapters (retries, proxies, pinning) and headers
+        if session is None:
+            session = Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections, pool_maxsize=pool_maxsize
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            # requests already asks for gzip/deflate; this adds br/zstd when their
+            # decoders are installed. Bodies are decompressed as they are read
+            session.headers["Accept-Encoding"] = (
+                HighLevelConfig.ACCEPT_ENCODING or ACCEPT_ENCODING
+            )
+        self._session = session
+
     @classmethod
-    def _call(cls, method, path, token_data=None, data=None):
-        path = HighLevelConfig.API_BASE_URL + path
+    def default(cls):
+        """
+        Returns the process-wide client used by objects created without one.
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    def mount(self, adapter, prefix=None):
+        """
+        Routes calls to `prefix` (the API root by default) through a requests
+        transport adapter, e.g. highlevel_sdk.testing.RecordingAdapter.
+        """
+        self._session.mount(prefix or self.base_url, adapter)
+        return adapter
+
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _call(
+        self, method, path, token_data=None, data=None, idempotent=None, stream=False
+    ):
+        """
+        Makes an API call.
+
+        With stream=True the body is not read up front: the returned response
+        exposes the open connection as `raw`, for incremental parsing. Streamed
+        calls bypass the response cache and request coalescing.
+        """
+        if stream:
+            return self._send(method, path, token_data, data, idempotent, stream)
+        key = self._flight_key(method, path, token_data, data)
+        if key is not None:
+            return self.single_flight.do(
+                key, lambda: self._send(method, path, token_data, data, idempotent)
+            )
+        return self._send(method, path, token_data, data, idempotent)
+
+    def _send(self, method, path, token_data, data, idempotent, stream=False):
+        if not stream:
+            cached = self._cached_response(method, path, token_data, data)
+            if cached is not None:
+                return cached
+
+        if self.token_manager is not None:
+            self.token_manager.prepare(token_data)
+        endpoint = path
+        path = self.base_url + path
         access_token = token_data["access_token"]
-        headers = cls.build_headers(access_token=access_token)
+        headers = self.build_headers(access_token=access_token)
+        request_bytes = 0
+        if method in ("GET", "DELETE"):
+            kwargs = {"params": data}
+        else:
+            body, headers = self._encode_body(data, headers)
+            kwargs = {"data": body}
+            request_bytes = len(body)
 
-        # Try up to 3 times to make the request
-        RETRY_DELAY = 3
-        for i in range(3):
+        self.retry_policy.record_call()
+        attempt = 0
+        delay = None
+        replayed = False
+        started = perf_counter()
+        while True:
+            attempt += 1
+            self._acquire(token_data)
             try:
-                if method == "GET":
-                    response = get(path, headers=headers, params=data)
-                elif method == "DELETE":
-                    response = delete(path, headers=headers, params=data)
-                elif method == "POST":
-                    response = post(path, headers=headers, data=json.dumps(data))
-                elif method == "PUT":
-                    response = put(path, headers=headers, data=json.dumps(data))
-
-                break
-            except Exception as e:
-                if i == 2:
-                    raise e
-                sleep(RETRY_DELAY)
-                RETRY_DELAY *= 2
+                if self.hooks.on_request:
+                    self._emit_request(method, endpoint, attempt, token_data)
+                sent = perf_counter()
+                response = self._session.request(
+                    method,
+                    path,
+                    headers=headers,
+                    stream=stream,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+            except BaseException as e:
+                # no response will free the rate-limit slot, whatever went wrong
+                self._release(token_data)
+                retryable = isinstance(
+                    e, TRANSPORT_ERRORS
+                ) and self.retry_policy.should_retry(
+                    method, attempt, exception=e, idempotent=idempotent
+                )
+                if not retryable:
+                    raise
+                delay = self.retry_policy.backoff(delay)
+                if self.hooks.on_retry:
+                    self._emit_retry(method, endpoint, attempt, delay, error=repr(e))
+                sleep(delay)
                 continue
 
-        highlevel_response = HighLevelResponse(
-            body=response.text,
-            headers=response.headers,
+            self._observe(token_data, response.headers, response.status_code)
+            if (
+                response.status_code == 401
+                and not replayed
+                and self._refresh_unauthorized(token_data, access_token)
+            ):
+                # replay once with the refreshed token
+                response.close()
+                replayed = True
+                access_token = token_data["access_token"]
+                headers = dict(headers, Authorization=f"Bearer {access_token}")
+                if self.hooks.on_retry:
+                    self._emit_retry(method, endpoint, attempt, 0.0, status=401)
+                continue
+            if self.retry_policy.should_retry(
+                method,
+                attempt,
+                status_code=response.status_code,
+                idempotent=idempotent,
+                headers=response.headers,
+            ):
+                response.close()
+                delay = self.retry_policy.backoff(delay, response.headers)
+                if self.hooks.on_retry:
+                    self._emit_retry(
+                        method, endpoint, attempt, delay, status=response.status_code
+                    )
+                sleep(delay)
+                continue
+            break
+
+        if self.hooks.on_response:
+            finished = perf_counter()
+            ttfb = response.elapsed.total_seconds()
+            self._emit_response(
+                method,
+                endpoint,
+                token_data,
+                response.status_code,
+                response.headers,
+                elapsed=finished - started,
+                ttfb=ttfb,
+                # a streamed body is downloaded while the caller parses it
+                download=None if stream else max(0.0, finished - sent - ttfb),
+                request_bytes=request_bytes,
+                response_bytes=None if stream else len(response.content),
+                retries=attempt - 1,
+            )
+
+        if stream and response.status_code < 400:
+            # hand the still-unread, transparently decompressed body to the caller
+            response.raw.decode_content = True
+            highlevel_response = self._build_response(
+                method,
+                path,
+                data,
+                headers,
+                token_data,
+                body=None,
+                response_headers=response.headers,
+                status_code=response.status_code,
+                encoding=response.encoding,
+            )
+            highlevel_response.raw = response.raw
+            highlevel_response.elapsed = perf_counter() - sent
+            highlevel_response.retries = attempt - 1
+            return highlevel_response
+
+        self._store_response(
+            method, endpoint, token_data, data, response.content, response
+        )
+        highlevel_response = self._build_response(
+            method,
+            path,
+            data,
+            headers,
+            token_data,
+            body=response.content,
+            response_headers=response.headers,
             status_code=response.status_code,
-            call={"method": method, "path": path, "params": data, "headers": headers},
+            encoding=response.encoding,
         )
+        highlevel_response.elapsed = perf_counter() - sent
+        highlevel_response.retries = attempt - 1
+        return highlevel_response
 
-        # push token_data to response
-        highlevel_response.token_data = token_data
 
-        if highlevel_response.is_error():
-            raise highlevel_response.error()
+class AsyncHighLevelClient(BaseHighLevelClient):
+    """
+    asyncio counterpart of HighLevelClient, backed by a pooled aiohttp session.
+
+    Objects bound to an async client keep the same methods: calls that return
+    a single object return an awaitable, and paginated calls return an
+    AsyncCursor to be consumed with ``async for``.
+
+    Requires the optional ``aiohttp`` dependency.
+    """
+
+    is_async = True
+
+    def __init__(
+        self,
+        pool_maxsize=None,
+        session=None,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        coalesce=True,
+        compress_requests=False,
+        base_url=None,
+        token_manager=None,
+        timeout=None,
+    ) -> None:
+        """
+        Args:
+            pool_maxsize (optional): Maximum number of concurrent connections.
+            session (optional): A pre-configured aiohttp.ClientSession to use.
+            rate_limiter (optional): RateLimiter pacing calls, False to disable.
+            retry_policy (optional): RetryPolicy for failed calls.
+            cache (optional): ResponseCache for slowly-changing endpoints.
+            coalesce (optional): Coalesce concurrent identical GETs, True by default.
+            compress_requests (optional): gzip large POST/PUT bodies.
+            base_url (optional): API root, defaults to HighLevelConfig.API_BASE_URL.
+            token_manager (optional): TokenManager, False to disable token refreshes.
+            timeout (optional): Seconds to wait for a connection or for data.
+        """
+        super().__init__(
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce=coalesce,
+            compress_requests=compress_requests,
+            base_url=base_url,
+            token_manager=token_manager,
+            timeout=timeout,
+        )
+        if pool_maxsize is None:
+            pool_maxsize = HighLevelConfig.POOL_MAXSIZE
+        self._pool_maxsize = pool_maxsize
+        self._session = session
+
+    def _get_session(self):
+        # aiohttp sessions must be created inside the running loop
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError:
+                raise HighLevelError(
+                    "AsyncHighLevelClient requires aiohttp. Install it with `pip install aiohttp`."
+                )
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_maxsize),
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=self.timeout, sock_read=self.timeout
+                ),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _encode_params(self, data):
+        # aiohttp only accepts str/int/float query values, requests-style
+        # encoding drops None and repeats keys for lists
+        if not data:
+            return None
+        params = []
+        for key, value in data.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if item is None:
+                    continue
+                if isinstance(item, bool):
+                    item = "true" if item else "false"
+                params.append((key, str(item)))
+        return params
+
+    async def _call(self, method, path, token_data=None, data=None, idempotent=None):
+        key = self._flight_key(method, path, token_data, data)
+        if key is not None:
+            return await self.single_flight.do_async(
+                key, lambda: self._send(method, path, token_data, data, idempotent)
+            )
+        return await self._send(method, path, token_data, data, idempotent)
+
+    async def _send(self, method, path, token_data, data, idempotent):
+        import aiohttp
+
+        cached = self._cached_response(method, path, token_data, data)
+        if cached is not None:
+            return cached
+
+        if self.token_manager is not None and self.token_manager.due(token_data):
+            # a refresh blocks on the network, keep it off the event loop
+            await asyncio.to_thread(self.token_manager.prepare, token_data)
+        endpoint = path
+        path = self.base_url + path
+        access_token = token_data["access_token"]
+        headers = self.build_headers(access_token=access_token)
+        session = self._get_session()
+        request_bytes = 0
+        if method in ("GET", "DELETE"):
+            kwargs = {"params": self._encode_params(data)}
+        else:
+            body, headers = self._encode_body(data, headers)
+            kwargs = {"data": body}
+            request_bytes = len(body)
+
+        self.retry_policy.record_call()
+        attempt = 0
+        delay = None
+        replayed = False
+        started = perf_counter()
+        while True:
+            attempt += 1
+            await self._acquire_async(token_data)
+            try:
+                if self.hooks.on_request:
+                    self._emit_request(method, endpoint, attempt, token_data)
+                sent = perf_counter()
+                async with session.request(
+                    method, path, headers=headers, **kwargs
+                ) as response:
+                    first_byte = perf_counter()
+                    content = await response.read()
+            except BaseException as e:
+                # no response will free the rate-limit slot, cancellation included
+                self._release(token_data)
+                retryable = isinstance(
+                    e, (aiohttp.ClientError, asyncio.TimeoutError)
+                ) and self.retry_policy.should_retry(
+                    method, attempt, exception=e, idempotent=idempotent
+                )
+                if not retryable:
+                    raise
+                delay = self.retry_policy.backoff(delay)
+                if self.hooks.on_retry:
+                    self._emit_retry(method, endpoint, attempt, delay, error=repr(e))
+                await asyncio.sleep(delay)
+                continue
 
+            self._observe(token_data, response.headers, response.status)
+            if (
+                response.status == 401
+                and not replayed
+                and await asyncio.to_thread(
+                    self._refresh_unauthorized, token_data, access_token
+                )
+            ):
+                replayed = True
+                access_token = token_data["access_token"]
+                headers = dict(headers, Authorization=f"Bearer {access_token}")
+                if self.hooks.on_retry:
+                    self._emit_retry(method, endpoint, attempt, 0.0, status=401)
+                continue
+            if self.retry_policy.should_retry(
+                method,
+                attempt,
+                status_code=response.status,
+                idempotent=idempotent,
+                headers=response.headers,
+            ):
+                delay = self.retry_policy.backoff(delay, response.headers)
+                if self.hooks.on_retry:
+                    self._emit_retry(
+                        method, endpoint, attempt, delay, status=response.status
+                    )
+                await asyncio.sleep(delay)
+                continue
+            break
+
+        if self.hooks.on_response:
+            finished = perf_counter()
+            self._emit_response(
+                method,
+                endpoint,
+                token_data,
+                response.status,
+                response.headers,
+                elapsed=finished - started,
+                ttfb=first_byte - sent,
+                download=finished - first_byte,
+                request_bytes=request_bytes,
+                response_bytes=len(content),
+                retries=attempt - 1,
+            )
+
+        self._store_response(method, endpoint, token_data, data, content, response)
+        highlevel_response = self._build_response(
+            method,
+            path,
+            data,
+            headers,
+            token_data,
+            body=content,
+            response_headers=response.headers,
+            status_code=response.status,
+            encoding=response.charset,
+        )
+        highlevel_response.elapsed = perf_counter() - sent
+        highlevel_response.retries = attempt - 1
         return highlevel_response
 
 
 class HighLevelResponse(object):
     """
     Encapsulates response attributes and methods.
+
+    The body is kept as the raw bytes received. It is decoded to JSON once, on
+    the first call to json(), and to text only when text() is called.
     """
 
-    def __init__(self, body, headers, status_code, call) -> None:
+    def __init__(self, body, headers, status_code, call, encoding=None) -> None:
         self.body = body
         self.headers = headers
         self.status_code = status_code
         self.call = call
+        # the API sends JSON, which is UTF-8 unless the server says otherwise
+        self.encoding = encoding or "utf-8"
+        # open body stream of a streamed call, see HighLevelClient._call
+        self.raw = None
+        # seconds the last attempt took on the wire (None if served from cache),
+        # and the attempts retried before it
+        self.elapsed = None
+        self.retries = 0
+        self._json = None
+        self._text = None
+
+    def content(self):
+        """
+        Returns the raw body bytes, reading a streamed body to the end if needed.
+        """
+        if self.body is None and self.raw is not None:
+            self.body = self.raw.read()
+        return self.body
 
     def is_error(self):
         return self.status_code >= 400
@@ -89,19 +833,40 @@ class HighLevelResponse(object):
                 request_context=self.call,
                 http_headers=self.headers,
                 http_status=self.status_code,
-                body=self.body,
+                body=self.text(),
             )
         else:
             return None
 
+    def copy(self):
+        """
+        Returns a response over the same body bytes, decoded on its own, so
+        callers sharing a coalesced call don't see each other's changes.
+        """
+        response = copy(self)
+        response._json = None
+        return response
+
     def json(self):
-        return json.loads(self.body)
+        """
+        Returns the decoded body. It is parsed once and shared by every user of
+        this response object, so callers must not mutate it.
+        """
+        if self._json is None:
+            self._json = loads(self.content())
+        return self._json
 
     def text(self):
-        return self.body
+        if self._text is None:
+            body = self.content()
+            if isinstance(body, str):
+                self._text = body
+            else:
+                self._text = body.decode(self.encoding, errors="replace")
+        return self._text
 
     def __repr__(self):
-        return f"<HighLevelResponse {self.status_code} {self.body}>"
+        return f"<HighLevelResponse {self.status_code} {self.text()}>"
 
 
 class HighLevelRequest(object):
@@ -120,6 +885,11 @@ class HighLevelRequest(object):
         target_class=None,
         response_parser=None,
         custom_pagination_fn=None,
+        stream=False,
+        prefetch=0,
+        paginated=None,
+        pagination=None,
+        idempotent=None,
     ) -> None:
         """
         Args:
@@ -131,6 +901,13 @@ class HighLevelRequest(object):
             target_class (optional): The class to use for the request.
             response_parser (optional): The parser to use for the response.
             custom_pagination_fn (optional): Custom pagination function to use for the cursor.
+            stream (optional): Parse the cursor pages incrementally, see Cursor.
+            prefetch (optional): Pages the cursor downloads ahead, see Cursor.prefetch.
+            paginated (optional): Whether EDGE calls return a cursor. Defaults to
+                True for GETs; set it for POST searches paginated in the body.
+            pagination (optional): PaginationStrategy of the endpoint, see Cursor.
+            idempotent (optional): Whether the call may be retried, e.g. for
+                upserts sent as POST. Defaults to the method-based check.
 
         """
         self._method = method
@@ -147,6 +924,11 @@ class HighLevelRequest(object):
         self._target_class = target_class
         self._response_parser = response_parser
         self._custom_pagination_fn = custom_pagination_fn
+        self._stream = stream
+        self._prefetch = prefetch
+        self._paginated = method == "GET" if paginated is None else paginated
+        self._pagination = pagination
+        self._idempotent = idempotent
 
     def add_param(self, key, value):
         self._params[key] = self._extract_value(value)
@@ -173,9 +955,18 @@ class HighLevelRequest(object):
             return value
 
     def execute(self):
+        """
+        Executes the request.
+
+        With a sync client, paginated calls return a Cursor with its first page
+        loaded and everything else returns the parsed object (or the raw
+        response). With an async client, paginated calls return an AsyncCursor
+        and everything else returns an awaitable.
+        """
         params = deepcopy(self._params)
-        if self._api_type == "EDGE" and self._method == "GET":
-            cursor = Cursor(
+        if self._api_type == "EDGE" and self._paginated:
+            cursor_class = AsyncCursor if self._api.is_async else Cursor
+            cursor = cursor_class(
                 target_objects_class=self._target_class,
                 params=params,
                 endpoint=self._endpoint,
@@ -183,21 +974,42 @@ class HighLevelRequest(object):
                 api=self._api,
                 object_parser=self._response_parser,
                 custom_pagination_fn=self._custom_pagination_fn,
+                stream=self._stream,
+                prefetch=self._prefetch,
+                method=self._method,
+                pagination=self._pagination,
             )
-            cursor.load_next_page()
+            if not self._api.is_async:
+                # async cursors load their first page on first iteration
+                cursor.load_next_page()
             return cursor
+        if self._api.is_async:
+            return self._execute_async(params)
         response = self._api._call(
             method=self._method,
             path=self._path,
             data=params,
             token_data=self.token_data,
+            idempotent=self._idempotent,
         )
+        return self._parse_response(response)
 
+    async def _execute_async(self, params):
+        response = await self._api._call(
+            method=self._method,
+            path=self._path,
+            data=params,
+            token_data=self.token_data,
+            idempotent=self._idempotent,
+        )
+        return self._parse_response(response)
+
+    def _parse_response(self, response):
         if response.error():
             raise response.error()
         if self._response_parser:
             return self._response_parser.parse_single(
-                response.json(), self._target_class, self.token_data
+                response.json(), self._target_class, self.token_data, self._api
             )
         else:
             return response
@@ -217,6 +1029,10 @@ class Cursor(object):
         api,
         object_parser,
         custom_pagination_fn=None,
+        stream=False,
+        prefetch=0,
+        method="GET",
+        pagination=None,
     ) -> None:
         """
         Args:
@@ -226,7 +1042,30 @@ class Cursor(object):
             endpoint : The endpoint to use for the request.
             object_parser : The parser to use for the response.
             custom_pagination_fn (optional): Custom pagination function to use for the cursor.
+                Called with the cursor and the decoded page body, it must fill the cursor
+                queue, update the cursor params and return True if another page follows.
+                A function taking only the cursor is called as before: it loads the
+                page itself, and can't be used with prefetch or an async client.
+            stream (optional): Parse each page incrementally while it downloads and
+                hand out records as soon as they are complete, instead of parsing the
+                whole page first. Only for meta-paginated endpoints.
+            prefetch (optional): Number of pages to download ahead, in the background,
+                while the current page is consumed. See prefetch().
+            method (optional): "GET" (params in the query string) or "POST" for
+                searches taking their params, pagination included, as a JSON body.
+            pagination (optional): PaginationStrategy of the endpoint (see
+                highlevel_sdk.pagination), meta pagination by default. Preferred
+                over custom_pagination_fn, which is kept for existing callers.
         """
+        if pagination is None:
+            if custom_pagination_fn is None:
+                pagination = META_PAGINATION
+            else:
+                pagination = PAGINATION_STRATEGIES.get(custom_pagination_fn)
+        if stream and not (pagination is not None and pagination.streamable):
+            raise HighLevelError(
+                "Streaming is only supported for meta-paginated endpoints"
+            )
 
         self._target_objects_class = target_objects_class
         self._params = params
@@ -234,15 +1073,37 @@ class Cursor(object):
         self.token_data = token_data
         self._api = api
         self._path = f"{endpoint}"
+        self._method = method
         self._object_parser = object_parser
-        self._queue = []
+        self._queue = deque()
         self._headers = None
-        self._has_next_page = False
+        self._meta = None
+        self._has_next_page = True
         self._start_after_id = None
         self.custom_pagination_fn = custom_pagination_fn
+        self.pagination = pagination
+        # a one-argument custom_pagination_fn loads its pages itself
+        self._legacy_pagination = pagination is None and not _takes_body(
+            custom_pagination_fn
+        )
+        self._stream = stream
+        self._page_records = None
+        self._pages = 0
+        self._page_started = None
+        self._page_params = None
+        self._next_params = None
+        self._page_size = 0
+        self._streamed = 0
+        self._skip = 0
+        self._prefetch_depth = 0
+        self._prefetcher = None
+        self._page_sizer = None
+        self.hooks = Hooks()
+        if prefetch:
+            self.prefetch(prefetch)
 
     def __repr__(self):
-        return str(self._queue)
+        return str(list(self._queue))
 
     def __len__(self):
         return len(self._queue)
@@ -251,10 +1112,17 @@ class Cursor(object):
         return self
 
     def __next__(self):
-        if not self._queue and not self.load_next_page():
-            raise StopIteration()
+        while not self._queue:
+            if self._page_records is not None:
+                record = next(self._page_records, None)
+                if record is not None:
+                    return record
+                self._page_records = None
+                continue
+            if not self.load_next_page():
+                raise StopIteration()
 
-        return self._queue.pop(0)
+        return self._queue.popleft()
 
     def __getitem__(self, index):
         return self._queue[index]
@@ -262,45 +1130,612 @@ class Cursor(object):
     def headers(self):
         return self._headers
 
-    def load_next_page(self):
+    def meta(self):
         """
-        Loads the next page of data.
+        Returns the pagination meta of the last loaded page.
+        """
+        return self._meta
+
+    def iter_pages(self, checkpoints=None, key=None):
+        """
+        Yields the remaining records page by page, as Page objects carrying the
+        page's headers and meta.
+
+        The cursor drops each page once it is handed out, so a caller that
+        doesn't keep pages around holds one page at a time (plus the
+        `prefetch` depth, if set) however large the collection is.
+
+        Args:
+            checkpoints (optional): A checkpoint store (see highlevel_sdk.checkpoint).
+                The cursor resumes from the checkpoint saved under `key`, saves
+                one each time the caller asks for the next page (i.e. once the
+                previous page is committed) and clears it when exhausted.
+            key (optional): Key of the job in `checkpoints`. Defaults to the
+                endpoint path and location.
+
+        Yields:
+            Page: each non-empty page, in order.
+        """
+        if checkpoints is not None:
+            key = key or self._checkpoint_key()
+            token = checkpoints.load(key)
+            if token:
+                self.resume(token)
+        while True:
+            records = self._take_page()
+            if records:
+                yield Page(self._pages, records, self._headers, self._meta)
+                if checkpoints is not None:
+                    checkpoints.save(key, self.checkpoint())
+            records = None
+            if not self.load_next_page():
+                if checkpoints is not None:
+                    checkpoints.clear(key)
+                return
+
+    def checkpoint(self):
+        """
+        Returns an opaque token of the cursor position, which resume() continues
+        from, in this or another process. Records already handed out count as
+        consumed; within a partly consumed page, the position is kept to the record.
 
         Returns:
-            bool: True if there is a next page, False otherwise.
+            str: a URL-safe token.
         """
-        if self.custom_pagination_fn:
-            return self.custom_pagination_fn(self)
+        done = False
+        if self._page_params is None:
+            # nothing loaded since the cursor was created or resumed
+            params, skip, pages = self._params, self._skip, self._pages
+        elif self._page_records is not None:
+            params, skip, pages = self._page_params, self._streamed, self._pages
+        elif self._queue:
+            skip = self._page_size - len(self._queue)
+            params, pages = self._page_params, self._pages - 1
         else:
-            return self.load_next_page_meta()
+            params, skip, pages = self._next_params, 0, self._pages
+            done = not self._has_next_page
+        return encode_checkpoint(
+            {
+                "path": self._path,
+                "params": params,
+                "skip": skip,
+                "pages": pages,
+                "done": done,
+            }
+        )
 
-    def load_next_page_meta(self):
+    def resume(self, token):
+        """
+        Moves the cursor to a position returned by checkpoint(), dropping
+        whatever it had loaded. The page holding the position is fetched again.
 
-        response = self._api._call(
-            method="GET",
-            path=self._path,
-            data=self._params,
-            token_data=self.token_data,
-        )
+        Returns:
+            Cursor: self, for chaining.
+
+        Raises:
+            HighLevelError: if the token is invalid or belongs to another endpoint.
+        """
+        state = decode_checkpoint(token)
+        if state["path"] != self._path:
+            raise HighLevelError(
+                f"Checkpoint of {state['path']} can't resume a cursor over {self._path}"
+            )
+        self.close()
+        self._prefetcher = None
+        self._params = dict(state["params"])
+        self._queue = deque()
+        self._page_records = None
+        self._page_params = None
+        self._next_params = None
+        self._page_size = 0
+        self._pages = state["pages"]
+        self._skip = state["skip"]
+        self._has_next_page = not state["done"]
+        if self._page_sizer is not None:
+            # `skip` counts records of a page of the checkpointed size
+            self._page_sizer.reset(self._params[self._size_key()])
+        return self
+
+    def _checkpoint_key(self):
+        location_id = self._params.get("locationId")
+        return f"{self._path} {location_id}" if location_id else self._path
+
+    def _skip_consumed(self):
+        # drop the records a resumed checkpoint had already handed out
+        skip, self._skip = self._skip, 0
+        for _ in range(min(skip, len(self._queue))):
+            self._queue.popleft()
+
+    def _take_page(self):
+        if self._page_records is not None:
+            records = list(self._page_records)
+            self._page_records = None
+            return records
+        records = list(self._queue)
+        self._queue.clear()
+        return records
+
+    def prefetch(self, depth=1):
+        """
+        Downloads and parses up to `depth` pages ahead in a background thread,
+        so network latency overlaps with consuming the current page. Works with
+        every pagination function, as each one only needs the previous page.
+
+        Returns:
+            Cursor: self, for chaining.
+        """
+        if self._stream:
+            raise HighLevelError("Streamed cursors can't prefetch pages")
+        if self._legacy_pagination:
+            raise HighLevelError(
+                "A custom_pagination_fn taking only the cursor can't prefetch pages"
+            )
+        self._prefetch_depth = depth
+        return self
 
+    def adaptive(self, sizer=None):
+        """
+        Lets the page size follow how pages come back instead of staying at
+        the `limit` the cursor was created with: it grows toward the API
+        maximum while pages are fast and light, and shrinks when they slow
+        down, grow too large, time out or get throttled. See AdaptivePageSize.
+
+        Args:
+            sizer (optional): An AdaptivePageSize, to tune its bounds or share it
+                between cursors. Defaults to one starting from the cursor's limit.
+
+        Returns:
+            Cursor: self, for chaining.
+
+        Raises:
+            HighLevelError: for streamed cursors and page-numbered endpoints,
+                whose page numbers only hold for a fixed size.
+        """
+        if self._stream:
+            raise HighLevelError("Streamed cursors can't adapt their page size")
+        if self._size_key() not in self._params:
+            raise HighLevelError(
+                f"{self._path} is not cursor-paginated, its page size can't adapt"
+            )
+        sizer = sizer or AdaptivePageSize()
+        if sizer.size is None:
+            sizer.reset(self._params[self._size_key()])
+        self._page_sizer = sizer
+        return self
+
+    def _size_key(self):
+        return self.pagination.size_key if self.pagination is not None else None
+
+    def _page_size_of(self, params):
+        key = self._size_key()
+        return params.get(key) if key and params else None
+
+    def _advance(self, page, body):
+        """
+        Parses a page body into `page` (the cursor or a scratch copy of it) and
+        moves its params to the next page.
+
+        Returns:
+            bool: True if another page follows.
+        """
+        if self.pagination is None:
+            return bool(self.custom_pagination_fn(page, body))
+        return apply_pagination(self.pagination, page, body)
+
+    def _size_page(self):
+        """
+        Sets the size of the next page, if it adapts.
+        """
+        if self._page_sizer is not None:
+            self._params[self._size_key()] = self._page_sizer.size
+
+    def _observe_page(self, response, records):
+        if self._page_sizer is not None:
+            self._page_sizer.observe(
+                records,
+                latency=response.elapsed,
+                response_bytes=len(response.body) if response.body else None,
+                retries=response.retries,
+            )
+
+    def close(self):
+        """
+        Stops the background prefetch, if any.
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+
+    def _fetch_page(self):
+        while True:
+            self._size_page()
+            try:
+                return self._api._call(
+                    method=self._method,
+                    path=self._path,
+                    data=self._params,
+                    token_data=self.token_data,
+                    idempotent=True,
+                )
+            except TRANSPORT_ERRORS:
+                # retried already; try again with a smaller page, if it can shrink
+                if self._page_sizer is None or not self._page_sizer.on_timeout():
+                    raise
+
+    def _paginate(self, response):
+        """
+        Runs the pagination function over a page on a scratch copy of the
+        cursor, leaving the queue being consumed untouched.
+
+        Returns:
+            tuple: the page records (a deque), whether another page follows and
+                the params of the next page.
+        """
+        page = copy(self)
+        page._queue = deque()
+        has_next_page = self._advance(page, response.json())
+        records = page._queue
+        if not isinstance(records, deque):
+            records = deque(records)
+        self._observe_page(response, len(records))
+        return records, has_next_page, dict(page._params)
+
+    def _load_prefetched_page(self):
+        if self._prefetcher is None:
+            self._prefetcher = _Prefetcher(self, self._prefetch_depth)
+        page = self._prefetcher.get()
+        if page is None:
+            self._has_next_page = False
+            return False
+        self._set_prefetched_page(page)
+        return bool(self._page_size)
+
+    def _set_prefetched_page(self, page):
+        (
+            self._page_started,
+            response,
+            self._page_params,
+            self._queue,
+            self._has_next_page,
+            self._next_params,
+        ) = page
         self._headers = response.headers
+        self._meta = page_meta(response.json())
+        self._page_size = len(self._queue)
+        self._emit_page(response, self._page_size)
+        self._skip_consumed()
 
-        body = response.json()
-        self._queue = self._object_parser.parse_multiple(
-            body, self._target_objects_class, self.token_data
-        )
-        if not self._queue:
+    def load_next_page(self):
+        """
+        Loads the next page of data.
+
+        Returns:
+            bool: True if the page loaded any records, False once the cursor is exhausted.
+        """
+        if not self._has_next_page:
             return False
-        if not body.get("meta"):
+
+        if self._prefetch_depth:
+            return self._load_prefetched_page()
+
+        self._page_started = perf_counter()
+        if self._legacy_pagination:
+            self._has_next_page = bool(self.custom_pagination_fn(self))
+            self._queue = deque(self._queue or ())
+            return bool(self._queue)
+        if self._stream:
+            self._page_params = dict(self._params)
+            response = self._api._call(
+                method="GET",
+                path=self._path,
+                data=self._params,
+                token_data=self.token_data,
+                stream=True,
+            )
+            self._headers = response.headers
+            self._streamed, self._skip = self._skip, 0
+            self._page_records = self._stream_page(response, self._streamed)
+            return True
+
+        response = self._fetch_page()
+        # after the fetch, which sets the size of an adaptive page
+        self._page_params = dict(self._params)
+        return self._consume_page(response)
+
+    def _stream_page(self, response, skip=0):
+        """
+        Yields the records of a streamed page as they are parsed, then advances
+        the pagination params from the page `meta`.
+        """
+        meta = {}
+        records = 0
+        skip_keys = getattr(self._object_parser, "SKIPPED_KEYS", ())
+        try:
+            for record in iter_records(response.raw, skip_keys, meta):
+                records += 1
+                if records <= skip:
+                    continue
+                self._streamed = records
+                yield self._object_parser.parse_single(
+                    record, self._target_objects_class, self.token_data, self._api
+                )
+        except BaseException:
+            # abandoned mid-page, the connection can't be reused
+            response.raw.close()
+            raise
+        response.raw.release_conn()
+        params = self.pagination.next_params(self._params, meta, None)
+        if records and params is not None:
+            self._params.update(params)
+        self._has_next_page = records > 0 and params is not None
+        self._next_params = dict(self._params)
+        self._meta = page_meta(meta)
+        self._emit_page(response, records)
+
+    def _consume_page(self, response):
+        """
+        Parses a page response into the queue and advances the pagination params.
+        Shared by the sync and async cursors.
+        """
+        self._headers = response.headers
+        self._queue = deque()
+        body = response.json()
+        self._has_next_page = self._advance(self, body)
+        self._next_params = dict(self._params)
+        self._meta = page_meta(body)
+        if not isinstance(self._queue, deque):
+            self._queue = deque(self._queue)
+        self._page_size = len(self._queue)
+        self._observe_page(response, self._page_size)
+        self._emit_page(response, self._page_size)
+        self._skip_consumed()
+        return bool(self._page_size)
+
+    def _emit_page(self, response, records):
+        self._pages += 1
+        if not (self.hooks.on_page or self._api.hooks.on_page):
+            return
+        event = {
+            "path": template_path(self._path),
+            "page": self._pages,
+            "records": records,
+            "page_size": self._page_size_of(self._page_params),
+            "has_next_page": self._has_next_page,
+            "elapsed": perf_counter() - self._page_started,
+            "response_bytes": len(response.body) if response.body else None,
+        }
+        self.hooks.emit("on_page", event)
+        self._api.hooks.emit("on_page", event)
+
+
+def _takes_body(custom_pagination_fn):
+    """
+    Returns True unless a custom pagination function only takes the cursor,
+    the form it had before it was handed the page body.
+    """
+    if custom_pagination_fn is None:
+        return True
+    try:
+        parameters = inspect.signature(custom_pagination_fn).parameters.values()
+    except (TypeError, ValueError):
+        return True
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (
+            parameter.POSITIONAL_ONLY,
+            parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional += 1
+    return positional >= 2
+
+
+class Page(object):
+    """
+    One page of a Cursor: its records, with the headers and pagination meta
+    of the response they came from.
+    """
+
+    def __init__(self, number, records, headers, meta) -> None:
+        """
+        Args:
+            number : Position of the page in the cursor, starting at 1.
+            records : The parsed records of the page.
+            headers : The response headers.
+            meta : The pagination meta of the page (see utils.page_meta).
+        """
+        self.number = number
+        self.records = records
+        self.headers = headers
+        self.meta = meta
+
+    def __repr__(self):
+        return f"<Page {self.number}: {len(self.records)} records>"
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+
+class AsyncCursor(Cursor):
+    """
+    Iterates over pages of data with ``async for``.
+    """
+
+    def __init__(self, *args, stream=False, **kwargs) -> None:
+        if stream:
+            raise HighLevelError("Streaming pages is only supported by the sync Cursor")
+        super().__init__(*args, **kwargs)
+        if self._legacy_pagination:
+            raise HighLevelError(
+                "Async cursors need a custom_pagination_fn taking the page body"
+            )
+
+    def __iter__(self):
+        raise TypeError("AsyncCursor must be consumed with `async for`")
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._queue:
+            if not await self.load_next_page():
+                raise StopAsyncIteration()
+
+        return self._queue.popleft()
+
+    async def iter_pages(self, checkpoints=None, key=None):
+        """
+        Yields the remaining records page by page, as Page objects, with
+        ``async for``. See Cursor.iter_pages().
+        """
+        if checkpoints is not None:
+            key = key or self._checkpoint_key()
+            token = checkpoints.load(key)
+            if token:
+                self.resume(token)
+        while True:
+            records = self._take_page()
+            if records:
+                yield Page(self._pages, records, self._headers, self._meta)
+                if checkpoints is not None:
+                    checkpoints.save(key, self.checkpoint())
+            records = None
+            if not await self.load_next_page():
+                if checkpoints is not None:
+                    checkpoints.clear(key)
+                return
+
+    def close(self):
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+
+    async def _fetch_page(self):
+        import aiohttp
+
+        while True:
+            self._size_page()
+            try:
+                return await self._api._call(
+                    method=self._method,
+                    path=self._path,
+                    data=self._params,
+                    token_data=self.token_data,
+                    idempotent=True,
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if self._page_sizer is None or not self._page_sizer.on_timeout():
+                    raise
+
+    async def _prefetch_pages(self, pages):
+        has_next_page = True
+        try:
+            while has_next_page:
+                started = perf_counter()
+                response = await self._fetch_page()
+                params = dict(self._params)
+                records, has_next_page, next_params = self._paginate(response)
+                await pages.put(
+                    (started, response, params, records, has_next_page, next_params)
+                )
+                if not records:
+                    break
+        except Exception as e:
+            await pages.put(e)
+        await pages.put(None)
+
+    async def _load_prefetched_page(self):
+        if self._prefetcher is None:
+            self._prefetch_queue = asyncio.Queue(self._prefetch_depth)
+            self._prefetcher = asyncio.ensure_future(
+                self._prefetch_pages(self._prefetch_queue)
+            )
+        page = await self._prefetch_queue.get()
+        if isinstance(page, Exception):
+            raise page
+        if page is None:
+            self._has_next_page = False
             return False
-        self._has_next_page = (
-            body["meta"]["nextPage"] is not None
-            and body["meta"]["startAfter"] is not None
-        )
-        self._params["startAfter"] = body["meta"]["startAfter"]
-        self._params["startAfterId"] = body["meta"]["startAfterId"]
+        self._set_prefetched_page(page)
+        return bool(self._page_size)
 
+    async def load_next_page(self):
+        """
+        Loads the next page of data.
+
+        Returns:
+            bool: True if the page loaded any records, False once the cursor is exhausted.
+        """
         if not self._has_next_page:
             return False
 
-        return True
+        if self._prefetch_depth:
+            return await self._load_prefetched_page()
+
+        self._page_started = perf_counter()
+        response = await self._fetch_page()
+        self._page_params = dict(self._params)
+        return self._consume_page(response)
+
+
+class _Prefetcher(object):
+    """
+    Background thread fetching and parsing the pages of a Cursor ahead of
+    its consumer, at most `depth` pages at a time.
+    """
+
+    def __init__(self, cursor, depth) -> None:
+        # advance a copy, so the cursor's params stay put for checkpoint/resume
+        self._cursor = copy(cursor)
+        self._cursor._params = dict(cursor._params)
+        self._pages = queue.Queue(depth)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="highlevel-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        has_next_page = True
+        try:
+            while has_next_page and not self._stopped.is_set():
+                started = perf_counter()
+                response = self._cursor._fetch_page()
+                params = dict(self._cursor._params)
+                records, has_next_page, next_params = self._cursor._paginate(response)
+                self._put(
+                    (started, response, params, records, has_next_page, next_params)
+                )
+                if not records:
+                    break
+        except Exception as e:
+            self._put(e)
+        self._put(None)
+
+    def _put(self, item):
+        # wake up regularly so an abandoned cursor doesn't pin the thread
+        while not self._stopped.is_set():
+            try:
+                self._pages.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def get(self):
+        """
+        Returns the next page as (started, response, params, records,
+        has_next_page, next_params), or None once the cursor is exhausted.
+        """
+        page = self._pages.get()
+        if isinstance(page, Exception):
+            self.stop()
+            raise page
+        return page
+
+    def stop(self):
+        self._stopped.set()
@@ -0,0 +1,162 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+
+# end of a worker's results
+_DONE = object()
+
+
+def imap_bounded(fn, iterable, max_workers, window=None):
+    """
+    Yields `fn(item)` for each item, in order, running up to `max_workers`
+    calls at once.
+
+    The iterable is consumed lazily, at most `window` items ahead of the
+    consumer (twice the workers by default), so a paginated cursor keeps
+    fetching pages while earlier items are being processed, without
+    buffering the whole collection.
+    """
+    window = window or max_workers * 2
+    pool = ThreadPoolExecutor(max_workers, thread_name_prefix="highlevel")
+    pending = deque()
+    try:
+        for item in iterable:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+async def amap_bounded(fn, aiterable, max_concurrency):
+    """
+    asyncio counterpart of imap_bounded: awaits `fn(item)` for each item of an
+    async iterable, up to `max_concurrency` at once.
+
+    Returns:
+        list: the results, in input order.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item):
+        async with semaphore:
+            return await fn(item)
+
+    tasks = []
+    try:
+        async for item in aiterable:
+            tasks.append(asyncio.ensure_future(run(item)))
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def iflatmap_unordered(fn, iterable, max_workers, buffer=None):
+    """
+    Yields `(item, result)` for every result of the iterable `fn(item)`
+    returns (e.g. a cursor), for each item, running up to `max_workers` of
+    them at once. Results come as they are produced, not in input order.
+
+    Workers take the next item from `iterable` when they are done with one,
+    so a paginated cursor is fetched alongside the per-item calls. They block
+    once `buffer` results (twice the workers by default) wait for the
+    consumer, so a slow consumer slows the calls down rather than piling up
+    results. The first error stops the workers and is raised to the consumer.
+    """
+    buffer = buffer or max_workers * 2
+    results = queue.Queue(buffer)
+    items = iter(iterable)
+    lock = threading.Lock()
+    stopped = threading.Event()
+
+    def put(entry):
+        # wake up regularly so an abandoned generator doesn't pin the threads
+        while not stopped.is_set():
+            try:
+                results.put(entry, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run():
+        try:
+            while not stopped.is_set():
+                with lock:
+                    item = next(items, _DONE)
+                if item is _DONE:
+                    break
+                for result in fn(item):
+                    if not put((item, result)):
+                        break
+        except Exception as e:
+            put(e)
+        put(_DONE)
+
+    workers = [
+        threading.Thread(target=run, name="highlevel-fanout", daemon=True)
+        for _ in range(max_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        running = len(workers)
+        while running:
+            entry = results.get()
+            if entry is _DONE:
+                running -= 1
+            elif isinstance(entry, Exception):
+                raise entry
+            else:
+                yield entry
+    finally:
+        stopped.set()
+
+
+async def aflatmap_unordered(fn, aiterable, max_concurrency, buffer=None):
+    """
+    asyncio counterpart of iflatmap_unordered: yields `(item, result)` for
+    every result of the async iterable `fn(item)` returns, for each item of an
+    async iterable, up to `max_concurrency` at once, with ``async for``.
+    """
+    buffer = buffer or max_concurrency * 2
+    results = asyncio.Queue(buffer)
+    items = aiterable.__aiter__()
+    lock = asyncio.Lock()
+
+    async def run():
+        try:
+            while True:
+                async with lock:
+                    try:
+                        item = await items.__anext__()
+                    except StopAsyncIteration:
+                        break
+                async for result in fn(item):
+                    await results.put((item, result))
+        except Exception as e:
+            await results.put(e)
+        await results.put(_DONE)
+
+    tasks = [asyncio.ensure_future(run()) for _ in range(max_concurrency)]
+    try:
+        running = len(tasks)
+        while running:
+            entry = await results.get()
+            if entry is _DONE:
+                running -= 1
+            elif isinstance(entry, Exception):
+                raise entry
+            else:
+                yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
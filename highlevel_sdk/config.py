@@ -7,9 +7,54 @@ load_dotenv()
 class HighLevelConfig(object):
     CLIENT_ID = os.environ.get("GHL_CLIENT_ID", None)
     CLIENT_SECRET = os.environ.get("GHL_CLIENT_SECRET", None)
-    API_BASE_URL = "https://services.leadconnectorhq.com"
+    API_BASE_URL = os.environ.get(
+        "GHL_API_BASE_URL", "https://services.leadconnectorhq.com"
+    )
     AUTH_BASE_URL = "https://marketplace.gohighlevel.com"
     VERSION = "2021-07-28"
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    MAX_CACHED_HEADERS = 1024
+    # default burst limit, refined from the X-RateLimit-* response headers
+    RATE_LIMIT_MAX = 100
+    RATE_LIMIT_INTERVAL = 10.0
+    # once the daily limit is spent, one call per this many seconds checks for a new day
+    RATE_LIMIT_DAILY_PROBE_INTERVAL = 60.0
+    # seconds a call waits to connect, or between bytes of the response
+    REQUEST_TIMEOUT = 60
+    RETRY_MAX_ATTEMPTS = 4
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    # refresh tokens this many seconds ahead of expiry, in the background
+    TOKEN_REFRESH_MARGIN = 300
+    TOKEN_REFRESH_BACKOFF = 30
+    LOCATION_TOKEN_WORKERS = 8
+    # conversations whose messages are fetched at once
+    MESSAGE_FANOUT_WORKERS = 16
+    # calendar event queries: longest range of one call (the events endpoint
+    # doesn't paginate) and queries at once
+    CALENDAR_EVENT_WINDOW_MS = 31 * 24 * 60 * 60 * 1000
+    CALENDAR_EVENT_WORKERS = 8
+    # contacts whose appointments are fetched at once
+    APPOINTMENT_WORKERS = 8
+    # bulk writes: writes at once, merged writes per batch, seconds a
+    # write-behind update may wait for its batch, and batches put() may queue
+    BULK_WRITE_WORKERS = 8
+    BULK_WRITE_BATCH_SIZE = 100
+    BULK_WRITE_FLUSH_INTERVAL = 5.0
+    BULK_WRITE_MAX_PENDING_BATCHES = 4
+    # adaptive page sizes: bounds, and the page latency and body size to stay under
+    PAGE_SIZE_MIN = 10
+    PAGE_SIZE_MAX = 100
+    PAGE_SIZE_TARGET_LATENCY = 2.0
+    PAGE_SIZE_MAX_BYTES = 4 * 1024 * 1024
+    # sharded scans don't split date windows narrower than this
+    SHARD_MIN_SPAN_MS = 60 * 1000
+    CACHE_MAX_ENTRIES = 1024
+    CACHE_MAX_BYTES = 64 * 1024 * 1024
+    # None advertises every encoding the installed decoders support
+    ACCEPT_ENCODING = None
+    REQUEST_COMPRESSION_MIN_BYTES = 16 * 1024
     SCOPES = [
         "businesses.readonly",
         "calendars.readonly",
@@ -44,3 +44,16 @@ class HighLevelRequestException(HighLevelError):
 
     def body(self):
         return self._body
+
+
+class HighLevelRateLimitError(HighLevelError):
+    def __init__(self, message, budget=None):
+        self._message = message
+        self._budget = budget
+        super().__init__(message)
+
+    def message(self):
+        return self._message
+
+    def budget(self):
+        return self._budget
@@ -0,0 +1,277 @@
+import bisect
+import logging
+import re
+import threading
+
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[A-Za-z0-9_-]{16,}$|^\d+$")
+
+
+def template_path(path):
+    """
+    Replaces id-like path segments with `{id}`, so calls to the same endpoint
+    share one label: `/contacts/ve9EPM428h8vShlRW1KT` -> `/contacts/{id}`.
+    """
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+class Hooks(object):
+    """
+    Event subscriptions of a client or a Cursor.
+
+    Each event is a plain list of callables receiving one dict. Emitters check
+    the list before building the event, so unused hooks cost one attribute
+    lookup per call.
+
+    Events:
+        on_request : before each attempt of a call.
+        on_response : once a call is answered (from the network or the cache).
+        on_retry : before sleeping ahead of a retry.
+        on_page : once a Cursor page has been parsed.
+    """
+
+    EVENTS = ("on_request", "on_response", "on_retry", "on_page")
+
+    def __init__(self) -> None:
+        self.on_request = []
+        self.on_response = []
+        self.on_retry = []
+        self.on_page = []
+
+    def subscribe(self, event, fn):
+        if event not in self.EVENTS:
+            raise ValueError(f"Unknown event {event!r}")
+        getattr(self, event).append(fn)
+        return fn
+
+    def unsubscribe(self, event, fn):
+        getattr(self, event).remove(fn)
+
+    def add_subscriber(self, subscriber):
+        """
+        Subscribes every `on_*` method a subscriber object defines.
+        """
+        for event in self.EVENTS:
+            fn = getattr(subscriber, event, None)
+            if fn is not None:
+                self.subscribe(event, fn)
+        return subscriber
+
+    def emit(self, event, payload):
+        for fn in getattr(self, event):
+            fn(payload)
+
+
+class LoggingSubscriber(object):
+    """
+    Logs every response, retry and page.
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG) -> None:
+        self.logger = logger or logging.getLogger("highlevel_sdk")
+        self.level = level
+
+    def on_response(self, event):
+        self.logger.log(
+            self.level,
+            "%s %s -> %s in %.3fs (%s bytes, %s retries%s)",
+            event["method"],
+            event["path"],
+            event["status"],
+            event["elapsed"],
+            event["response_bytes"],
+            event["retries"],
+            ", cached" if event["cached"] else "",
+        )
+
+    def on_retry(self, event):
+        self.logger.log(
+            self.level,
+            "retrying %s %s after attempt %s (%s), sleeping %.2fs",
+            event["method"],
+            event["path"],
+            event["attempt"],
+            event["status"] or event["error"],
+            event["delay"],
+        )
+
+    def on_page(self, event):
+        self.logger.log(
+            self.level,
+            "page %s of %s: %s records (page size %s)",
+            event["page"],
+            event["path"],
+            event["records"],
+            event["page_size"],
+        )
+
+
+class Counter(object):
+    def __init__(self, name, documentation) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.values = {}
+
+    def inc(self, labels, amount=1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(labels)} {value}")
+        return lines
+
+
+class Gauge(object):
+    def __init__(self, name, documentation) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.values = {}
+
+    def set(self, labels, value):
+        self.values[labels] = value
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+        ]
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(labels)} {value}")
+        return lines
+
+
+class Histogram(object):
+    def __init__(self, name, documentation, buckets) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+        self.values = {}
+
+    def observe(self, labels, value):
+        state = self.values.get(labels)
+        if state is None:
+            state = self.values[labels] = [[0] * len(self.buckets), 0, 0.0]
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            state[0][index] += 1
+        state[1] += 1
+        state[2] += value
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (counts, count, total) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = labels + (("le", repr(float(bound))),)
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                )
+            inf_labels = labels + (("le", "+Inf"),)
+            lines.append(f"{self.name}_bucket{_format_labels(inf_labels)} {count}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+        return lines
+
+
+class MetricsRegistry(object):
+    """
+    Prometheus-style in-process registry fed by client and Cursor hooks.
+
+    Add it with `client.hooks.add_subscriber(registry)` and expose
+    `registry.render()` on a metrics endpoint.
+    """
+
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+    RECORD_BUCKETS = (1, 10, 20, 50, 100, 250, 500, 1000)
+
+    def __init__(self, prefix="highlevel") -> None:
+        self._lock = threading.Lock()
+        self.requests = Counter(f"{prefix}_requests_total", "API calls answered.")
+        self.retries = Counter(f"{prefix}_retries_total", "API call retries.")
+        self.response_bytes = Counter(
+            f"{prefix}_response_bytes_total", "Decoded response body bytes."
+        )
+        self.request_bytes = Counter(
+            f"{prefix}_request_bytes_total", "Request body bytes sent."
+        )
+        self.latency = Histogram(
+            f"{prefix}_request_duration_seconds",
+            "API call latency, retries included.",
+            self.LATENCY_BUCKETS,
+        )
+        self.page_records = Histogram(
+            f"{prefix}_page_records", "Records parsed per page.", self.RECORD_BUCKETS
+        )
+        self.rate_limit_remaining = Gauge(
+            f"{prefix}_rate_limit_remaining",
+            "Burst requests left, from the last X-RateLimit-Remaining seen.",
+        )
+        self.page_size = Gauge(
+            f"{prefix}_page_size", "Page size requested by the last page loaded."
+        )
+
+    def on_response(self, event):
+        labels = (("method", event["method"]), ("path", event["path"]))
+        with self._lock:
+            self.requests.inc(labels + (("status", str(event["status"])),))
+            self.response_bytes.inc(labels, event["response_bytes"] or 0)
+            self.request_bytes.inc(labels, event["request_bytes"] or 0)
+            if not event["cached"]:
+                self.latency.observe(labels, event["elapsed"])
+            remaining = event["rate_limit"].get("X-RateLimit-Remaining")
+            if remaining is not None:
+                self.rate_limit_remaining.set(
+                    (("key", event["rate_limit_key"]),), remaining
+                )
+
+    def on_retry(self, event):
+        labels = (("method", event["method"]), ("path", event["path"]))
+        with self._lock:
+            self.retries.inc(labels)
+
+    def on_page(self, event):
+        with self._lock:
+            self.page_records.observe((("path", event["path"]),), event["records"])
+            if event["page_size"] is not None:
+                self.page_size.set((("path", event["path"]),), event["page_size"])
+
+    def render(self):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            lines = []
+            for metric in (
+                self.requests,
+                self.retries,
+                self.response_bytes,
+                self.request_bytes,
+                self.latency,
+                self.page_records,
+                self.rate_limit_remaining,
+                self.page_size,
+            ):
+                lines.extend(metric.render())
+            return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(
+            '%s="%s"' % (k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+            for k, v in labels
+        )
+        + "}"
+    )
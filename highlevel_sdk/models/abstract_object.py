@@ -12,9 +12,9 @@ class AbstractObject(collections_abc.MutableMapping):
     class Fields:
         pass
 
-    def __init__(self, token_data=None, id=None):
+    def __init__(self, token_data=None, id=None, api=None):
         self._data = {}
-        self.api = HighLevelClient
+        self.api = api if api is not None else HighLevelClient.default()
 
         if id:
             self["id"] = id
@@ -32,11 +32,11 @@ class AbstractObject(collections_abc.MutableMapping):
         if not self.token_data:
             raise ValueError("Token data is not set")
 
-        from highlevel_sdk.auth import refresh_token
+        from highlevel_sdk.auth import TokenManager
 
-        token_data = refresh_token(self.token_data["refresh_token"])
-
-        self.set_token_data(token_data)
+        # refreshed in place, so every object sharing this token sees the new one
+        manager = getattr(self.api, "token_manager", None) or TokenManager()
+        manager.refresh(self.token_data)
 
         return
 
@@ -88,15 +88,57 @@ class AbstractObject(collections_abc.MutableMapping):
 
     def api_get(self, params=None):
         """
-        Returns the object from the API
+        Returns the object from the API. With an async client, returns an awaitable.
         """
         method = "GET"
         path = self.get_endpoint()
         token_data = self.get_token_data()
+        if self.api.is_async:
+            return self._api_get_async(path, token_data, params)
         response = self.api._call(method, path, token_data=token_data, data=params)
         self._set_data(response.json())
         return self
 
+    async def _api_get_async(self, path, token_data, params):
+        response = await self.api._call(
+            "GET", path, token_data=token_data, data=params
+        )
+        self._set_data(response.json())
+        return self
+
+    def api_update(self, data, idempotent=None):
+        """
+        Updates the object through the API (PUT on its endpoint) and loads the
+        response. With an async client, returns an awaitable.
+
+        Args:
+            data : Fields to update.
+            idempotent (optional): False to send it once, without the client's retries.
+
+        Raises:
+            HighLevelRequestException: if the API rejects the update.
+        """
+        path = self.get_endpoint()
+        token_data = self.get_token_data()
+        if self.api.is_async:
+            return self._api_update_async(path, token_data, data, idempotent)
+        response = self.api._call(
+            "PUT", path, token_data=token_data, data=data, idempotent=idempotent
+        )
+        if response.error():
+            raise response.error()
+        self._set_data(response.json())
+        return self
+
+    async def _api_update_async(self, path, token_data, data, idempotent):
+        response = await self.api._call(
+            "PUT", path, token_data=token_data, data=data, idempotent=idempotent
+        )
+        if response.error():
+            raise response.error()
+        self._set_data(response.json())
+        return self
+
     # reads in data from json object
     def _set_data(self, data):
         """
@@ -124,8 +166,8 @@ class AbstractObject(collections_abc.MutableMapping):
     def export_all_data(self):
         return self.export_value(self._data)
 
-    def create_object(data, target_class, token_data):
-        new_object = target_class()
+    def create_object(data, target_class, token_data, api=None):
+        new_object = target_class(api=api)
         new_object._set_data(data)
         new_object.set_token_data(token_data)
         return new_object
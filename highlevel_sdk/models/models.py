@@ -1,19 +1,31 @@
 from highlevel_sdk.models.abstract_object import AbstractObject
+from highlevel_sdk.calendar_events import CalendarEventScan
 from highlevel_sdk.client import HighLevelRequest
+from highlevel_sdk.concurrency import (
+    aflatmap_unordered,
+    amap_bounded,
+    iflatmap_unordered,
+    imap_bounded,
+)
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.exceptions import HighLevelError
 from highlevel_sdk.object_parser import ObjectParser
-from highlevel_sdk.utils import (
-    paginate_conversations,
-    paginate_messages,
-    paginate_form_submissions,
+from highlevel_sdk.pagination import (
+    DatePagination,
+    MessagePagination,
+    PageNumberPagination,
+    SearchAfterPagination,
 )
+from highlevel_sdk.sharding import ShardedScan
+from highlevel_sdk.utils import timestamp_ms
 
 
 class Agency(AbstractObject):
-    def __init__(self, token_data=None, id=None):
+    def __init__(self, token_data=None, id=None, api=None):
         # id is the company id
         assert token_data is not None, "Agency must have an access token"
 
-        super().__init__(token_data=token_data, id=id)
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         # get() is not available for Agency
@@ -21,22 +33,119 @@ class Agency(AbstractObject):
 
     def get_location(self, location_id):
         """
-        Queries the API for an location access token and returns a Location Object.
+        Returns a Location Object with its own access token. Tokens are minted
+        once per location and reused until they are about to expire.
 
         Args:
-            company_id (str): The company ID.
             location_id (str): The location ID.
 
         Returns:
-            A Location Object
+            A Location Object (an awaitable with an async client)
         """
 
+        if self.api.is_async:
+            return self._get_location_async(location_id)
+        token_data = self.get_location_token(location_id)
+        loc = Location(token_data=token_data, id=location_id, api=self.api).api_get()
+        return loc
+
+    async def _get_location_async(self, location_id):
+        token_data = await self._get_location_token_async(location_id)
+        loc = Location(token_data=token_data, id=location_id, api=self.api)
+        return await loc.api_get()
+
+    def get_location_token(self, location_id):
+        """
+        Returns the token data of a location, minted with the agency token on
+        first use and cached by the client's TokenManager until expiry.
+        """
+        manager = self.api.token_manager
+        if manager is None:
+            return self._mint_location_token(location_id)
+        return manager.acquire(
+            location_id, lambda: self._mint_location_token(location_id)
+        )
+
+    def _mint_location_token(self, location_id):
         path = "/oauth/locationToken"
         data = {"companyId": self["id"], "locationId": location_id}
-        response = self.api._call("POST", path, data=data, token_data=self.token_data)
+        # minting a location token has no side effects, so it is safe to retry
+        response = self.api._call(
+            "POST", path, data=data, token_data=self.token_data, idempotent=True
+        )
         token_data = response.json()
-        loc = Location(token_data=token_data, id=location_id).api_get()
-        return loc
+        token_data.setdefault("locationId", location_id)
+        return token_data
+
+    async def _get_location_token_async(self, location_id):
+        manager = self.api.token_manager
+        if manager is None:
+            return await self._mint_location_token_async(location_id)
+        return await manager.acquire_async(
+            location_id, lambda: self._mint_location_token_async(location_id)
+        )
+
+    async def _mint_location_token_async(self, location_id):
+        response = await self.api._call(
+            "POST",
+            "/oauth/locationToken",
+            data={"companyId": self["id"], "locationId": location_id},
+            token_data=self.token_data,
+            idempotent=True,
+        )
+        token_data = response.json()
+        token_data.setdefault("locationId", location_id)
+        return token_data
+
+    def get_location_tokens(self, location_ids, max_workers=None):
+        """
+        Mints (or reuses) the tokens of many locations concurrently.
+
+        Args:
+            location_ids (iterable): Location IDs.
+            max_workers (optional): Concurrent mints, HighLevelConfig.LOCATION_TOKEN_WORKERS by default.
+
+        Returns:
+            dict: token data by location ID.
+        """
+        location_ids = list(location_ids)
+        tokens = imap_bounded(
+            self.get_location_token,
+            location_ids,
+            max_workers or HighLevelConfig.LOCATION_TOKEN_WORKERS,
+        )
+        return dict(zip(location_ids, tokens))
+
+    def get_locations_with_tokens(self, max_workers=None):
+        """
+        Lists the agency's locations and mints their tokens concurrently, while
+        the `/locations/search` pages are still being fetched. Unlike
+        get_location, no extra call is made per location to load its details.
+
+        Args:
+            max_workers (optional): Concurrent mints, HighLevelConfig.LOCATION_TOKEN_WORKERS by default.
+
+        Returns:
+            A list of Location Objects bound to their own token (an awaitable
+            with an async client)
+        """
+
+        max_workers = max_workers or HighLevelConfig.LOCATION_TOKEN_WORKERS
+        if self.api.is_async:
+            return amap_bounded(
+                self._with_token_async, self.get_locations(), max_workers
+            )
+        return list(
+            imap_bounded(self._with_token, self.get_locations(), max_workers)
+        )
+
+    def _with_token(self, location):
+        location.set_token_data(self.get_location_token(location["id"]))
+        return location
+
+    async def _with_token_async(self, location):
+        location.set_token_data(await self._get_location_token_async(location["id"]))
+        return location
 
     def get_locations(self):
         """
@@ -66,8 +175,8 @@ class Agency(AbstractObject):
 
 
 class Location(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -90,7 +199,31 @@ class Location(AbstractObject):
 
         return request.execute()
     
-    def get_contacts(self, limit=20):
+    def get_contacts(self, limit=20, stream=False, shards=None):
+        """
+        Lists the location's contacts, oldest first.
+
+        Args:
+            limit (optional): Records per page.
+            stream (optional): Parse each page incrementally, see Cursor.
+            shards (optional): Scan with this many cursors at once over disjoint
+                `dateAdded` windows. Records then arrive in no particular order.
+
+        Returns:
+            A Cursor, or a ShardedScan when `shards` is set.
+        """
+        if shards:
+            if stream:
+                raise HighLevelError("Sharded scans can't stream pages")
+            return ShardedScan(
+                lambda start_after: self._get_contacts(limit, start_after=start_after),
+                "dateAdded",
+                shards,
+                is_async=self.api.is_async,
+            )
+        return self._get_contacts(limit, stream=stream)
+
+    def _get_contacts(self, limit, stream=False, start_after=None):
         request = HighLevelRequest(
             method="GET",
             node=None,
@@ -100,11 +233,14 @@ class Location(AbstractObject):
             api_type="EDGE",
             target_class=Contact,
             response_parser=ObjectParser,
+            stream=stream,
         )
         params = {
             "limit": limit,
             "locationId": self["id"],
         }
+        if start_after is not None:
+            params["startAfter"] = start_after
         request.add_params(params)
 
         return request.execute()
@@ -159,6 +295,90 @@ class Location(AbstractObject):
 
         return request.execute()
 
+    def get_calendar_events(
+        self,
+        start,
+        end,
+        calendar_ids=None,
+        group_ids=None,
+        user_ids=None,
+        concurrency=None,
+        window_days=None,
+    ):
+        """
+        Fetches the calendar events of any date range, querying several
+        calendars, groups or users at once over windows the API accepts.
+        Events listed under several of them are returned once. Without ids,
+        every calendar of the location is queried.
+
+        Args:
+            start : Start of the range, epoch milliseconds or an ISO 8601 date.
+            end : End of the range (exclusive), epoch milliseconds or an ISO 8601 date.
+            calendar_ids (optional): Calendars to query.
+            group_ids (optional): Calendar groups to query.
+            user_ids (optional): Users to query.
+            concurrency (optional): Queries at once,
+                HighLevelConfig.CALENDAR_EVENT_WORKERS by default.
+            window_days (optional): Days per query, 31 by default
+                (HighLevelConfig.CALENDAR_EVENT_WINDOW_MS).
+
+        Returns:
+            A CalendarEventScan of CalendarEvent objects, streamed as queries
+            complete (iterate it with `async for` with an async client).
+        """
+        scopes = (
+            [("calendarId", id) for id in calendar_ids or ()]
+            + [("groupId", id) for id in group_ids or ()]
+            + [("userId", id) for id in user_ids or ()]
+        )
+        if not scopes:
+            scopes = self._calendar_scopes()
+        elif self.api.is_async:
+            scopes = self._async_scopes(scopes)
+        return CalendarEventScan(
+            self._get_calendar_events,
+            start,
+            end,
+            scopes,
+            window_ms=window_days and window_days * 24 * 60 * 60 * 1000,
+            concurrency=concurrency,
+            is_async=self.api.is_async,
+        )
+
+    def _calendar_scopes(self):
+        if self.api.is_async:
+            return (
+                ("calendarId", calendar["id"])
+                async for calendar in self.get_calendars()
+            )
+        return (("calendarId", calendar["id"]) for calendar in self.get_calendars())
+
+    @staticmethod
+    async def _async_scopes(scopes):
+        for scope in scopes:
+            yield scope
+
+    def _get_calendar_events(self, scope_param, scope_id, start_ms, end_ms):
+        request = HighLevelRequest(
+            method="GET",
+            node=None,
+            endpoint="/calendars/events/",
+            token_data=self.get_token_data(),
+            api=self.api,
+            api_type="EDGE",
+            target_class=CalendarEvent,
+            response_parser=ObjectParser,
+        )
+        params = {
+            "locationId": self["id"],
+            "startTime": start_ms,
+            "endTime": end_ms,
+            scope_param: scope_id,
+        }
+        request.add_params(params)
+
+        return request.execute()
+
     def get_users(self):
         request = HighLevelRequest(
             method="GET",
@@ -178,6 +398,72 @@ class Location(AbstractObject):
 
         return request.execute()
 
+    def create_contact(self, data):
+        """
+        Creates a contact in the location. Creates are not retried by the client.
+
+        Returns:
+            A Contact Object holding the response (an awaitable with an async client)
+        """
+        return self._write("POST", "/contacts", data, Contact)
+
+    def upsert_contact(self, data, idempotent=True):
+        """
+        Creates a contact, or updates the one with the same email or phone
+        (as set by the location's duplicate contact settings).
+
+        Args:
+            data : Contact fields.
+            idempotent (optional): False to send it once, without the client's retries.
+
+        Returns:
+            A Contact Object holding the response (an awaitable with an async client)
+        """
+        return self._write(
+            "POST", "/contacts/upsert", data, Contact, idempotent=idempotent
+        )
+
+    def create_opportunity(self, data):
+        """
+        Creates an opportunity in the location. Creates are not retried by the client.
+
+        Returns:
+            An Opportunity Object holding the response (an awaitable with an async client)
+        """
+        return self._write("POST", "/opportunities", data, Opportunity)
+
+    def upsert_opportunity(self, data, idempotent=True):
+        """
+        Creates an opportunity, or updates the one of the same contact in the
+        same pipeline.
+
+        Args:
+            data : Opportunity fields.
+            idempotent (optional): False to send it once, without the client's retries.
+
+        Returns:
+            An Opportunity Object holding the response (an awaitable with an async client)
+        """
+        return self._write(
+            "POST", "/opportunities/upsert", data, Opportunity, idempotent=idempotent
+        )
+
+    def _write(self, method, path, data, target_class, idempotent=None):
+        request = HighLevelRequest(
+            method=method,
+            node=None,
+            endpoint=path,
+            token_data=self.get_token_data(),
+            api=self.api,
+            api_type="NODE",
+            target_class=target_class,
+            response_parser=ObjectParser,
+            idempotent=idempotent,
+        )
+        request.add_params(dict(data, locationId=self["id"]))
+
+        return request.execute()
+
     def get_contact_appointments(self, contact_id):
         request = HighLevelRequest(
             method="GET",
@@ -192,6 +478,94 @@ class Location(AbstractObject):
 
         return request.execute()
 
+    def get_appointments_for_contacts(
+        self, contact_ids, concurrency=None, cache=None
+    ):
+        """
+        Fetches the appointments of many contacts, several at once, under the
+        client's rate limiter. See iter_appointments_for_contacts.
+
+        Returns:
+            dict: lists of Appointment objects by contact ID (an awaitable with
+            an async client).
+        """
+        appointments = self.iter_appointments_for_contacts(
+            contact_ids, concurrency, cache
+        )
+        if self.api.is_async:
+            return self._collect_async(appointments)
+        return dict(appointments)
+
+    def iter_appointments_for_contacts(
+        self, contact_ids, concurrency=None, cache=None
+    ):
+        """
+        Fetches the appointments of many contacts, several at once, under the
+        client's rate limiter, while `contact_ids` is still being read (it can
+        be a generator over a contacts cursor). Repeated IDs are fetched once.
+
+        Args:
+            contact_ids : Contact IDs (an iterable or, with an async client, an
+                async iterable).
+            concurrency (optional): Contacts at once,
+                HighLevelConfig.APPOINTMENT_WORKERS by default.
+            cache (optional): Mapping of contact ID to appointments, read before
+                fetching and filled after, to reuse results across calls. The
+                caller owns it, and decides how long its entries stay valid.
+
+        Returns:
+            An iterator of (contact ID, list of Appointment objects) tuples, in
+            the order of `contact_ids` (an async iterator, in completion order,
+            with an async client).
+        """
+        concurrency = concurrency or HighLevelConfig.APPOINTMENT_WORKERS
+        if cache is None:
+            cache = {}
+        if self.api.is_async:
+            return self._iter_appointments_async(contact_ids, concurrency, cache)
+
+        def fetch(contact_id):
+            if contact_id not in cache:
+                cache[contact_id] = list(self.get_contact_appointments(contact_id))
+            return contact_id, cache[contact_id]
+
+        return imap_bounded(fetch, self._unique(contact_ids), concurrency)
+
+    @staticmethod
+    def _unique(ids):
+        seen = set()
+        for id in ids:
+            if id not in seen:
+                seen.add(id)
+                yield id
+
+    async def _iter_appointments_async(self, contact_ids, concurrency, cache):
+        async def ids():
+            seen = set()
+            if hasattr(contact_ids, "__aiter__"):
+                async for id in contact_ids:
+                    if id not in seen:
+                        seen.add(id)
+                        yield id
+            else:
+                for id in self._unique(contact_ids):
+                    yield id
+
+        async def fetch(contact_id):
+            if contact_id not in cache:
+                cache[contact_id] = [
+                    appointment
+                    async for appointment in self.get_contact_appointments(contact_id)
+                ]
+            yield cache[contact_id]
+
+        async for contact_id, appointments in aflatmap_unordered(fetch, ids(), concurrency):
+            yield contact_id, appointments
+
+    @staticmethod
+    async def _collect_async(pairs):
+        return {key: value async for key, value in pairs}
+
     def get_pipelines(self):
         path = "/opportunities/pipelines"
 
@@ -213,7 +587,31 @@ class Location(AbstractObject):
 
         return request.execute()
 
-    def get_opportunities(self, limit=20):
+    def get_opportunities(self, limit=20, stream=False, shards=None):
+        """
+        Lists the location's opportunities, oldest first.
+
+        Args:
+            limit (optional): Records per page.
+            stream (optional): Parse each page incrementally, see Cursor.
+            shards (optional): Scan with this many cursors at once over disjoint
+                `createdAt` windows. Records then arrive in no particular order.
+
+        Returns:
+            A Cursor, or a ShardedScan when `shards` is set.
+        """
+        if shards:
+            if stream:
+                raise HighLevelError("Sharded scans can't stream pages")
+            return ShardedScan(
+                lambda start_after: self._get_opportunities(limit, start_after=start_after),
+                "createdAt",
+                shards,
+                is_async=self.api.is_async,
+            )
+        return self._get_opportunities(limit, stream=stream)
+
+    def _get_opportunities(self, limit, stream=False, start_after=None):
         path = "/opportunities/search"
 
         request = HighLevelRequest(
@@ -225,6 +623,7 @@ class Location(AbstractObject):
             api_type="EDGE",
             target_class=Opportunity,
             response_parser=ObjectParser,
+            stream=stream,
         )
 
         params = {
@@ -232,10 +631,106 @@ class Location(AbstractObject):
             "location_id": self["id"],
             "limit": limit,
         }
+        if start_after is not None:
+            params["startAfter"] = start_after
+        request.add_params(params)
+
+        return request.execute()
+
+    def search_contacts(self, filters=None, sort=None, page_limit=100, query=None):
+        """
+        Searches the location's contacts with server-side filters and sort
+        (POST /contacts/search), paginated through `searchAfter`.
+
+        Args:
+            filters (optional): List of filters, e.g.
+                [{"field": "dateUpdated", "operator": "range", "value": {"gte": ...}}].
+            sort (optional): List of sorts, e.g. [{"field": "dateUpdated", "direction": "asc"}].
+            page_limit (optional): Records per page.
+            query (optional): Free-text search.
+
+        Returns:
+            A Cursor of Contact objects.
+        """
+        request = HighLevelRequest(
+            method="POST",
+            node=None,
+            endpoint="/contacts/search",
+            token_data=self.get_token_data(),
+            api=self.api,
+            api_type="EDGE",
+            target_class=Contact,
+            response_parser=ObjectParser,
+            pagination=SearchAfterPagination(),
+            paginated=True,
+        )
+        params = {
+            "locationId": self["id"],
+            "pageLimit": page_limit,
+        }
+        if filters:
+            params["filters"] = filters
+        if sort:
+            params["sort"] = sort
+        if query:
+            params["query"] = query
         request.add_params(params)
 
         return request.execute()
 
+    def get_contacts_updated_since(self, updated_since=None, page_limit=100):
+        """
+        Lists the contacts updated at or after `updated_since`, least recently
+        updated first, filtered and sorted by the API.
+
+        Args:
+            updated_since (optional): ISO 8601 date or epoch milliseconds. All
+                contacts if None.
+            page_limit (optional): Records per page.
+
+        Returns:
+            A Cursor of Contact objects.
+        """
+        filters = None
+        if updated_since is not None:
+            filters = [
+                {
+                    "field": "dateUpdated",
+                    "operator": "range",
+                    "value": {"gte": updated_since},
+                }
+            ]
+        sort = [{"field": "dateUpdated", "direction": "asc"}]
+        return self.search_contacts(filters=filters, sort=sort, page_limit=page_limit)
+
+    def get_opportunities_updated_since(self, updated_since=None, limit=100, shards=None):
+        """
+        Lists the opportunities updated at or after `updated_since`.
+
+        This is a full scan, not an incremental fetch: the opportunities search
+        can't filter or sort by update date, so every page is fetched
+        (concurrently with `shards`) and filtered here, and the scan can't stop
+        early at the watermark.
+
+        Args:
+            updated_since (optional): ISO 8601 date or epoch milliseconds. All
+                opportunities if None.
+            limit (optional): Records per page.
+            shards (optional): Scan with this many cursors at once, see get_opportunities.
+
+        Returns:
+            An iterator of Opportunity objects.
+        """
+        opportunities = self.get_opportunities(limit=limit, shards=shards)
+        since = timestamp_ms(updated_since)
+        if since is None:
+            return iter(opportunities)
+        return (
+            opportunity
+            for opportunity in opportunities
+            if (timestamp_ms(opportunity.get("updatedAt")) or 0) >= since
+        )
+
     def get_calendar_event(self, event_id):
         path = f"/calendars/events/appointments/{event_id}"
 
@@ -267,7 +762,7 @@ class Location(AbstractObject):
             api_type="EDGE",
             target_class=Conversation,
             response_parser=ObjectParser,
-            custom_pagination_fn=paginate_conversations,
+            pagination=DatePagination(),
         )
 
         params = {
@@ -281,6 +776,32 @@ class Location(AbstractObject):
 
         return request.execute()
 
+    def iter_conversation_messages(self, concurrency=None, types=None, limit=100):
+        """
+        Fetches the messages of every conversation of the location, paging
+        through several conversations at once while the conversation pages
+        are still being fetched. All calls share the client's rate limiter.
+
+        Args:
+            concurrency (optional): Conversations paged at once, HighLevelConfig.MESSAGE_FANOUT_WORKERS by default.
+            types (optional): Message types to keep, e.g. ["TYPE_SMS", "TYPE_EMAIL"].
+            limit (optional): Records per page, for conversations and messages.
+
+        Returns:
+            An iterator of (Conversation, Message) tuples, in no particular
+            order (an async iterator with an async client). Messages of one
+            conversation keep their order.
+        """
+        concurrency = concurrency or HighLevelConfig.MESSAGE_FANOUT_WORKERS
+        conversations = self.get_conversations(limit=limit)
+
+        def messages(conversation):
+            return conversation.get_messages(limit=limit, types=types)
+
+        if self.api.is_async:
+            return aflatmap_unordered(messages, conversations, concurrency)
+        return iflatmap_unordered(messages, conversations, concurrency)
+
     def get_custom_fields(self):
         path = f"/locations/{self['id']}/customFields"
 
@@ -309,7 +830,7 @@ class Location(AbstractObject):
             api_type="EDGE",
             target_class=FormSubmission,
             response_parser=ObjectParser,
-            custom_pagination_fn=paginate_form_submissions,
+            pagination=PageNumberPagination(),
         )
 
         params = {
@@ -338,7 +859,7 @@ class Location(AbstractObject):
             api_type="EDGE",
             target_class=SurveySubmission,
             response_parser=ObjectParser,
-            custom_pagination_fn=paginate_form_submissions,
+            pagination=PageNumberPagination(),
         )
 
         params = {
@@ -357,8 +878,8 @@ class Location(AbstractObject):
 
 
 class SurveySubmission(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -368,8 +889,8 @@ class SurveySubmission(AbstractObject):
 
 class FormSubmission(AbstractObject):
 
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -378,16 +899,16 @@ class FormSubmission(AbstractObject):
 
 
 class CustomField(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         raise NotImplementedError("CustomField does not have an endpoint")
 
 
 class Appointment(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -396,8 +917,8 @@ class Appointment(AbstractObject):
 
 
 class Pipeline(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -406,8 +927,8 @@ class Pipeline(AbstractObject):
 
 
 class User(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data, id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data, id, api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -416,8 +937,8 @@ class User(AbstractObject):
 
 
 class Calendar(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -451,8 +972,8 @@ class Calendar(AbstractObject):
 
 
 class CalendarEvent(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -461,8 +982,8 @@ class CalendarEvent(AbstractObject):
 
 
 class Contact(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -470,7 +991,8 @@ class Contact(AbstractObject):
         return "/contacts/" + self["id"]
 
     def get_appointments(self):
-        contact_id = self["contact"]["id"]
+        # contacts from a cursor hold their fields, those from get_contact the response
+        contact_id = self["id"] if "id" in self else self["contact"]["id"]
 
         path = f"/contacts/{contact_id}/appointments"
 
@@ -489,8 +1011,8 @@ class Contact(AbstractObject):
 
 
 class Form(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -500,8 +1022,8 @@ class Form(AbstractObject):
 
 
 class Opportunity(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -512,8 +1034,8 @@ class Opportunity(AbstractObject):
 
 class Conversation(AbstractObject):
 
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -533,7 +1055,7 @@ class Conversation(AbstractObject):
             api_type="EDGE",
             target_class=Message,
             response_parser=ObjectParser,
-            custom_pagination_fn=paginate_messages,
+            pagination=MessagePagination(),
         )
 
         params = {
@@ -549,8 +1071,8 @@ class Conversation(AbstractObject):
 
 
 class Message(AbstractObject):
-    def __init__(self, token_data=None, id=None):
-        super().__init__(token_data=token_data, id=id)
+    def __init__(self, token_data=None, id=None, api=None):
+        super().__init__(token_data=token_data, id=id, api=api)
 
     def get_endpoint(self):
         if self["id"] is None:
@@ -0,0 +1,102 @@
+import threading
+
+from highlevel_sdk.config import HighLevelConfig
+
+
+class AdaptivePageSize(object):
+    """
+    Tunes the page size of a cursor from how its pages come back (additive
+    increase, multiplicative decrease).
+
+    The size doubles from the initial one until the first sign of trouble,
+    then grows by `step` per healthy page. A page that is slower than
+    `target_latency`, larger than `max_bytes`, needed retries (429, 5xx,
+    transport errors) or timed out halves it. Growth is also capped by the
+    latency and bytes per record observed, so locations with heavy records
+    settle on small pages and locations with tiny records on the maximum.
+    """
+
+    def __init__(
+        self,
+        initial=None,
+        minimum=None,
+        maximum=None,
+        target_latency=None,
+        max_bytes=None,
+        step=None,
+    ) -> None:
+        """
+        Args:
+            initial (optional): First page size, the cursor's `limit` by default.
+            minimum (optional): Smallest size, HighLevelConfig.PAGE_SIZE_MIN by default.
+            maximum (optional): Largest size the API accepts, HighLevelConfig.PAGE_SIZE_MAX by default.
+            target_latency (optional): Seconds a page may take, HighLevelConfig.PAGE_SIZE_TARGET_LATENCY by default.
+            max_bytes (optional): Body bytes a page may weigh, HighLevelConfig.PAGE_SIZE_MAX_BYTES by default.
+            step (optional): Records added per healthy page once past slow start.
+        """
+        self.minimum = minimum or HighLevelConfig.PAGE_SIZE_MIN
+        self.maximum = maximum or HighLevelConfig.PAGE_SIZE_MAX
+        self.target_latency = target_latency or HighLevelConfig.PAGE_SIZE_TARGET_LATENCY
+        self.max_bytes = max_bytes or HighLevelConfig.PAGE_SIZE_MAX_BYTES
+        self.step = step or max(1, self.minimum // 2)
+        self.size = None
+        self.slow_start = True
+        self._lock = threading.Lock()
+        if initial is not None:
+            self.reset(initial)
+
+    def reset(self, initial):
+        with self._lock:
+            self.size = self._clamp(int(initial))
+
+    def _clamp(self, size):
+        return max(self.minimum, min(self.maximum, size))
+
+    def observe(self, records, latency=None, response_bytes=None, retries=0):
+        """
+        Updates the size after a page came back.
+
+        Args:
+            records : Records the page held.
+            latency (optional): Seconds the page took on the wire, None if unknown (cached).
+            response_bytes (optional): Body size of the page.
+            retries (optional): Attempts retried before the page came back.
+
+        Returns:
+            int: the size of the next page.
+        """
+        with self._lock:
+            if retries or (latency is not None and latency > self.target_latency):
+                return self._decrease()
+            if response_bytes is not None and response_bytes > self.max_bytes:
+                return self._decrease()
+            if records < self.size:
+                # a short page is the last one, it says nothing about the size
+                return self.size
+            size = self.size * 2 if self.slow_start else self.size + self.step
+            if records:
+                # don't grow past what the observed per-record cost allows
+                if latency:
+                    size = min(size, int(self.target_latency * records / latency))
+                if response_bytes:
+                    size = min(size, int(self.max_bytes * records / response_bytes))
+            self.size = self._clamp(max(size, self.size))
+            return self.size
+
+    def on_timeout(self):
+        """
+        Shrinks the size after a page timed out.
+
+        Returns:
+            bool: True if the page can be retried smaller, False if already at the minimum.
+        """
+        with self._lock:
+            if self.size <= self.minimum:
+                return False
+            self._decrease()
+            return True
+
+    def _decrease(self):
+        self.slow_start = False
+        self.size = self._clamp(self.size // 2)
+        return self.size
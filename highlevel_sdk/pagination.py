@@ -0,0 +1,139 @@
+class PaginationStrategy(object):
+    """
+    How an endpoint pages: where the records of a page body are, and the
+    params of the next page. Strategies make no calls and hold no cursor
+    state; the Cursor fetches pages, parses records and moves its params, so
+    prefetch, retries, checkpoints, adaptive page sizes and instrumentation
+    apply to every strategy alike.
+
+    A page without records always ends the pagination.
+    """
+
+    # param holding the page size, None if it can't change between pages
+    size_key = "limit"
+    # whether pages can be parsed while they download (records in a top-level
+    # list, pagination in a block the streaming parser collects)
+    streamable = False
+
+    def records(self, body):
+        """
+        Returns the part of a page body holding its records, in the shape the
+        object parser takes (records in lists, metadata under skipped keys).
+        """
+        return body
+
+    def next_params(self, params, body, records):
+        """
+        Args:
+            params : Params of the page just fetched (read-only).
+            body : Decoded page body.
+            records : Parsed records of the page, never empty.
+
+        Returns:
+            dict: params to update for the next page, or None if this page was the last.
+        """
+        raise NotImplementedError
+
+
+class MetaPagination(PaginationStrategy):
+    """
+    `meta.startAfter` / `meta.startAfterId` keys, e.g. contacts and opportunities.
+    """
+
+    streamable = True
+
+    def next_params(self, params, body, records):
+        meta = body.get("meta")
+        if not meta or meta.get("nextPage") is None or meta.get("startAfter") is None:
+            return None
+        return {"startAfter": meta["startAfter"], "startAfterId": meta["startAfterId"]}
+
+
+class DatePagination(PaginationStrategy):
+    """
+    Keyed on a date of the last record, e.g. conversations by `lastMessageDate`,
+    sent back as `startAfterDate`. The collection must be sorted on that date.
+    """
+
+    def __init__(
+        self, date_key="lastMessageDate", param="startAfterDate", sort_param="sortBy"
+    ) -> None:
+        """
+        Args:
+            date_key (optional): Record field the collection is sorted on.
+            param (optional): Param taking the date of the last record.
+            sort_param (optional): Param that must be set for the order to hold.
+        """
+        self.date_key = date_key
+        self.param = param
+        self.sort_param = sort_param
+
+    def next_params(self, params, body, records):
+        if self.sort_param and not params.get(self.sort_param):
+            return None
+        return {self.param: records[-1].get(self.date_key)}
+
+
+class MessagePagination(PaginationStrategy):
+    """
+    `lastMessageId` / `nextPage` keys, e.g. the messages of a conversation.
+    They come nested with the records (`{"messages": {"messages": [...],
+    "lastMessageId": ..., "nextPage": ...}}`) or, in some responses, at the top
+    level next to a plain `messages` list.
+    """
+
+    def _block(self, body):
+        messages = body.get("messages")
+        return messages if isinstance(messages, dict) else body
+
+    def records(self, body):
+        messages = body.get("messages")
+        if isinstance(messages, dict):
+            return messages
+        return {"messages": messages or []}
+
+    def next_params(self, params, body, records):
+        block = self._block(body)
+        if not block.get("nextPage"):
+            return None
+        return {"lastMessageId": block.get("lastMessageId") or records[-1].get("id")}
+
+
+class PageNumberPagination(PaginationStrategy):
+    """
+    `meta.currentPage` / `meta.nextPage` keys, e.g. form and survey submissions.
+    Page numbers only hold for a fixed page size.
+    """
+
+    size_key = None
+
+    def __init__(self, records_key="submissions") -> None:
+        """
+        Args:
+            records_key (optional): Body key of the records list.
+        """
+        self.records_key = records_key
+
+    def records(self, body):
+        return {self.records_key: body.get(self.records_key) or []}
+
+    def next_params(self, params, body, records):
+        meta = body.get("meta")
+        if not meta or not meta.get("nextPage"):
+            return None
+        return {"page": int(meta.get("currentPage")) + 1}
+
+
+class SearchAfterPagination(PaginationStrategy):
+    """
+    POST searches (e.g. `/contacts/search`) returning the sort values of each
+    record as `searchAfter`, sent back with the next page. A short page is the last.
+    """
+
+    size_key = "pageLimit"
+
+    def next_params(self, params, body, records):
+        search_after = records[-1].get("searchAfter")
+        if not search_after or len(records) < int(params.get("pageLimit") or 0):
+            return None
+        return {"searchAfter": search_after}
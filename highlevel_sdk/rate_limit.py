@@ -0,0 +1,258 @@
+import asyncio
+import threading
+import time
+
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.exceptions import HighLevelRateLimitError
+
+
+class TokenBucket(object):
+    """
+    Token bucket for one location/token, kept in sync with the rate-limit
+    headers GoHighLevel returns on every response.
+    """
+
+    def __init__(self, capacity, interval, daily_limit=None) -> None:
+        """
+        Args:
+            capacity : Requests allowed per burst interval.
+            interval : Burst interval, in seconds.
+            daily_limit (optional): Requests allowed per day, if known.
+        """
+        self.capacity = float(capacity)
+        self.interval = float(interval)
+        self.tokens = float(capacity)
+        self.daily_limit = daily_limit
+        self.daily_remaining = daily_limit
+        # calls reserved whose response hasn't come back yet
+        self.in_flight = 0
+        self._probed_at = None
+        self._updated_at = time.monotonic()
+
+    def _refill(self, now):
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            rate = self.capacity / self.interval
+            self.tokens = min(self.capacity, self.tokens + elapsed * rate)
+        self._updated_at = now
+
+    def reserve(self, now):
+        """
+        Takes one token and returns how long the caller must wait before sending.
+        Tokens may go negative so concurrent callers queue up fairly.
+
+        Once the daily limit is spent calls are refused, but one call is let
+        through every RATE_LIMIT_DAILY_PROBE_INTERVAL so the server can report
+        a new daily window.
+        """
+        self._refill(now)
+        if self.daily_remaining is not None:
+            if self.daily_remaining > 0:
+                self.daily_remaining -= 1
+            elif (
+                self._probed_at is not None
+                and now - self._probed_at
+                < HighLevelConfig.RATE_LIMIT_DAILY_PROBE_INTERVAL
+            ):
+                raise HighLevelRateLimitError(
+                    "Daily GoHighLevel API limit exhausted", budget=self.budget()
+                )
+            else:
+                self._probed_at = now
+        self.in_flight += 1
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens * self.interval / self.capacity
+
+    def sync(
+        self,
+        now,
+        remaining=None,
+        capacity=None,
+        interval=None,
+        daily_remaining=None,
+        daily_limit=None,
+    ):
+        """
+        Aligns the bucket with the server's view, on each response. The server
+        is authoritative, but we never hand back tokens already reserved by
+        in-flight calls. The daily count is taken from the server less the
+        calls still in flight, so it recovers when the daily window rolls over.
+        """
+        self.release()
+        self._refill(now)
+        if capacity:
+            self.capacity = float(capacity)
+        if interval:
+            self.interval = float(interval)
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+        if daily_limit is not None:
+            self.daily_limit = daily_limit
+        if daily_remaining is not None:
+            self.daily_remaining = max(0, daily_remaining - self.in_flight)
+            if self.daily_remaining > 0:
+                self._probed_at = None
+            elif self._probed_at is None:
+                # spent: the next probe waits a full interval
+                self._probed_at = now
+
+    def release(self):
+        """
+        Marks a reserved call as done, whether it got a response or not.
+        """
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def drain(self, now):
+        """
+        Empties the bucket, e.g. after a 429.
+        """
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+    def budget(self):
+        return {
+            "tokens": max(self.tokens, 0.0),
+            "capacity": self.capacity,
+            "interval": self.interval,
+            "daily_remaining": self.daily_remaining,
+            "daily_limit": self.daily_limit,
+        }
+
+
+class RateLimiter(object):
+    """
+    Paces outgoing calls per location/token so concurrent cursors run as close
+    to the GoHighLevel limits as possible without going over them.
+    """
+
+    LIMIT_HEADER = "X-RateLimit-Max"
+    REMAINING_HEADER = "X-RateLimit-Remaining"
+    INTERVAL_HEADER = "X-RateLimit-Interval-Milliseconds"
+    DAILY_LIMIT_HEADER = "X-RateLimit-Limit-Daily"
+    DAILY_REMAINING_HEADER = "X-RateLimit-Daily-Remaining"
+    HEADERS = (
+        LIMIT_HEADER,
+        REMAINING_HEADER,
+        INTERVAL_HEADER,
+        DAILY_LIMIT_HEADER,
+        DAILY_REMAINING_HEADER,
+    )
+
+    def __init__(self, capacity=None, interval=None) -> None:
+        """
+        Args:
+            capacity (optional): Burst size assumed until the first response headers arrive.
+            interval (optional): Burst interval in seconds assumed until the first response.
+        """
+        self._capacity = capacity or HighLevelConfig.RATE_LIMIT_MAX
+        self._interval = interval or HighLevelConfig.RATE_LIMIT_INTERVAL
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(token_data):
+        """
+        Returns the bucket key for a token: limits apply per location, or per
+        company for agency tokens.
+        """
+        if not token_data:
+            return None
+        return (
+            token_data.get("locationId")
+            or token_data.get("companyId")
+            or token_data.get("access_token")
+        )
+
+    def _bucket(self, key):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self._capacity, self._interval)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _reserve(self, key):
+        with self._lock:
+            return self._bucket(key).reserve(time.monotonic())
+
+    def acquire(self, key):
+        """
+        Blocks until a call for this key may be sent.
+        """
+        wait = self._reserve(key)
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            except BaseException:
+                self.release(key)
+                raise
+
+    async def acquire_async(self, key):
+        """
+        Waits, without blocking the loop, until a call for this key may be sent.
+        """
+        wait = self._reserve(key)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                # cancelled or timed out while queued: the call is never sent
+                self.release(key)
+                raise
+
+    def release(self, key):
+        """
+        Marks a call for this key as done without a response, e.g. after a
+        transport error, so it no longer counts against the daily budget.
+        """
+        with self._lock:
+            self._bucket(key).release()
+
+    def update(self, key, headers, status_code=None):
+        """
+        Feeds a response's rate-limit headers back into the bucket for the key.
+        """
+        remaining = _int_header(headers, self.REMAINING_HEADER)
+        capacity = _int_header(headers, self.LIMIT_HEADER)
+        interval_ms = _int_header(headers, self.INTERVAL_HEADER)
+        daily_remaining = _int_header(headers, self.DAILY_REMAINING_HEADER)
+        daily_limit = _int_header(headers, self.DAILY_LIMIT_HEADER)
+
+        with self._lock:
+            bucket = self._bucket(key)
+            now = time.monotonic()
+            bucket.sync(
+                now,
+                remaining=remaining,
+                capacity=capacity,
+                interval=interval_ms / 1000.0 if interval_ms else None,
+                daily_remaining=daily_remaining,
+                daily_limit=daily_limit,
+            )
+            if status_code == 429:
+                bucket.drain(now)
+
+    def budget(self, key):
+        """
+        Returns the current budget for a key, so callers can plan their work.
+
+        Returns:
+            dict: tokens, capacity, interval, daily_remaining and daily_limit.
+        """
+        with self._lock:
+            bucket = self._bucket(key)
+            bucket._refill(time.monotonic())
+            return bucket.budget()
+
+
+def _int_header(headers, name):
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,174 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from highlevel_sdk.config import HighLevelConfig
+
+
+class RetryBudget(object):
+    """
+    Caps retries to a fraction of the calls made through a client, so a sick
+    upstream can't multiply the load we put on it.
+
+    Every call deposits `ratio` tokens and every retry withdraws one. A small
+    per-second allowance keeps low-traffic clients able to retry at all.
+    """
+
+    def __init__(self, ratio=0.2, min_per_second=1.0, max_tokens=None) -> None:
+        """
+        Args:
+            ratio (optional): Retries allowed per call made.
+            min_per_second (optional): Retries always allowed per second.
+            max_tokens (optional): Cap on the retries that can be saved up.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens if max_tokens is not None else 100.0
+        self._tokens = self.max_tokens
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(
+            self.max_tokens, self._tokens + elapsed * self.min_per_second
+        )
+
+    def deposit(self):
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self):
+        """
+        Returns:
+            bool: True if a retry may be made, False if the budget is spent.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def remaining(self):
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RetryPolicy(object):
+    """
+    Decides whether a failed call is retried and how long to wait first.
+
+    Idempotent requests are retried on transport errors and on the statuses in
+    `retry_statuses`, waiting for `Retry-After` when the server sends it and
+    for a decorrelated-jitter backoff otherwise. A call whose Retry-After is
+    longer than `max_delay` is not retried, as retrying sooner would only be
+    refused again. Retries draw from a per-client RetryBudget.
+    """
+
+    RETRY_STATUSES = (429, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def __init__(
+        self,
+        max_attempts=None,
+        base_delay=None,
+        max_delay=None,
+        retry_statuses=None,
+        budget=None,
+    ) -> None:
+        """
+        Args:
+            max_attempts (optional): Total attempts per call, including the first one.
+            base_delay (optional): Smallest backoff, in seconds.
+            max_delay (optional): Largest backoff, and longest Retry-After waited for
+                rather than giving up, in seconds.
+            retry_statuses (optional): HTTP statuses that are retried.
+            budget (optional): RetryBudget shared by every call using this policy.
+        """
+        self.max_attempts = max_attempts or HighLevelConfig.RETRY_MAX_ATTEMPTS
+        self.base_delay = base_delay or HighLevelConfig.RETRY_BASE_DELAY
+        self.max_delay = max_delay or HighLevelConfig.RETRY_MAX_DELAY
+        self.retry_statuses = tuple(retry_statuses or self.RETRY_STATUSES)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_idempotent(self, method, idempotent=None):
+        if idempotent is not None:
+            return idempotent
+        return method in self.IDEMPOTENT_METHODS
+
+    def record_call(self):
+        self.budget.deposit()
+
+    def should_retry(
+        self,
+        method,
+        attempt,
+        status_code=None,
+        exception=None,
+        idempotent=None,
+        headers=None,
+    ):
+        """
+        Args:
+            method : HTTP method of the call.
+            attempt : Number of attempts already made.
+            status_code (optional): Status of the failed attempt.
+            exception (optional): Transport error raised by the failed attempt.
+            idempotent (optional): Overrides the method-based idempotency check.
+            headers (optional): Headers of the failed attempt, for its Retry-After.
+
+        Returns:
+            bool: True if the call should be retried. Withdraws from the budget.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if not self.is_idempotent(method, idempotent):
+            return False
+        if exception is None and status_code not in self.retry_statuses:
+            return False
+        retry_after = parse_retry_after(headers)
+        if retry_after is not None and retry_after > self.max_delay:
+            return False
+        return self.budget.withdraw()
+
+    def backoff(self, previous_delay=None, headers=None):
+        """
+        Returns the seconds to wait before the next attempt: never less than
+        the server's Retry-After (should_retry refuses the ones over `max_delay`).
+        """
+        retry_after = parse_retry_after(headers)
+        if retry_after is not None:
+            return retry_after
+
+        # decorrelated jitter: sleep = min(cap, uniform(base, previous * 3))
+        previous_delay = previous_delay or self.base_delay
+        return min(self.max_delay, random.uniform(self.base_delay, previous_delay * 3))
+
+
+def parse_retry_after(headers):
+    """
+    Returns the Retry-After header in seconds, whether sent as seconds or as an HTTP date.
+    """
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,275 @@
+import asyncio
+import queue
+import threading
+import time
+
+from highlevel_sdk.client import Page
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.utils import timestamp_ms
+
+
+class _Window(object):
+    """
+    A range of creation dates scanned by one shard: [start, end), or from
+    `start` on when open-ended. `position` is the date of the last record
+    handed out.
+    """
+
+    def __init__(self, start, end, open_ended=False, cursor=None) -> None:
+        self.start = start
+        self.end = end
+        self.open_ended = open_ended
+        self.position = start
+        self.cursor = cursor
+
+    def remaining(self):
+        if self.position is None:
+            return 0
+        return self.end - self.position
+
+
+class ShardedScan(object):
+    """
+    Walks a `startAfter`-paginated collection ordered by creation date with
+    several cursors at once, each over a disjoint window of dates.
+
+    The first page gives the oldest date; the range up to the start of the scan
+    is cut into one window per shard, the last one open-ended. A shard that
+    runs out of work splits the busiest remaining window in two, so shards stay
+    busy however the records are spread over time. Records a cursor returns
+    outside its window (the overlap at a boundary) are dropped, so each record
+    is handed out once; records without a date, which any cursor may return,
+    are handed out by the first shard to see them. All calls go through the
+    client, under its rate limiter.
+
+    Pages are handed out as they arrive, not in date order. Iterate with `for`
+    (or `async for` with an async client).
+    """
+
+    def __init__(self, make_cursor, date_key, shards, is_async=False) -> None:
+        """
+        Args:
+            make_cursor : Callable returning a cursor seeded with a `startAfter`
+                timestamp (None for the start of the collection).
+            date_key : Record field holding the creation date, e.g. "dateAdded".
+            shards : Number of cursors running at once.
+            is_async (optional): Whether make_cursor returns AsyncCursors.
+        """
+        self._make_cursor = make_cursor
+        self._date_key = date_key
+        self.shards = max(1, int(shards))
+        self.is_async = is_async
+        self._lock = threading.Lock()
+        self._pending = []
+        self._active = []
+        self._pages = 0
+        # ids of the undated records handed out so far
+        self._undated = set()
+        self._min_split = HighLevelConfig.SHARD_MIN_SPAN_MS
+
+    def __iter__(self):
+        if self.is_async:
+            raise TypeError(
+                "ShardedScan over an async client must be consumed with `async for`"
+            )
+        for page in self.iter_pages():
+            yield from page.records
+
+    async def __aiter__(self):
+        async for page in self.iter_pages_async():
+            for record in page.records:
+                yield record
+
+    def _plan(self, first_cursor):
+        records = first_cursor._queue
+        lower = timestamp_ms(records[0].get(self._date_key)) if records else None
+        upper = int(time.time() * 1000)
+        total = (first_cursor.meta() or {}).get("total")
+        if lower is not None and total and len(records) > 1:
+            # assume the rest is spread like the first page; the last window is
+            # open-ended and windows are split as they go, so a bad guess only
+            # costs balance
+            last = timestamp_ms(records[-1].get(self._date_key))
+            if last is not None and last > lower:
+                # not worth a new cursor for less than a couple of pages
+                self._min_split = max(self._min_split, 2 * (last - lower))
+                estimate = lower + (last - lower) * int(total) // (len(records) - 1)
+                upper = min(upper, max(estimate, last + 1))
+        if (
+            lower is None
+            or lower >= upper
+            or self.shards == 1
+            or not first_cursor._has_next_page
+        ):
+            self._pending = [_Window(None, upper, True, first_cursor)]
+            return
+        step = max((upper - lower) // self.shards, 1)
+        bounds = [lower + step * i for i in range(self.shards)] + [upper]
+        windows = [
+            _Window(start, end)
+            for start, end in zip(bounds[:-1], bounds[1:])
+            if start < end
+        ]
+        windows[0].start = None
+        windows[0].position = lower
+        windows[0].cursor = first_cursor
+        windows[-1].open_ended = True
+        self._pending = windows
+
+    def _next_window(self, done=None):
+        """
+        Returns the next window to scan, splitting the active window with the
+        most dates left if none is pending, or None once nothing is left.
+        """
+        with self._lock:
+            if done is not None:
+                self._active.remove(done)
+            if self._pending:
+                window = self._pending.pop(0)
+            else:
+                window = None
+                busiest = max(self._active, key=_Window.remaining, default=None)
+                if busiest is not None and busiest.remaining() >= 2 * self._min_split:
+                    middle = busiest.position + busiest.remaining() // 2
+                    window = _Window(middle, busiest.end, busiest.open_ended)
+                    busiest.end = middle
+                    busiest.open_ended = False
+            if window is not None:
+                self._active.append(window)
+            return window
+
+    def _admit(self, window, records):
+        """
+        Returns the records of a page within a window, and whether the window
+        is exhausted.
+        """
+        admitted = []
+        with self._lock:
+            for record in records:
+                created = timestamp_ms(record.get(self._date_key))
+                if created is None:
+                    record_id = record.get("id")
+                    if record_id is None:
+                        # nothing to tell copies apart by: only the first window
+                        if window.start is None:
+                            admitted.append(record)
+                    elif record_id not in self._undated:
+                        self._undated.add(record_id)
+                        admitted.append(record)
+                    continue
+                if window.start is not None and created < window.start:
+                    continue
+                if created >= window.end and not window.open_ended:
+                    return admitted, True
+                window.position = max(window.position or created, created)
+                admitted.append(record)
+        return admitted, False
+
+    def _page(self, page, records):
+        with self._lock:
+            self._pages += 1
+            return Page(self._pages, records, page.headers, page.meta)
+
+    def _cursor_for(self, window):
+        cursor, window.cursor = window.cursor, None
+        if cursor is None:
+            # startAfter is exclusive, so seed it just before the window
+            cursor = self._make_cursor(window.start - 1)
+        return cursor
+
+    def iter_pages(self):
+        """
+        Yields the pages of every shard, as Page objects, in arrival order.
+        """
+        self._plan(self._make_cursor(None))
+        pages = queue.Queue(self.shards * 2)
+        stopped = threading.Event()
+
+        def put(item):
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def run():
+            try:
+                window = self._next_window()
+                while window is not None and not stopped.is_set():
+                    cursor = self._cursor_for(window)
+                    try:
+                        for page in cursor.iter_pages():
+                            records, exhausted = self._admit(window, page.records)
+                            if records:
+                                put(self._page(page, records))
+                            if exhausted or stopped.is_set():
+                                break
+                    finally:
+                        cursor.close()
+                    window = self._next_window(window)
+            except Exception as e:
+                put(e)
+            put(None)
+
+        workers = [
+            threading.Thread(target=run, name="highlevel-shard", daemon=True)
+            for _ in range(self.shards)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            running = len(workers)
+            while running:
+                item = pages.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+
+    async def iter_pages_async(self):
+        """
+        asyncio counterpart of iter_pages, yielding with ``async for``.
+        """
+        first_cursor = self._make_cursor(None)
+        await first_cursor.load_next_page()
+        self._plan(first_cursor)
+        pages = asyncio.Queue(self.shards * 2)
+
+        async def run():
+            try:
+                window = self._next_window()
+                while window is not None:
+                    cursor = self._cursor_for(window)
+                    try:
+                        async for page in cursor.iter_pages():
+                            records, exhausted = self._admit(window, page.records)
+                            if records:
+                                await pages.put(self._page(page, records))
+                            if exhausted:
+                                break
+                    finally:
+                        cursor.close()
+                    window = self._next_window(window)
+            except Exception as e:
+                await pages.put(e)
+            await pages.put(None)
+
+        tasks = [asyncio.ensure_future(run()) for _ in range(self.shards)]
+        try:
+            running = len(tasks)
+            while running:
+                item = await pages.get()
+                if item is None:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
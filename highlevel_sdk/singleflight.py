@@ -0,0 +1,95 @@
+import asyncio
+import threading
+
+
+class _Call(object):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _Flight(object):
+    def __init__(self, task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent identical calls: the first caller for a key runs the
+    call and every caller arriving while it is in flight gets its result (or
+    the same exception). Works for threads and for asyncio tasks.
+    """
+
+    def __init__(self, share=None) -> None:
+        """
+        Args:
+            share (optional): Applied to the result handed to each caller that
+                joined a call in flight, e.g. to give it its own copy.
+        """
+        self._share = share or (lambda result: result)
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, fn):
+        """
+        Runs `fn()` unless a call for `key` is already in flight, in which case
+        waits for it and returns its result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self._share(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key, fn):
+        """
+        Awaits `fn()` unless a call for `key` is already in flight on this loop,
+        in which case awaits that one instead.
+
+        The call runs in its own task: a caller that is cancelled (or times out)
+        stops waiting without cancelling it for the others. It is cancelled
+        only once every caller has stopped waiting.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        flight = self._flights.get(flight_key)
+        leader = flight is None
+        if leader:
+            flight = _Flight(loop.create_task(fn()))
+            self._flights[flight_key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(flight_key, flight))
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+                self._forget(flight_key, flight)
+        return result if leader else self._share(result)
+
+    def _forget(self, flight_key, flight):
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
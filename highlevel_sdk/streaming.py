@@ -0,0 +1,92 @@
+from highlevel_sdk.serialization import loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+
+
+def iter_records(fp, skip_keys=(), meta=None):
+    """
+    Incrementally parses a page body and yields each record of its top-level
+    collections as soon as the record is complete.
+
+    Args:
+        fp : File-like object with a read() method, e.g. a raw HTTP response.
+        skip_keys (optional): Top-level keys that hold metadata, not records.
+        meta (optional): dict filled with the values of `skip_keys` (e.g. `meta`)
+            as they are parsed. Complete once the generator is exhausted.
+
+    Yields:
+        dict: each record, in document order.
+
+    Without the optional ijson dependency the body is read and decoded whole.
+    """
+    if meta is None:
+        meta = {}
+
+    if ijson is None:
+        body = loads(fp.read())
+        for key, value in body.items():
+            if key in skip_keys:
+                meta[key] = value
+            elif isinstance(value, list):
+                yield from value
+            else:
+                yield value
+        return
+
+    key = None
+    in_list = False
+    builder = None
+    depth = 0
+    building_meta = False
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in _START_EVENTS:
+                depth += 1
+            elif event in _END_EVENTS:
+                depth -= 1
+            if depth == 0:
+                if building_meta:
+                    meta[key] = builder.value
+                else:
+                    yield builder.value
+                builder = None
+            continue
+
+        if prefix == "":
+            if event == "map_key":
+                key = value
+            continue
+
+        if prefix == key:
+            if event == "start_array" and key not in skip_keys:
+                in_list = True
+            elif event == "end_array" and in_list:
+                in_list = False
+            elif event in _START_EVENTS:
+                builder, depth = _start(event, value)
+                building_meta = key in skip_keys
+            elif key in skip_keys:
+                meta[key] = value
+            else:
+                yield value
+            continue
+
+        if in_list and prefix == key + ".item":
+            if event in _START_EVENTS:
+                builder, depth = _start(event, value)
+                building_meta = False
+            else:
+                yield value
+
+
+def _start(event, value):
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    return builder, 1
@@ -0,0 +1,15 @@
+"""
+Offline stand-ins for the GoHighLevel API, for benchmarks, load tests and CI.
+"""
+
+from highlevel_sdk.testing.fake_server import FakeHighLevelServer
+from highlevel_sdk.testing.synthetic import SyntheticDataset
+from highlevel_sdk.testing.transports import Cassette, RecordingAdapter, ReplayAdapter
+
+__all__ = [
+    "Cassette",
+    "FakeHighLevelServer",
+    "RecordingAdapter",
+    "ReplayAdapter",
+    "SyntheticDataset",
+]
@@ -0,0 +1,3 @@
+from highlevel_sdk.testing.fake_server import main
+
+main()
@@ -0,0 +1,731 @@
+import argparse
+import bisect
+import gzip
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from highlevel_sdk.instrumentation import template_path
+from highlevel_sdk.serialization import dumps, loads
+from highlevel_sdk.utils import timestamp_ms
+from highlevel_sdk.testing.synthetic import SyntheticDataset, make_id, parse_id
+from highlevel_sdk.testing.transports import Cassette
+
+TOKEN_PREFIX = "fake-token-"
+
+
+class _Window(object):
+    """
+    Fixed rate-limit window of one token.
+    """
+
+    def __init__(self, started_at) -> None:
+        self.started_at = started_at
+        self.used = 0
+        self.daily_used = 0
+
+
+class FakeHighLevelServer(object):
+    """
+    Local stand-in for the GoHighLevel API, serving synthetic (or recorded)
+    data with the real pagination contracts:
+
+        contacts, opportunities : `meta.startAfter` / `meta.startAfterId`
+        form / survey submissions : `meta.currentPage` / `meta.nextPage`
+        conversations : `startAfterDate`
+        messages : `lastMessageId` / `nextPage`
+
+    Every response carries `X-RateLimit-*` headers. Calls over the burst limit of
+    a token, and a `throttle_rate` share of all calls, are answered with a 429.
+
+    Usage:
+        with FakeHighLevelServer(SyntheticDataset(contacts=10000)) as server:
+            client = HighLevelClient(base_url=server.url)
+    """
+
+    def __init__(
+        self,
+        dataset=None,
+        datasets=None,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        jitter=0.0,
+        throttle_rate=0.0,
+        rate_limit=None,
+        rate_limit_interval=10.0,
+        daily_limit=200000,
+        gzip=False,
+        cassette=None,
+        seed=0,
+    ) -> None:
+        """
+        Args:
+            dataset (optional): SyntheticDataset served for unknown locations.
+            datasets (optional): More SyntheticDataset objects, served by location id.
+            host, port (optional): Bind address. Port 0 picks a free one.
+            latency (optional): Seconds added to every response.
+            jitter (optional): Up to this many extra random seconds per response.
+            throttle_rate (optional): Share of calls answered with a 429, 0 to 1.
+            rate_limit (optional): Calls allowed per token per interval. Unlimited if None.
+            rate_limit_interval (optional): Burst interval, in seconds.
+            daily_limit (optional): Calls allowed per token per day.
+            gzip (optional): gzip bodies for clients that accept it.
+            cassette (optional): Cassette or cassette path; recorded responses win
+                over synthetic ones.
+            seed (optional): Seed of the latency and throttling randomness.
+        """
+        self.dataset = dataset or SyntheticDataset()
+        self.datasets = {self.dataset.location_id: self.dataset}
+        for extra in datasets or ():
+            self.datasets[extra.location_id] = extra
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.rate_limit_interval = rate_limit_interval
+        self.daily_limit = daily_limit
+        self.gzip = gzip
+        if cassette is not None and not isinstance(cassette, Cassette):
+            cassette = Cassette(cassette)
+        self.cassette = cassette
+        self.stats = Counter()
+        # request and response body bytes as sent over the wire (compressed or not)
+        self.wire_bytes = Counter()
+        self._random = random.Random(seed)
+        self._windows = {}
+        self._expired = set()
+        self._refreshes = 0
+        self._updated_order = {}
+        # records created or changed through the write routes, by id
+        self.written = {}
+        self._upsert_ids = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        if self._thread is None:
+            # a short poll interval lets stop() return promptly
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                args=(0.05,),
+                name="fake-highlevel",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def serve_forever(self):
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.stop()
+
+    @property
+    def request_count(self):
+        return sum(self.stats.values())
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+            self.wire_bytes.clear()
+
+    def token_for(self, location_id, generation=0):
+        """
+        Returns the access token the server mints for a location.
+        """
+        token = TOKEN_PREFIX + location_id
+        return f"{token}.{generation}" if generation else token
+
+    def expire(self, access_token):
+        """
+        Makes the server answer calls made with `access_token` with a 401.
+        """
+        with self._lock:
+            self._expired.add(access_token)
+
+    def is_expired(self, authorization):
+        return bool(authorization) and authorization.split(" ")[-1] in self._expired
+
+    def dataset_for(self, location_id=None, authorization=None):
+        if location_id in self.datasets:
+            return self.datasets[location_id]
+        if authorization:
+            token = authorization.split(" ")[-1]
+            if token.startswith(TOKEN_PREFIX):
+                location_id = token[len(TOKEN_PREFIX) :].split(".")[0]
+                return self.datasets.get(location_id, self.dataset)
+        return self.dataset
+
+    # throttling
+
+    def admit(self, authorization):
+        """
+        Counts a call against its token.
+
+        Returns:
+            tuple: the rate-limit headers, and the Retry-After seconds if the
+            call must be answered with a 429 (None otherwise).
+        """
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(authorization)
+            if window is None or now - window.started_at >= self.rate_limit_interval:
+                daily_used = window.daily_used if window is not None else 0
+                window = self._windows[authorization] = _Window(now)
+                window.daily_used = daily_used
+            window.used += 1
+            window.daily_used += 1
+            throttled = (
+                self.throttle_rate and self._random.random() < self.throttle_rate
+            )
+            reset_in = self.rate_limit_interval - (now - window.started_at)
+
+        limit = self.rate_limit or 100
+        remaining = limit
+        if self.rate_limit is not None:
+            remaining = max(0, limit - window.used)
+        headers = {
+            "X-RateLimit-Max": str(limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Interval-Milliseconds": str(
+                int(self.rate_limit_interval * 1000)
+            ),
+            "X-RateLimit-Limit-Daily": str(self.daily_limit),
+            "X-RateLimit-Daily-Remaining": str(
+                max(0, self.daily_limit - window.daily_used)
+            ),
+        }
+        if self.rate_limit is not None and window.used > self.rate_limit:
+            return headers, max(1, math.ceil(reset_in))
+        if throttled:
+            return headers, 0
+        return headers, None
+
+    def delay(self):
+        seconds = self.latency
+        if self.jitter:
+            with self._lock:
+                seconds += self._random.random() * self.jitter
+        if seconds:
+            time.sleep(seconds)
+
+    # routes
+
+    def handle(self, method, path, query, body, headers):
+        """
+        Returns:
+            tuple: status code and JSON-serializable body of a call.
+        """
+        data = self.dataset_for(
+            query.get("locationId")
+            or query.get("location_id")
+            or body.get("locationId"),
+            headers.get("Authorization"),
+        )
+        for route_method, pattern, name in _ROUTES:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                return getattr(self, name)(data, query, body, *match.groups())
+        return 404, {"statusCode": 404, "message": f"Cannot {method} {path}"}
+
+    def _seek_page(self, data, query, total, key, record):
+        limit = int(query.get("limit", 20))
+        start = data.index_after(query.get("startAfter"))
+        end = min(total, start + limit)
+        records = [record(i) for i in range(start, end)]
+        has_next = end < total
+        meta = {
+            "total": total,
+            "currentPage": start // max(limit, 1) + 1,
+            "nextPage": start // max(limit, 1) + 2 if has_next else None,
+            "prevPage": start // max(limit, 1) or None,
+            "startAfter": data.added_at(end - 1) if records else None,
+            "startAfterId": records[-1]["id"] if records else None,
+        }
+        return 200, {key: records, "meta": meta}
+
+    def contacts(self, data, query, body):
+        return self._seek_page(data, query, data.contacts, "contacts", data.contact)
+
+    def _contacts_by_update(self, data):
+        # (dateUpdated, id, index) of every contact, built once per dataset version
+        with self._lock:
+            order = self._updated_order.get(data.location_id)
+            if order is not None and order[0] == data.version:
+                return order[1]
+        keys = []
+        for index in range(data.contacts):
+            contact = data.contact(index)
+            keys.append((timestamp_ms(contact["dateUpdated"]), contact["id"], index))
+        keys.sort()
+        with self._lock:
+            self._updated_order[data.location_id] = (data.version, keys)
+        return keys
+
+    def contacts_search(self, data, query, body):
+        """
+        POST /contacts/search, with `dateUpdated` range filters, sorted by
+        `dateUpdated` (or by creation when no sort is given) and paginated with
+        `searchAfter`.
+        """
+        limit = int(body.get("pageLimit", 20))
+        by_update = any(
+            sort.get("field") == "dateUpdated" for sort in body.get("sort") or []
+        )
+        if by_update:
+            keys = self._contacts_by_update(data)
+        else:
+            keys = [
+                (data.added_at(index), make_id("contact", index), index)
+                for index in range(data.contacts)
+            ]
+        low, high = 0, len(keys)
+        for flt in body.get("filters") or []:
+            if flt.get("field") != "dateUpdated" or not by_update:
+                raise ValueError(
+                    "Only dateUpdated filters are supported, sorted by dateUpdated"
+                )
+            bounds = flt.get("value") or {}
+            for op, value in bounds.items():
+                ms = timestamp_ms(value)
+                if op == "gt":
+                    low = max(low, bisect.bisect_right(keys, (ms, "\uffff")))
+                elif op == "gte":
+                    low = max(low, bisect.bisect_left(keys, (ms,)))
+                elif op == "lt":
+                    high = min(high, bisect.bisect_left(keys, (ms,)))
+                elif op == "lte":
+                    high = min(high, bisect.bisect_right(keys, (ms, "\uffff")))
+        total = max(0, high - low)
+        search_after = body.get("searchAfter")
+        if search_after:
+            low = max(
+                low, bisect.bisect_right(keys, tuple(search_after) + (float("inf"),))
+            )
+        contacts = []
+        for key, contact_id, index in keys[low : min(high, low + limit)]:
+            contact = data.contact(index)
+            contact["searchAfter"] = [key, contact_id]
+            contacts.append(contact)
+        return 200, {"contacts": contacts, "total": total}
+
+    def contact(self, data, query, body, contact_id):
+        index = parse_id("contact", contact_id)
+        if index is None or index >= data.contacts:
+            return 400, {"statusCode": 400, "message": "Contact not found"}
+        return 200, {"contact": data.contact(index)}
+
+    def contact_appointments(self, data, query, body, contact_id):
+        index = parse_id("contact", contact_id)
+        if index is None or index >= data.contacts:
+            return 200, {"events": []}
+        day = 86400000
+        events = []
+        for n in range(2):
+            start = data.added_at(index) + (n + 1) * day
+            # the first event of the day, so each contact has two
+            event = next(data.events(start, start + day), None)
+            if event is not None:
+                events.append(dict(event, contactId=contact_id))
+        return 200, {"events": events}
+
+    def opportunities(self, data, query, body):
+        return self._seek_page(
+            data, query, data.opportunities, "opportunities", data.opportunity
+        )
+
+    def opportunity(self, data, query, body, opportunity_id):
+        index = parse_id("opportunity", opportunity_id)
+        if index is None or index >= data.opportunities:
+            return 400, {"statusCode": 400, "message": "Opportunity not found"}
+        return 200, {"opportunity": data.opportunity(index)}
+
+    def pipelines(self, data, query, body):
+        return 200, {"pipelines": data.pipelines()}
+
+    def conversations(self, data, query, body):
+        limit = int(query.get("limit", 20))
+        start = data.index_before(query.get("startAfterDate"))
+        end = min(data.conversations, start + limit)
+        return 200, {
+            "conversations": [data.conversation(i) for i in range(start, end)],
+            "total": data.conversations,
+        }
+
+    def messages(self, data, query, body, conversation_id):
+        index = parse_id("conversation", conversation_id)
+        if index is None or index >= data.conversations:
+            return 400, {"statusCode": 400, "message": "Conversation not found"}
+        limit = int(query.get("limit", 20))
+        total = data.messages_per_conversation
+        start = 0
+        if query.get("lastMessageId"):
+            last = parse_id("message", query["lastMessageId"])
+            start = last - index * total + 1 if last is not None else total
+        types = query.get("type")
+        messages = []
+        position = start
+        while position < total and len(messages) < limit:
+            message = data.message(index, position)
+            if not types or message["messageType"] in types.split(","):
+                messages.append(message)
+            position += 1
+        return 200, {
+            "messages": {
+                "lastMessageId": make_id("message", index * total + position - 1),
+                "nextPage": position < total,
+                "messages": messages,
+            }
+        }
+
+    def submissions(self, data, query, body):
+        limit = int(query.get("limit", 20))
+        page = int(query.get("page", 1))
+        start = (page - 1) * limit
+        end = min(data.form_submissions, start + limit)
+        return 200, {
+            "submissions": [data.submission(i) for i in range(start, end)],
+            "meta": {
+                "total": data.form_submissions,
+                "currentPage": page,
+                "nextPage": page + 1 if end < data.form_submissions else None,
+                "prevPage": page - 1 or None,
+            },
+        }
+
+    def users(self, data, query, body):
+        return 200, {"users": [data.user(i) for i in range(data.users)]}
+
+    def calendars(self, data, query, body):
+        return 200, {"calendars": [data.calendar(i) for i in range(data.calendars)]}
+
+    def events(self, data, query, body):
+        events = data.events(int(query["startTime"]), int(query["endTime"]))
+        calendar_id = query.get("calendarId")
+        user_id = query.get("userId")
+        return 200, {
+            "events": [
+                event
+                for event in events
+                if (not calendar_id or event["calendarId"] == calendar_id)
+                and (not user_id or event["assignedUserId"] == user_id)
+            ]
+        }
+
+    # writes, kept in `written` (listings keep serving the synthetic records)
+
+    def _stored(self, data, kind, record_id):
+        with self._lock:
+            record = self.written.get(record_id)
+        if record is not None:
+            return dict(record)
+        index = parse_id(kind, record_id)
+        total = data.contacts if kind == "contact" else data.opportunities
+        if index is None or index >= total:
+            return None
+        return getattr(data, kind)(index)
+
+    def _store(self, data, kind, record, key=None):
+        with self._lock:
+            if "id" not in record:
+                if key is not None and key in self._upsert_ids:
+                    record["id"] = self._upsert_ids[key]
+                else:
+                    count = data.contacts if kind == "contact" else data.opportunities
+                    record["id"] = make_id(kind, count + len(self.written))
+            if key is not None:
+                self._upsert_ids[key] = record["id"]
+            self.written[record["id"]] = record
+        return record
+
+    def _create(self, data, kind, body):
+        record = self._store(data, kind, dict(body, locationId=data.location_id))
+        return 201, {kind: record}
+
+    def _update(self, data, kind, body, record_id):
+        record = self._stored(data, kind, record_id)
+        if record is None:
+            return 400, {"statusCode": 400, "message": f"{kind.title()} not found"}
+        record.update(body)
+        return 200, {kind: self._store(data, kind, record), "succeded": True}
+
+    def _upsert(self, data, kind, body, key):
+        with self._lock:
+            record_id = self._upsert_ids.get(key)
+        record = self._stored(data, kind, record_id) if record_id else None
+        new = record is None
+        record = dict(record or {}, **body)
+        record = self._store(data, kind, record, key)
+        return (201 if new else 200), {"new": new, kind: record}
+
+    def contact_create(self, data, query, body):
+        return self._create(data, "contact", body)
+
+    def contact_update(self, data, query, body, contact_id):
+        return self._update(data, "contact", body, contact_id)
+
+    def contact_upsert(self, data, query, body):
+        if body.get("email"):
+            key = ("email", body["email"].strip().lower())
+        elif body.get("phone"):
+            key = ("phone", body["phone"])
+        else:
+            return 422, {"statusCode": 422, "message": "email or phone is required"}
+        return self._upsert(data, "contact", body, key)
+
+    def opportunity_create(self, data, query, body):
+        return self._create(data, "opportunity", body)
+
+    def opportunity_update(self, data, query, body, opportunity_id):
+        return self._update(data, "opportunity", body, opportunity_id)
+
+    def opportunity_upsert(self, data, query, body):
+        key = ("pipeline", body["pipelineId"], body["contactId"])
+        return self._upsert(data, "opportunity", body, key)
+
+    def location(self, data, query, body, location_id):
+        data = self.dataset_for(location_id)
+        return 200, {"location": data.location()}
+
+    def locations(self, data, query, body):
+        return 200, {"locations": [d.location() for d in self.datasets.values()]}
+
+    def custom_fields(self, data, query, body, location_id):
+        data = self.dataset_for(location_id)
+        return 200, {
+            "customFields": [data.custom_field(i) for i in range(data.custom_fields)]
+        }
+
+    def custom_values(self, data, query, body, location_id):
+        data = self.dataset_for(location_id)
+        return 200, {
+            "customValues": [data.custom_value(i) for i in range(data.custom_fields)]
+        }
+
+    def oauth_token(self, data, query, body):
+        refresh = body.get("refresh_token") or ""
+        if body.get("grant_type") != "refresh_token" or not refresh.startswith(
+            "refresh-"
+        ):
+            return 401, {"error": "invalid_grant"}
+        location_id = refresh[len("refresh-") :].split(".")[0]
+        with self._lock:
+            self._refreshes += 1
+            generation = self._refreshes
+        return 200, {
+            "access_token": self.token_for(location_id, generation),
+            "refresh_token": f"refresh-{location_id}.{generation}",
+            "token_type": "Bearer",
+            "expires_in": 86399,
+            "userType": "Location",
+            "locationId": location_id,
+        }
+
+    def location_token(self, data, query, body):
+        location_id = body.get("locationId")
+        if not location_id:
+            return 400, {"statusCode": 400, "message": "locationId is required"}
+        return 200, {
+            "access_token": self.token_for(location_id),
+            "token_type": "Bearer",
+            "expires_in": 86399,
+            "scope": "contacts.readonly",
+            "userType": "Location",
+            "locationId": location_id,
+            "companyId": body.get("companyId"),
+        }
+
+
+_ID = r"([^/]+)"
+_ROUTES = [
+    (method, re.compile("^" + pattern + "/?$"), name)
+    for method, pattern, name in (
+        ("GET", r"/contacts", "contacts"),
+        ("POST", r"/contacts", "contact_create"),
+        ("POST", r"/contacts/search", "contacts_search"),
+        ("POST", r"/contacts/upsert", "contact_upsert"),
+        ("PUT", rf"/contacts/{_ID}", "contact_update"),
+        ("GET", rf"/contacts/{_ID}/appointments", "contact_appointments"),
+        ("GET", rf"/contacts/{_ID}", "contact"),
+        ("GET", r"/opportunities/search", "opportunities"),
+        ("GET", r"/opportunities/pipelines", "pipelines"),
+        ("GET", rf"/opportunities/{_ID}", "opportunity"),
+        ("POST", r"/opportunities", "opportunity_create"),
+        ("POST", r"/opportunities/upsert", "opportunity_upsert"),
+        ("PUT", rf"/opportunities/{_ID}", "opportunity_update"),
+        ("GET", r"/conversations/search", "conversations"),
+        ("GET", rf"/conversations/{_ID}/messages", "messages"),
+        ("GET", r"/forms/submissions", "submissions"),
+        ("GET", r"/surveys/submissions", "submissions"),
+        ("GET", r"/users", "users"),
+        ("GET", r"/calendars/events", "events"),
+        ("GET", r"/calendars", "calendars"),
+        ("GET", r"/locations/search", "locations"),
+        ("GET", rf"/locations/{_ID}/customFields", "custom_fields"),
+        ("GET", rf"/locations/{_ID}/customValues", "custom_values"),
+        ("GET", rf"/locations/{_ID}", "location"),
+        ("POST", r"/oauth/locationToken", "location_token"),
+        ("POST", r"/oauth/token", "oauth_token"),
+    )
+]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method):
+        fake = self.server.fake
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        sent_body = self.rfile.read(length) if length else b""
+        raw_body = sent_body
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw_body = gzip.decompress(sent_body)
+
+        with fake._lock:
+            fake.stats[(method, template_path(parts.path))] += 1
+            fake.wire_bytes["received"] += len(sent_body)
+        authorization = self.headers.get("Authorization")
+        rate_headers, retry_after = fake.admit(authorization)
+        fake.delay()
+
+        if fake.is_expired(authorization):
+            return self._respond(
+                401, dumps({"statusCode": 401, "message": "Invalid JWT"}), rate_headers
+            )
+
+        if retry_after is not None:
+            headers = dict(rate_headers, **{"Retry-After": str(retry_after)})
+            return self._respond(
+                429, dumps({"statusCode": 429, "message": "Too many requests"}), headers
+            )
+
+        if fake.cassette is not None:
+            found = fake.cassette.find(method, self.path, sent_body or None)
+            if found is not None:
+                status, headers, body = found
+                return self._respond(status, body, dict(headers, **rate_headers))
+
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        body = {}
+        if raw_body:
+            if "json" in (self.headers.get("Content-Type") or ""):
+                body = loads(raw_body)
+            else:
+                body = dict(parse_qsl(raw_body.decode("utf-8")))
+        try:
+            status, payload = fake.handle(method, parts.path, query, body, self.headers)
+        except (KeyError, ValueError) as e:
+            status, payload = 422, {"statusCode": 422, "message": str(e)}
+        self._respond(status, dumps(payload), rate_headers)
+
+    def _respond(self, status, body, headers):
+        headers = {
+            k: v
+            for k, v in headers.items()
+            if k.lower() not in ("content-length", "content-encoding")
+        }
+        headers.setdefault("Content-Type", "application/json; charset=utf-8")
+        if self.server.fake.gzip and "gzip" in (
+            self.headers.get("Accept-Encoding") or ""
+        ):
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        with self.server.fake._lock:
+            self.server.fake.wire_bytes["sent"] += len(body)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve a fake GoHighLevel API with synthetic data."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--contacts", type=int, default=10000)
+    parser.add_argument("--opportunities", type=int, default=10000)
+    parser.add_argument("--conversations", type=int, default=500)
+    parser.add_argument("--form-submissions", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--cassette", default=None)
+    args = parser.parse_args(argv)
+
+    dataset = SyntheticDataset(
+        contacts=args.contacts,
+        opportunities=args.opportunities,
+        conversations=args.conversations,
+        form_submissions=args.form_submissions,
+    )
+    server = FakeHighLevelServer(
+        dataset,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        gzip=args.gzip,
+        cassette=args.cassette,
+    )
+    print(f"Serving fake GoHighLevel API on {server.url} (GHL_API_BASE_URL)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
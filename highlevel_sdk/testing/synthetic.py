@@ -0,0 +1,324 @@
+import random
+from datetime import datetime, timezone
+
+# 2024-01-01T00:00:00Z, in milliseconds
+EPOCH_MS = 1704067200000
+# records are spaced one minute apart
+STEP_MS = 60 * 1000
+
+_PREFIXES = {
+    "contact": "ct",
+    "opportunity": "op",
+    "conversation": "cv",
+    "message": "ms",
+    "submission": "fs",
+    "user": "us",
+    "calendar": "cl",
+    "event": "ev",
+    "field": "cf",
+    "value": "vl",
+    "pipeline": "pp",
+    "stage": "st",
+}
+
+
+def make_id(kind, index):
+    """
+    Returns a 20 character id that encodes its record kind and index.
+    """
+    return "%s%018x" % (_PREFIXES[kind], index)
+
+
+def parse_id(kind, record_id):
+    """
+    Returns the index encoded in an id made by make_id, or None.
+    """
+    if not record_id or not record_id.startswith(_PREFIXES[kind]):
+        return None
+    try:
+        return int(record_id[2:], 16)
+    except ValueError:
+        return None
+
+
+def iso(ms):
+    return (
+        datetime.fromtimestamp(ms / 1000.0, tz=timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S.%f"
+        )[:-3]
+        + "Z"
+    )
+
+
+class SyntheticDataset(object):
+    """
+    Deterministic, lazily generated GoHighLevel data for one location.
+
+    Records are built from their index on demand, so millions of contacts cost
+    no memory until they are served. Contact i is added at
+    `EPOCH_MS + (i + 1) * STEP_MS`, which is also its `startAfter` cursor.
+    """
+
+    def __init__(
+        self,
+        location_id="loc0000000000000000",
+        contacts=1000,
+        opportunities=1000,
+        conversations=50,
+        messages_per_conversation=30,
+        form_submissions=100,
+        users=10,
+        calendars=3,
+        events_per_day=4,
+        custom_fields=20,
+        attributions=2,
+        seed=0,
+    ) -> None:
+        self.location_id = location_id
+        self.contacts = contacts
+        self.opportunities = opportunities
+        self.conversations = conversations
+        self.messages_per_conversation = messages_per_conversation
+        self.form_submissions = form_submissions
+        self.users = users
+        self.calendars = calendars
+        self.events_per_day = events_per_day
+        self.custom_fields = custom_fields
+        self.attributions = attributions
+        self.seed = seed
+        self.version = 0
+        self._touched = {}
+
+    def _rng(self, kind, index):
+        return random.Random("%s:%s:%s" % (self.seed, kind, index))
+
+    def touch(self, kind, index, updated_at):
+        """
+        Marks a contact or opportunity as updated at `updated_at` (epoch ms),
+        to exercise incremental syncs.
+        """
+        self._touched[(kind, index)] = updated_at
+        self.version += 1
+
+    # contacts and opportunities are ordered by creation time
+
+    def added_at(self, index):
+        return EPOCH_MS + (index + 1) * STEP_MS
+
+    def index_after(self, start_after):
+        """
+        Returns the index of the first record added after a `startAfter` timestamp.
+        """
+        if start_after is None:
+            return 0
+        return max(0, (int(start_after) - EPOCH_MS) // STEP_MS)
+
+    def _attributions(self, rng, index):
+        return [
+            {
+                "medium": rng.choice(["facebook", "google", "organic", "email"]),
+                "utmSource": rng.choice(["fb", "google", "newsletter", None]),
+                "utmCampaign": "campaign-%d" % (index % 13),
+                "utmContent": "ad-%d" % rng.randint(1, 50),
+                "utmFbclid": "fbclid%012d" % rng.getrandbits(32),
+                "utmSessionSource": rng.choice(["Paid Social", "Direct traffic"]),
+                "url": "https://example.com/landing?c=%d" % index,
+                "isFirst": n == 0,
+            }
+            for n in range(self.attributions)
+        ]
+
+    def contact(self, index):
+        rng = self._rng("contact", index)
+        added = self.added_at(index)
+        return {
+            "id": make_id("contact", index),
+            "locationId": self.location_id,
+            "contactName": "contact %d" % index,
+            "firstName": "first%d" % index,
+            "lastName": "last%d" % index,
+            "email": "contact%d@example.com" % index,
+            "phone": "+1555%07d" % (index % 10000000),
+            "country": rng.choice(["US", "BR", "CA", "GB"]),
+            "source": rng.choice(["form", "import", "api", None]),
+            "type": "lead",
+            "dateAdded": iso(added),
+            "dateUpdated": iso(
+                self._touched.get(
+                    ("contact", index), added + rng.randint(0, 90) * 86400000
+                )
+            ),
+            "tags": rng.sample(["lead", "vip", "newsletter", "trial", "churned"], 2),
+            "customFields": [
+                {"id": make_id("field", f), "value": "value %d/%d" % (index, f)}
+                for f in range(self.custom_fields)
+            ],
+            "attributions": self._attributions(rng, index),
+        }
+
+    def opportunity(self, index):
+        rng = self._rng("opportunity", index)
+        added = self.added_at(index)
+        pipeline = index % 2
+        return {
+            "id": make_id("opportunity", index),
+            "name": "opportunity %d" % index,
+            "monetaryValue": rng.randint(0, 10000),
+            "pipelineId": make_id("pipeline", pipeline),
+            "pipelineStageId": make_id("stage", pipeline * 10 + index % 5),
+            "pipelineStageUId": make_id("stage", pipeline * 10 + index % 5),
+            "assignedTo": make_id("user", index % max(self.users, 1)),
+            "status": rng.choice(["open", "won", "lost", "abandoned"]),
+            "source": rng.choice(["form", "api", None]),
+            "contactId": make_id("contact", index % max(self.contacts, 1)),
+            "locationId": self.location_id,
+            "createdAt": iso(added),
+            "updatedAt": iso(
+                self._touched.get(
+                    ("opportunity", index), added + rng.randint(0, 90) * 86400000
+                )
+            ),
+            "lastStatusChangeAt": iso(added),
+            "lastStageChangeAt": iso(added),
+            "attributions": self._attributions(rng, index),
+        }
+
+    # conversations are ordered by last message, most recent first
+
+    def conversation_date(self, index):
+        return EPOCH_MS + (self.conversations - index) * STEP_MS
+
+    def index_before(self, start_after_date):
+        """
+        Returns the index of the first conversation older than `startAfterDate`.
+        """
+        if start_after_date is None:
+            return 0
+        return max(
+            0, self.conversations - (int(start_after_date) - EPOCH_MS) // STEP_MS + 1
+        )
+
+    def conversation(self, index):
+        return {
+            "id": make_id("conversation", index),
+            "locationId": self.location_id,
+            "contactId": make_id("contact", index % max(self.contacts, 1)),
+            "lastMessageDate": self.conversation_date(index),
+            "lastMessageType": "TYPE_SMS",
+            "unreadCount": 0,
+            "type": "TYPE_PHONE",
+        }
+
+    def message(self, conversation_index, index):
+        return {
+            "id": make_id(
+                "message", conversation_index * self.messages_per_conversation + index
+            ),
+            "conversationId": make_id("conversation", conversation_index),
+            "locationId": self.location_id,
+            "type": 2,
+            "messageType": "TYPE_SMS" if index % 3 else "TYPE_EMAIL",
+            "direction": "inbound" if index % 2 else "outbound",
+            "body": "message %d of conversation %d" % (index, conversation_index),
+            "dateAdded": iso(
+                self.conversation_date(conversation_index) - index * STEP_MS
+            ),
+        }
+
+    def submission(self, index):
+        return {
+            "id": make_id("submission", index),
+            "contactId": make_id("contact", index % max(self.contacts, 1)),
+            "formId": "form0000000000000001",
+            "name": "contact %d" % index,
+            "email": "contact%d@example.com" % index,
+            "createdAt": iso(self.added_at(index)),
+            "others": {"message": "hello %d" % index},
+        }
+
+    def user(self, index):
+        return {
+            "id": make_id("user", index),
+            "name": "user %d" % index,
+            "email": "user%d@example.com" % index,
+            "phone": "+1666%07d" % index,
+            "deleted": False,
+        }
+
+    def calendar(self, index):
+        return {
+            "id": make_id("calendar", index),
+            "locationId": self.location_id,
+            "name": "calendar %d" % index,
+        }
+
+    def events(self, start_ms, end_ms):
+        """
+        Returns the events starting in [start_ms, end_ms), `events_per_day` a day.
+        """
+        spacing = 86400000 // max(self.events_per_day, 1)
+        first = max(0, -(-(int(start_ms) - EPOCH_MS) // spacing))
+        index = first
+        while EPOCH_MS + index * spacing < int(end_ms):
+            start = EPOCH_MS + index * spacing
+            yield {
+                "id": make_id("event", index),
+                "calendarId": make_id("calendar", index % max(self.calendars, 1)),
+                "locationId": self.location_id,
+                "contactId": make_id("contact", index % max(self.contacts, 1)),
+                "assignedUserId": make_id("user", index % max(self.users, 1)),
+                "title": "event %d" % index,
+                "appointmentStatus": "confirmed",
+                "startTime": iso(start),
+                "endTime": iso(start + 30 * 60 * 1000),
+                "address": None,
+                "createdBy": {"userId": make_id("user", 0), "source": "api"},
+            }
+            index += 1
+
+    def custom_field(self, index):
+        return {
+            "id": make_id("field", index),
+            "name": "field %d" % index,
+            "fieldKey": "contact.field_%d" % index,
+            "dataType": "TEXT",
+            "position": index,
+            "placeholder": "",
+            "standard": False,
+        }
+
+    def custom_value(self, index):
+        return {
+            "id": make_id("value", index),
+            "name": "value %d" % index,
+            "fieldKey": "{{ custom_values.value_%d }}" % index,
+            "value": "v%d" % index,
+        }
+
+    def pipelines(self):
+        return [
+            {
+                "id": make_id("pipeline", p),
+                "name": "pipeline %d" % p,
+                "dateAdded": iso(EPOCH_MS),
+                "dateUpdated": iso(EPOCH_MS),
+                "stages": [
+                    {
+                        "id": make_id("stage", p * 10 + s),
+                        "name": "stage %d" % s,
+                        "position": s,
+                        "showInFunnel": True,
+                        "showInPieChart": True,
+                    }
+                    for s in range(5)
+                ],
+            }
+            for p in range(2)
+        ]
+
+    def location(self):
+        return {
+            "id": self.location_id,
+            "name": "synthetic location",
+            "timezone": "UTC",
+        }
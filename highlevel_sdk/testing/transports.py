@@ -0,0 +1,209 @@
+import base64
+import hashlib
+import json
+import threading
+from io import BytesIO
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+# fields of recorded JSON bodies that hold credentials
+REDACTED_KEYS = ("access_token", "refresh_token", "id_token")
+
+# response headers that no longer describe a recorded (decoded) body
+_DROPPED_HEADERS = (
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "set-cookie",
+)
+
+
+def request_key(method, url, body=None):
+    """
+    Returns the key a request is recorded and replayed under: method, path,
+    sorted query string and a digest of the body, if any.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    key = f"{method.upper()} {parts.path}"
+    if query:
+        key += "?" + query
+    if body:
+        if isinstance(body, str):
+            body = body.encode()
+        key += " " + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+def redact(body):
+    """
+    Masks credential fields of a JSON body, so cassettes can be committed.
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if not _redact(data):
+        return body
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _redact(data):
+    changed = False
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key in REDACTED_KEYS and isinstance(value, str):
+                data[key] = "redacted"
+                changed = True
+            else:
+                changed = _redact(value) or changed
+    elif isinstance(data, list):
+        for value in data:
+            changed = _redact(value) or changed
+    return changed
+
+
+class Cassette(object):
+    """
+    Recorded responses stored as JSON lines, one interaction per line.
+
+    Identical requests recorded several times are replayed in order; the last
+    recorded response is repeated once they run out. Authorization headers are
+    never stored and credential fields of bodies are masked.
+    """
+
+    def __init__(self, path=None) -> None:
+        self.path = path
+        self._interactions = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        if path is not None:
+            self.load(path)
+
+    def load(self, path):
+        try:
+            with open(path) as fp:
+                for line in fp:
+                    if line.strip():
+                        self._add(json.loads(line))
+        except FileNotFoundError:
+            pass
+
+    def _add(self, interaction):
+        self._interactions.setdefault(interaction["key"], []).append(interaction)
+
+    def __len__(self):
+        return sum(len(v) for v in self._interactions.values())
+
+    def record(self, method, url, request_body, status, headers, body):
+        body = redact(body)
+        interaction = {
+            "key": request_key(method, url, request_body),
+            "status": status,
+            "headers": {
+                k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS
+            },
+        }
+        try:
+            interaction["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["body_b64"] = base64.b64encode(body).decode("ascii")
+        with self._lock:
+            self._add(interaction)
+            if self.path is not None:
+                with open(self.path, "a") as fp:
+                    fp.write(json.dumps(interaction) + "\n")
+        return interaction
+
+    def find(self, method, url, request_body=None):
+        """
+        Returns the next recorded (status, headers, body) for a request, or None.
+        """
+        key = request_key(method, url, request_body)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            interaction = interactions[min(position, len(interactions) - 1)]
+        if "body_b64" in interaction:
+            body = base64.b64decode(interaction["body_b64"])
+        else:
+            body = interaction["body"].encode("utf-8")
+        return interaction["status"], dict(interaction["headers"]), body
+
+    def rewind(self):
+        with self._lock:
+            self._positions.clear()
+
+
+def raw_response(status, headers, body):
+    headers = dict(headers)
+    headers["Content-Length"] = str(len(body))
+    return HTTPResponse(
+        body=BytesIO(body),
+        headers=headers,
+        status=status,
+        preload_content=False,
+        decode_content=False,
+    )
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Transport adapter that forwards calls and appends every response to a
+    cassette. Mount it once against the real API to capture traffic:
+
+        client.mount(RecordingAdapter("contacts.jsonl"))
+    """
+
+    def __init__(self, path, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cassette = Cassette()
+        self.cassette.path = path
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        body = response.raw.read(decode_content=True)
+        response.raw.release_conn()
+        headers = dict(response.headers)
+        self.cassette.record(
+            request.method,
+            request.url,
+            request.body,
+            response.status_code,
+            headers,
+            body,
+        )
+        headers = {
+            k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS
+        }
+        return self.build_response(
+            request, raw_response(response.status_code, headers, body)
+        )
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter that answers calls from a cassette, without network.
+
+    Raises:
+        LookupError: for a request that was never recorded.
+    """
+
+    def __init__(self, path, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cassette = path if isinstance(path, Cassette) else Cassette(path)
+
+    def send(self, request, **kwargs):
+        found = self.cassette.find(request.method, request.url, request.body)
+        if found is None:
+            raise LookupError(
+                f"No recorded response for {request.method} {request.url}"
+            )
+        status, headers, body = found
+        return self.build_response(request, raw_response(status, headers, body))
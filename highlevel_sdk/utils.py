@@ -1,116 +1,174 @@
-def paginate_conversations(cursor):
+from datetime import datetime
+
+from highlevel_sdk.pagination import (
+    DatePagination,
+    MessagePagination,
+    MetaPagination,
+    PageNumberPagination,
+    SearchAfterPagination,
+)
+
+META_PAGINATION = MetaPagination()
+CONVERSATION_PAGINATION = DatePagination()
+MESSAGE_PAGINATION = MessagePagination()
+SUBMISSION_PAGINATION = PageNumberPagination()
+SEARCH_AFTER_PAGINATION = SearchAfterPagination()
+
+
+def apply_pagination(strategy, cursor, body):
     """
-    Custom Function to paginate through conversations. Overrides the load_next_page method in the Cursor class.
+    Parses the records of a page body into the cursor queue and moves the
+    cursor params to the next page, as told by a pagination strategy.
 
     Args:
-        cursor : Cursor object
+        strategy : PaginationStrategy of the endpoint
+        cursor : Cursor object (or a scratch copy of it)
+        body : decoded page body
 
     Returns:
-        list : list of conversations
+        bool : True if there is a next page, False otherwise.
     """
 
-    response = cursor._api._call(
-        method="GET",
-        path=cursor._path,
-        data=cursor._params,
-        token_data=cursor.token_data,
-    )
-
-    cursor._headers = response.headers
-
-    body = response.json()
     cursor._queue = cursor._object_parser.parse_multiple(
-        body, cursor._target_objects_class, cursor.token_data
+        strategy.records(body),
+        cursor._target_objects_class,
+        cursor.token_data,
+        cursor._api,
     )
     if not cursor._queue:
         return False
-
-    sort_by = cursor._params.get("sortBy")
-    if not sort_by:
+    params = strategy.next_params(cursor._params, body, cursor._queue)
+    if params is None:
         return False
-
-    cursor._params["startAfterDate"] = cursor._queue[-1].get("lastMessageDate")
+    cursor._params.update(params)
     return True
 
 
-def paginate_messages(cursor):
+def paginate_meta(cursor, body):
     """
-    Custom Function to paginate through messages. Overrides the load_next_page method in the Cursor class.
+    Default pagination through the `meta.startAfter` / `meta.startAfterId` keys.
 
     Args:
         cursor : Cursor object
+        body : decoded page body
 
     Returns:
-        list : list of messages
+        bool : True if there is a next page, False otherwise.
     """
 
-    response = cursor._api._call(
-        method="GET",
-        path=cursor._path,
-        data=cursor._params,
-        token_data=cursor.token_data,
-    )
+    return apply_pagination(META_PAGINATION, cursor, body)
 
-    cursor._headers = response.headers
 
-    body = response.json()
-    messages = body.get("messages")
-    if not messages:
-        return False
+def paginate_conversations(cursor, body):
+    """
+    Custom Function to paginate through conversations. Overrides the default pagination in the Cursor class.
 
-    cursor._queue = cursor._object_parser.parse_multiple(
-        messages, cursor._target_objects_class, cursor.token_data
-    )
+    Args:
+        cursor : Cursor object
+        body : decoded page body
 
-    next_page = messages.get("nextPage")
-    cursor._has_next_page = next_page
+    Returns:
+        bool : True if there is a next page, False otherwise.
+    """
 
-    last_message_id = messages.get("lastMessageId")
-    cursor._params["lastMessageId"] = last_message_id
+    return apply_pagination(CONVERSATION_PAGINATION, cursor, body)
 
-    if not cursor._has_next_page:
-        return False
-    return True
 
+def paginate_messages(cursor, body):
+    """
+    Custom Function to paginate through messages. Overrides the default pagination in the Cursor class.
+
+    Args:
+        cursor : Cursor object
+        body : decoded page body
+
+    Returns:
+        bool : True if there is a next page, False otherwise.
+    """
+
+    return apply_pagination(MESSAGE_PAGINATION, cursor, body)
 
-def paginate_form_submissions(cursor):
+
+def paginate_form_submissions(cursor, body):
     """
-    Custom Function to paginate through form submissions. Overrides the load_next_page method in the Cursor class.
+    Custom Function to paginate through form submissions. Overrides the default pagination in the Cursor class.
 
     Args:
         cursor : Cursor object
+        body : decoded page body
 
     Returns:
-        list : list of form submissions
+        bool : True if there is a next page, False otherwise.
+    """
+
+    return apply_pagination(SUBMISSION_PAGINATION, cursor, body)
+
+
+def paginate_search_after(cursor, body):
     """
+    Custom Function to paginate through POST searches (e.g. `/contacts/search`),
+    which return the sort values of each record as `searchAfter`. Overrides the default pagination in the Cursor class.
+
+    Args:
+        cursor : Cursor object
+        body : decoded page body
+
+    Returns:
+        bool : True if there is a next page, False otherwise.
+    """
+
+    return apply_pagination(SEARCH_AFTER_PAGINATION, cursor, body)
+
+
+# strategies behind the functions above, so cursors given one of them get
+# the strategy (streaming, adaptive page sizes) rather than an opaque function
+PAGINATION_STRATEGIES = {
+    paginate_meta: META_PAGINATION,
+    paginate_conversations: CONVERSATION_PAGINATION,
+    paginate_messages: MESSAGE_PAGINATION,
+    paginate_form_submissions: SUBMISSION_PAGINATION,
+    paginate_search_after: SEARCH_AFTER_PAGINATION,
+}
+
 
-    response = cursor._api._call(
-        method="GET",
-        path=cursor._path,
-        data=cursor._params,
-        token_data=cursor.token_data,
+def timestamp_ms(value):
+    """
+    Returns an API date (ISO 8601 string or epoch milliseconds) as epoch
+    milliseconds, or None.
+    """
+
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    return round(
+        datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000
     )
 
-    cursor._headers = response.headers
 
-    body = response.json()
-    form_submissions = body.get("submissions")
-    if not form_submissions:
-        return False
+def page_meta(body):
+    """
+    Returns the pagination details of a decoded page body: its `meta` block,
+    or else the scalar fields around the records (e.g. `total`, `nextPage`,
+    `lastMessageId`).
 
-    for obj in form_submissions:
-        cursor._queue.append(
-            cursor._object_parser.parse_single(
-                obj, cursor._target_objects_class, cursor.token_data
-            )
-        )
-    meta = body.get("meta")
-    next_page = meta.get("nextPage") if meta else False
-    cursor._has_next_page = next_page
+    Args:
+        body : decoded page body
 
-    page = meta.get("currentPage")
-    cursor._params["page"] = int(page) + 1
+    Returns:
+        dict : the page meta, empty if the page has none.
+    """
 
-    if not cursor._has_next_page:
-        return False
-    return True
+    meta = body.get("meta")
+    if isinstance(meta, dict):
+        return meta
+
+    meta = {}
+    for key, value in body.items():
+        if isinstance(value, dict):
+            meta.update(
+                (k, v) for k, v in value.items() if not isinstance(v, (dict, list))
+            )
+        elif not isinstance(value, list):
+            meta[key] = value
+    return meta
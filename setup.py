@@ -0,0 +1,34 @@
+from setuptools import find_packages, setup
+
+with open("requirements.txt") as requirements:
+    install_requires = [line.strip() for line in requirements if line.strip()]
+
+extras_require = {
+    # AsyncHighLevelClient and AsyncCursor
+    "async": ["aiohttp"],
+    # faster JSON decoding, and incremental parsing of streamed pages
+    "fast": ["orjson", "ijson"],
+    # brotli and zstd response bodies
+    "compression": ["urllib3[brotli,zstd]"],
+    "test": ["pytest"],
+}
+extras_require["all"] = sorted(
+    {
+        package
+        for name, packages in extras_require.items()
+        if name != "test"
+        for package in packages
+    }
+)
+
+setup(
+    name="gohighlevel-sdk",
+    version="0.1.0",
+    description="A Python SDK for interacting with the GoHighLevel API.",
+    long_description=open("README.md").read(),
+    long_description_content_type="text/markdown",
+    packages=find_packages(exclude=("tests", "tests.*", "benchmarks")),
+    python_requires=">=3.9",
+    install_requires=install_requires,
+    extras_require=extras_require,
+)
@@ -0,0 +1,46 @@
+import pytest
+
+from highlevel_sdk.client import AsyncHighLevelClient, HighLevelClient
+from highlevel_sdk.models import Location
+from highlevel_sdk.testing import FakeHighLevelServer, SyntheticDataset
+
+
+@pytest.fixture
+def dataset():
+    return SyntheticDataset(contacts=250, opportunities=120, custom_fields=2)
+
+
+@pytest.fixture
+def server(dataset):
+    with FakeHighLevelServer(dataset) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    client = HighLevelClient(base_url=server.url)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def location(client, dataset):
+    return Location(
+        token_data={"access_token": "token"}, id=dataset.location_id, api=client
+    )
+
+
+@pytest.fixture
+def async_location(server, dataset):
+    """
+    Builds a Location bound to an AsyncHighLevelClient; call it inside the
+    running loop, as aiohttp sessions belong to one.
+    """
+
+    def make():
+        client = AsyncHighLevelClient(base_url=server.url)
+        return Location(
+            token_data={"access_token": "token"}, id=dataset.location_id, api=client
+        )
+
+    return make
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from highlevel_sdk.testing import SyntheticDataset
+
+
+@pytest.fixture
+def dataset():
+    return SyntheticDataset(contacts=60)
+
+
+@pytest.fixture
+def contact_ids(location):
+    return [contact["id"] for contact in location.get_contacts(limit=100)]
+
+
+def test_fan_out_matches_per_contact_calls(location, contact_ids):
+    contact = location.get_contact(contact_ids[3])
+    serial = [a["id"] for a in contact.get_appointments()]
+    assert serial
+
+    result = location.get_appointments_for_contacts(contact_ids, concurrency=8)
+    assert list(result) == contact_ids
+    assert [a["id"] for a in result[contact_ids[3]]] == serial
+    assert all(
+        a["contactId"] == contact_id
+        for contact_id, appointments in result.items()
+        for a in appointments
+    )
+
+
+def test_repeated_ids_are_fetched_once(location, client, contact_ids):
+    paths = []
+    client.hooks.subscribe("on_response", lambda event: paths.append(event["path"]))
+
+    result = location.get_appointments_for_contacts(contact_ids + contact_ids[:10])
+    assert len(paths) == len(result) == len(contact_ids)
+
+    # nothing is kept between calls without a cache
+    paths.clear()
+    location.get_appointments_for_contacts(contact_ids[:5])
+    assert len(paths) == 5
+
+
+def test_a_cache_is_reused_across_calls(location, client, contact_ids):
+    cache = {}
+    location.get_appointments_for_contacts(contact_ids[:5], cache=cache)
+    assert sorted(cache) == sorted(contact_ids[:5])
+
+    paths = []
+    client.hooks.subscribe("on_response", lambda event: paths.append(event["path"]))
+    again = dict(
+        location.iter_appointments_for_contacts(iter(contact_ids[:5]), cache=cache)
+    )
+    assert not paths
+    assert again.keys() == set(contact_ids[:5])
+
+
+def test_async_fan_out_reads_an_async_iterable(async_location, dataset):
+    async def main():
+        location = async_location()
+        try:
+
+            async def ids():
+                async for contact in location.get_contacts(limit=100):
+                    yield contact["id"]
+
+            return [
+                contact_id
+                async for contact_id, _ in location.iter_appointments_for_contacts(
+                    ids(), concurrency=8
+                )
+            ]
+        finally:
+            await location.api.close()
+
+    ids = asyncio.run(main())
+    assert len(ids) == len(set(ids)) == dataset.contacts
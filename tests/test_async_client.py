@@ -0,0 +1,43 @@
+import asyncio
+
+from highlevel_sdk.client import AsyncCursor
+
+
+def test_async_client_pages_and_fetches(async_location, location, dataset):
+    async def main():
+        async_loc = async_location()
+        try:
+            cursor = async_loc.get_contacts(limit=40)
+            assert isinstance(cursor, AsyncCursor)
+            ids = [contact["id"] async for contact in cursor]
+            contact = await async_loc.get_contact(ids[0])
+            assert contact.api is async_loc.api
+            return ids, contact
+        finally:
+            await async_loc.api.close()
+
+    ids, contact = asyncio.run(main())
+    assert ids == [c["id"] for c in location.get_contacts(limit=40)]
+    assert len(ids) == dataset.contacts
+    assert contact["contact"]["id"] == ids[0]
+
+
+def test_async_client_runs_calls_concurrently(async_location, server, dataset):
+    server.latency = 0.3
+
+    async def main():
+        location = async_location()
+        try:
+            started = asyncio.get_running_loop().time()
+            contacts = await asyncio.gather(
+                *(location.get_contact(dataset.contact(i)["id"]) for i in range(10))
+            )
+            return contacts, asyncio.get_running_loop().time() - started
+        finally:
+            await location.api.close()
+
+    contacts, elapsed = asyncio.run(main())
+    assert [c["contact"]["id"] for c in contacts] == [
+        dataset.contact(i)["id"] for i in range(10)
+    ]
+    assert elapsed < 1.5
@@ -0,0 +1,126 @@
+import socket
+import time
+
+import pytest
+import requests
+
+from highlevel_sdk.auth import TokenManager, refresh_token
+
+
+@pytest.fixture
+def hanging_url():
+    # accepts connections and never answers
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    host, port = listener.getsockname()
+    yield f"http://{host}:{port}"
+    listener.close()
+
+
+def test_refresh_token_times_out_on_a_hanging_endpoint(hanging_url):
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.Timeout):
+        refresh_token("refresh", base_url=hanging_url, timeout=0.2)
+    assert time.monotonic() - started < 5
+
+
+def test_manager_refresh_uses_its_timeout(hanging_url):
+    manager = TokenManager(base_url=hanging_url, timeout=0.2)
+    token_data = manager.track(
+        {"access_token": "a", "refresh_token": "r", "locationId": "loc"}
+    )
+    with pytest.raises(requests.exceptions.Timeout):
+        manager.refresh(token_data)
+    assert token_data["access_token"] == "a"
+
+
+def rotating_manager():
+    generations = []
+
+    def refresh_fn(token_data):
+        generations.append(1)
+        return {"access_token": f"a{len(generations)}", "expires_in": 3600}
+
+    return TokenManager(refresh_fn=refresh_fn), generations
+
+
+def test_concurrent_refreshes_run_once():
+    manager, generations = rotating_manager()
+    token_data = manager.track({"access_token": "a0", "locationId": "loc"})
+    manager.refresh(token_data, "a0")
+    manager.refresh(token_data, "a0")
+    assert generations == [1]
+    assert token_data["access_token"] == "a1"
+
+
+def test_stale_copies_catch_up_with_the_shared_token():
+    manager, _ = rotating_manager()
+    shared = manager.track({"access_token": "a0", "locationId": "loc"})
+    stale = dict(shared)
+    manager.refresh(shared)
+    manager.prepare(stale)
+    assert stale["access_token"] == "a1"
+
+
+def test_only_the_last_superseded_token_is_kept():
+    manager, _ = rotating_manager()
+    token_data = manager.track({"access_token": "a0", "locationId": "loc"})
+    for _ in range(50):
+        manager.refresh(token_data)
+    assert token_data["access_token"] == "a50"
+    assert list(manager._superseded) == ["a49"]
+
+
+def test_an_older_copy_does_not_replace_a_refreshed_token():
+    manager, _ = rotating_manager()
+    token_data = manager.track(
+        {
+            "access_token": "a0",
+            "refresh_token": "r",
+            "locationId": "loc",
+            "expires_in": 60,
+        }
+    )
+    old = dict(token_data)
+    manager.refresh(token_data)
+    manager.refresh(token_data)
+    manager.prepare(old)
+    assert token_data["access_token"] == "a2"
+    assert old["access_token"] == "a2"
+
+
+def test_expiring_tokens_refresh_before_the_call():
+    manager, generations = rotating_manager()
+    token_data = manager.track(
+        {"access_token": "a0", "locationId": "loc", "expires_in": -1}
+    )
+    manager.prepare(token_data)
+    assert token_data["access_token"] == "a1"
+
+
+def test_unauthorized_calls_are_replayed_once_refreshed():
+    manager, _ = rotating_manager()
+    token_data = manager.track({"access_token": "a0", "locationId": "loc"})
+    assert manager.on_unauthorized(token_data, "a0")
+    assert TokenManager().on_unauthorized({"access_token": "x"}, "x") is False
+
+
+def test_distinct_tokens_for_one_location_stay_apart():
+    manager = TokenManager()
+    first = {"access_token": "A", "refresh_token": "rA", "locationId": "L"}
+    second = {"access_token": "B", "refresh_token": "rB", "locationId": "L"}
+    manager.prepare(first)
+    manager.prepare(second)
+    manager.prepare(first)
+    assert first == {"access_token": "A", "refresh_token": "rA", "locationId": "L"}
+    assert second == {"access_token": "B", "refresh_token": "rB", "locationId": "L"}
+    assert manager.track(dict(first)) is first
+
+
+def test_acquired_tokens_are_found_by_id():
+    manager = TokenManager()
+    token_data = manager.acquire("L", lambda: {"access_token": "A", "locationId": "L"})
+    assert manager.get("L") is token_data
+    manager.track({"access_token": "B", "locationId": "L"})
+    assert manager.get("L") is token_data
@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_suite(*args):
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_suite",
+            "--sizes",
+            "200",
+            "--repeat",
+            "1",
+            *args,
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+
+def test_suite_runs_every_case_and_compares_to_a_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    first = run_suite("--output", str(baseline))
+    assert first.returncode == 0, first.stderr
+    report = json.loads(baseline.read_text())
+    assert report["results"]
+    assert all(r["records"] > 0 and "peak_bytes" in r for r in report["results"])
+
+    # make the baseline ten times faster than anything this run can reach
+    for result in report["results"]:
+        result["records_per_second"] = result["records_per_second"] * 10
+    baseline.write_text(json.dumps(report))
+    second = run_suite("--no-memory", "--baseline", str(baseline))
+    assert second.returncode == 1
+    regressions = json.loads(second.stdout)["regressions"]
+    assert {r["name"] for r in regressions} == {r["name"] for r in report["results"]}
+
+
+def test_compression_benchmark_measures_the_wire():
+    from benchmarks.bench_compression import measure
+
+    results = measure(pages=2, limit=20, upserts=3, custom_fields=5, seed=0)["results"]
+    baseline, client = results["baseline"], results["client"]
+    # requests already asked for gzip, so pages cost the same
+    assert client["page_response_bytes"] == baseline["page_response_bytes"]
+    assert 0 < client["upsert_request_bytes"] < baseline["upsert_request_bytes"]
@@ -0,0 +1,141 @@
+import threading
+import time
+
+import pytest
+
+from highlevel_sdk.bulk import BulkWriter, write_key
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.models import Location
+from highlevel_sdk.retry import RetryBudget, RetryPolicy
+from highlevel_sdk.testing.synthetic import make_id
+
+
+def throttled_location(server, dataset, budget=None):
+    server.throttle_rate = 1.0
+    policy = RetryPolicy(max_attempts=4, base_delay=0.01, max_delay=0.01, budget=budget)
+    client = HighLevelClient(base_url=server.url, retry_policy=policy)
+    return Location(
+        token_data={"access_token": "token"}, id=dataset.location_id, api=client
+    )
+
+
+def test_write_key_picks_the_operation():
+    assert write_key("contacts", {"id": "c1"}) == ("update", ("id", "c1"))
+    assert write_key("contacts", {"email": " A@x.com"}) == (
+        "upsert",
+        ("email", "a@x.com"),
+    )
+    assert write_key("contacts", {"phone": "+1"}) == ("upsert", ("phone", "+1"))
+    assert write_key("opportunities", {"pipelineId": "p", "contactId": "c"}) == (
+        "upsert",
+        ("pipeline", "p", "c"),
+    )
+    assert write_key("opportunities", {"name": "x"}) == ("create", None)
+
+
+def test_writes_to_one_record_are_merged(location, server, dataset):
+    contact_id = make_id("contact", 3)
+    payloads = [
+        {"id": contact_id, "firstName": "A"},
+        {"id": contact_id, "lastName": "B"},
+        {"email": "new@x.com", "firstName": "C"},
+        {"email": "NEW@x.com", "lastName": "D"},
+        {"firstName": "no key"},
+    ]
+    results = list(BulkWriter(location).write(payloads))
+    assert [result.merged for result in results if result.key] == [2, 2]
+    assert all(result.ok for result in results)
+    assert server.written[contact_id]["firstName"] == "A"
+    assert server.written[contact_id]["lastName"] == "B"
+    assert server.request_count == 3
+
+
+def test_throttled_writes_are_not_retried_twice(server, dataset):
+    location = throttled_location(server, dataset)
+    writer = BulkWriter(location)
+    (result,) = writer.write([{"email": "a@x.com"}])
+    assert not result.ok and result.status == 429
+    assert result.attempts == 4
+    assert server.request_count == 4
+
+
+def test_write_retries_draw_from_the_retry_budget(server, dataset):
+    budget = RetryBudget(min_per_second=0, max_tokens=1)
+    location = throttled_location(server, dataset, budget=budget)
+    results = list(
+        BulkWriter(location).write([{"email": f"{i}@x.com"} for i in range(5)])
+    )
+    assert sum(result.attempts for result in results) <= 5 + 2
+    assert server.request_count == sum(result.attempts for result in results)
+
+
+def test_rejected_writes_are_not_retried(location):
+    (result,) = BulkWriter(location).write([{"id": "missing", "firstName": "x"}])
+    assert result.status == 400
+    assert result.attempts == 1
+
+
+def test_throttled_creates_are_retried(server, dataset):
+    location = throttled_location(server, dataset)
+    (result,) = BulkWriter(location).write([{"name": "no key"}], kind="opportunities")
+    assert result.operation == "create"
+    assert result.attempts == 4
+
+
+def test_write_behind_keeps_flushing_after_an_error(location, server):
+    seen = []
+
+    def on_result(result):
+        seen.append(result)
+        if len(seen) == 1:
+            raise ValueError("callback failed")
+
+    writer = BulkWriter(
+        location, batch_size=1, flush_interval=0.05, on_result=on_result
+    )
+    writer.put("contacts", {"email": "a@x.com"})
+    deadline = time.monotonic() + 5
+    while writer._error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    with pytest.raises(ValueError):
+        writer.put("contacts", {"email": "b@x.com"})
+
+    writer.put("contacts", {"email": "c@x.com"})
+    while len(seen) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(seen) == 2
+    writer.close()
+    assert writer.stats["ok"] == 2
+
+
+def test_bulk_writer_needs_a_sync_client(dataset):
+    from highlevel_sdk.client import AsyncHighLevelClient
+    from highlevel_sdk.exceptions import HighLevelError
+
+    location = Location(
+        token_data={"access_token": "token"},
+        id=dataset.location_id,
+        api=AsyncHighLevelClient(),
+    )
+    with pytest.raises(HighLevelError):
+        BulkWriter(location)
+
+
+def test_put_waits_for_room_in_the_queue(location):
+    writer = BulkWriter(location, batch_size=2, max_pending=4, flush_interval=60)
+    done = threading.Event()
+
+    def put_all():
+        for i in range(5):
+            writer.put("contacts", {"email": f"{i}@x.com"})
+        done.set()
+
+    # hold the flusher back so the queue fills up
+    with writer._send_lock:
+        thread = threading.Thread(target=put_all)
+        thread.start()
+        assert not done.wait(0.2)
+        assert len(writer._pending) == 4
+    assert done.wait(5)
+    writer.close()
+    assert writer.stats["ok"] == 5
@@ -0,0 +1,68 @@
+import time
+
+from highlevel_sdk.cache import (
+    CacheEntry,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+from highlevel_sdk.client import HighLevelClient
+
+
+def entry(body=b"{}", ttl=60):
+    return CacheEntry(body, {}, 200, time.time() + ttl)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", entry())
+    backend.set("b", entry())
+    backend.get("a")
+    backend.set("c", entry())
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.size() == (2, 4)
+
+
+def test_memory_backend_drops_expired_entries():
+    backend = MemoryCacheBackend()
+    backend.set("a", entry(ttl=-1))
+    assert backend.get("a") is None
+    assert backend.size() == (0, 0)
+
+
+def test_disk_backend_shares_entries_by_path(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    DiskCacheBackend(path).set("a", entry(b'{"x": 1}'))
+    assert DiskCacheBackend(path).get("a").body == b'{"x": 1}'
+
+
+def test_only_configured_get_paths_are_cached():
+    cache = ResponseCache()
+    assert cache.ttl_for("GET", "/users/") == 3600
+    assert cache.ttl_for("GET", "/contacts/") is None
+    assert cache.ttl_for("POST", "/users/") is None
+    assert ResponseCache(default_ttl=5).ttl_for("GET", "/contacts/") == 5
+
+
+def test_key_normalizes_params_and_hides_the_token():
+    key = ResponseCache.key("GET", "/users/", {"b": 1, "a": 2}, {"access_token": "t"})
+    assert key == ResponseCache.key(
+        "GET", "/users/", {"a": 2, "b": 1}, {"access_token": "t"}
+    )
+    assert "t}" not in key and " t" not in key
+
+
+def test_client_serves_repeated_reference_calls_from_cache(server, dataset):
+    cache = ResponseCache()
+    token_data = {"access_token": "token", "locationId": dataset.location_id}
+    with HighLevelClient(base_url=server.url, cache=cache) as client:
+        first = client._call(
+            "GET", "/users/", token_data, {"locationId": dataset.location_id}
+        )
+        second = client._call(
+            "GET", "/users/", token_data, {"locationId": dataset.location_id}
+        )
+    assert server.request_count == 1
+    assert second.json() == first.json()
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from highlevel_sdk.calendar_events import split_windows
+from highlevel_sdk.exceptions import HighLevelError
+from highlevel_sdk.testing import SyntheticDataset
+from highlevel_sdk.utils import timestamp_ms
+
+START, END = "2024-01-01T00:00:00Z", "2024-03-01T00:00:00Z"
+
+
+@pytest.fixture
+def dataset():
+    return SyntheticDataset(users=6, calendars=3, events_per_day=6)
+
+
+@pytest.fixture
+def expected(dataset):
+    return {e["id"] for e in dataset.events(timestamp_ms(START), timestamp_ms(END))}
+
+
+def test_split_windows_covers_the_range():
+    assert split_windows(0, 10, 4) == [(0, 4), (4, 8), (8, 10)]
+    assert split_windows(0, 8, 4) == [(0, 4), (4, 8)]
+
+
+def test_scan_spans_several_windows(location, expected):
+    ids = [e["id"] for e in location.get_calendar_events(START, END, window_days=7)]
+    assert len(ids) == len(expected)
+    assert set(ids) == expected
+
+
+def test_overlapping_scopes_return_each_event_once(location, expected):
+    users = [u["id"] for u in location.get_users()]
+    calendars = [c["id"] for c in location.get_calendars()]
+    ids = [
+        e["id"]
+        for e in location.get_calendar_events(
+            START, END, calendar_ids=calendars, user_ids=users, concurrency=4
+        )
+    ]
+    assert len(ids) == len(expected)
+    assert set(ids) == expected
+
+
+def test_scan_needs_start_before_end(location):
+    with pytest.raises(HighLevelError):
+        location.get_calendar_events(END, START)
+
+
+def test_async_scan_matches(async_location, expected):
+    async def main():
+        location = async_location()
+        try:
+            users = [u["id"] async for u in location.get_users()]
+            return [
+                e["id"]
+                async for e in location.get_calendar_events(START, END, user_ids=users)
+            ]
+        finally:
+            await location.api.close()
+
+    ids = asyncio.run(main())
+    assert len(ids) == len(expected)
+    assert set(ids) == expected
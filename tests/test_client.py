@@ -0,0 +1,54 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.models import Location
+
+
+def test_default_client_is_shared():
+    assert HighLevelClient.default() is HighLevelClient.default()
+    location = Location(token_data={"access_token": "token"}, id="location")
+    assert location.api is HighLevelClient.default()
+
+
+def test_headers_are_built_once_per_token(monkeypatch):
+    client = HighLevelClient()
+    headers = client.build_headers("a")
+    assert headers["Authorization"] == "Bearer a"
+    assert client.build_headers("a") is headers
+    assert client.build_headers("b") is not headers
+
+    monkeypatch.setattr(HighLevelConfig, "MAX_CACHED_HEADERS", 2)
+    client.build_headers("c")
+    assert client.build_headers("a") is not headers
+
+
+def test_objects_call_through_their_client(location, client, dataset):
+    contacts = list(location.get_contacts(limit=100))
+    assert len(contacts) == dataset.contacts
+    assert all(contact.api is client for contact in contacts)
+    contact = location.get_contact(contacts[0]["id"])
+    assert contact.api is client
+
+
+def test_connections_are_kept_alive(location, client, server):
+    server.reset_stats()
+    list(location.get_contacts(limit=20))
+    adapter = client._session.get_adapter(client.base_url)
+    pools = adapter.poolmanager.pools
+    assert len(pools) == 1
+    pool = pools[next(iter(pools.keys()))]
+    assert server.request_count > 1
+    assert pool.num_connections == 1
+
+
+def test_a_callers_session_is_left_as_configured():
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=5)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "identity"
+    client = HighLevelClient(session=session)
+    assert client._session is session
+    assert session.get_adapter("https://example.com") is adapter
+    assert session.headers["Accept-Encoding"] == "identity"
@@ -0,0 +1,42 @@
+import gzip
+
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.serialization import loads
+
+
+def test_only_large_bodies_are_gzipped(monkeypatch):
+    monkeypatch.setattr(HighLevelConfig, "REQUEST_COMPRESSION_MIN_BYTES", 100)
+    client = HighLevelClient(compress_requests=True)
+    headers = {"Content-Type": "application/json"}
+
+    body, sent_headers = client._encode_body({"id": "a"}, headers)
+    assert sent_headers is headers
+    assert loads(body) == {"id": "a"}
+
+    payload = {"notes": "x" * 500}
+    body, sent_headers = client._encode_body(payload, headers)
+    assert sent_headers["Content-Encoding"] == "gzip"
+    assert loads(gzip.decompress(body)) == payload
+    assert "Content-Encoding" not in headers
+
+
+def test_gzipped_responses_decode(location, server, dataset):
+    plain = [dict(c) for c in location.get_contacts(limit=50)]
+    server.gzip = True
+    assert [dict(c) for c in location.get_contacts(limit=50)] == plain
+    assert [dict(c) for c in location.get_contacts(limit=50, stream=True)] == plain
+    assert len(plain) == dataset.contacts
+
+
+def test_gzipped_requests_reach_the_server(server, dataset, monkeypatch):
+    monkeypatch.setattr(HighLevelConfig, "REQUEST_COMPRESSION_MIN_BYTES", 100)
+    with HighLevelClient(base_url=server.url, compress_requests=True) as client:
+        client._call(
+            "POST",
+            "/contacts/",
+            token_data={"access_token": "token"},
+            data={"locationId": dataset.location_id, "notes": "x" * 500},
+        )
+    (record,) = server.written.values()
+    assert record["notes"] == "x" * 500
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import pytest
+
+from highlevel_sdk.concurrency import (
+    aflatmap_unordered,
+    amap_bounded,
+    iflatmap_unordered,
+    imap_bounded,
+)
+
+
+def test_imap_bounded_keeps_order_and_reads_lazily():
+    consumed = []
+
+    def items():
+        for i in range(20):
+            consumed.append(i)
+            yield i
+
+    results = imap_bounded(lambda i: i * i, items(), max_workers=2)
+    assert next(results) == 0
+    assert len(consumed) <= 5
+    assert list(results) == [i * i for i in range(1, 20)]
+
+
+def test_amap_bounded_caps_concurrency():
+    running = []
+    peak = []
+
+    async def fn(item):
+        running.append(item)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(item)
+        return item
+
+    async def items():
+        for i in range(10):
+            yield i
+
+    assert asyncio.run(amap_bounded(fn, items(), 3)) == list(range(10))
+    assert max(peak) == 3
+
+
+def test_iflatmap_unordered_runs_items_concurrently():
+    def fn(item):
+        time.sleep(0.05)
+        yield from range(item)
+
+    started = time.monotonic()
+    results = list(iflatmap_unordered(fn, range(1, 9), max_workers=8))
+    assert time.monotonic() - started < 0.3
+    assert sorted(results) == sorted((i, j) for i in range(1, 9) for j in range(i))
+
+
+def test_iflatmap_unordered_raises_the_first_error():
+    def fn(item):
+        if item == 3:
+            raise ValueError(item)
+        yield item
+
+    with pytest.raises(ValueError):
+        list(iflatmap_unordered(fn, range(10), max_workers=2))
+
+
+def test_iflatmap_unordered_blocks_workers_on_a_full_buffer():
+    produced = []
+
+    def fn(item):
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    results = iflatmap_unordered(fn, range(4), max_workers=2, buffer=2)
+    next(results)
+    time.sleep(0.1)
+    # the buffer, one result in the consumer's hands and one per blocked worker
+    assert len(produced) <= 2 + 1 + 2
+    results.close()
+
+
+def test_aflatmap_unordered_yields_every_result():
+    async def fn(item):
+        for i in range(item):
+            await asyncio.sleep(0)
+            yield i
+
+    async def items():
+        for i in range(5):
+            yield i
+
+    async def main():
+        return [entry async for entry in aflatmap_unordered(fn, items(), 3)]
+
+    results = asyncio.run(main())
+    assert sorted(results) == sorted((i, j) for i in range(5) for j in range(i))
+
+
+def test_conversation_messages_fan_out(location, dataset):
+    pairs = list(location.iter_conversation_messages(concurrency=4, limit=50))
+    assert len(pairs) == dataset.conversations * dataset.messages_per_conversation
+    assert len({conversation["id"] for conversation, _ in pairs}) == (
+        dataset.conversations
+    )
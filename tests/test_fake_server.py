@@ -0,0 +1,50 @@
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.exceptions import HighLevelRequestException
+from highlevel_sdk.models import Location
+from highlevel_sdk.testing import ReplayAdapter, RecordingAdapter
+
+
+def test_responses_carry_rate_limit_headers(client, server, dataset):
+    response = client._call(
+        "GET", "/users/", {"access_token": "token"}, {"locationId": dataset.location_id}
+    )
+    assert response.headers["X-RateLimit-Max"]
+    assert int(response.headers["X-RateLimit-Daily-Remaining"]) < server.daily_limit
+
+
+def test_calls_over_the_burst_limit_are_throttled(server, dataset):
+    server.rate_limit = 2
+    client = HighLevelClient(base_url=server.url, rate_limiter=False)
+    statuses = []
+    for _ in range(3):
+        try:
+            client._call(
+                "GET",
+                "/users/",
+                {"access_token": "token"},
+                {"locationId": dataset.location_id},
+                idempotent=False,
+            )
+            statuses.append(200)
+        except HighLevelRequestException as e:
+            statuses.append(e.http_status())
+    assert statuses == [200, 200, 429]
+
+
+def test_cassettes_replay_recorded_calls(server, dataset, tmp_path):
+    path = str(tmp_path / "contacts.jsonl")
+    token_data = {"access_token": "secret-token"}
+
+    recording = HighLevelClient(base_url=server.url)
+    recording.mount(RecordingAdapter(path))
+    location = Location(token_data=token_data, id=dataset.location_id, api=recording)
+    recorded = [contact["id"] for contact in location.get_contacts(limit=100)]
+    recording.close()
+    assert "secret-token" not in open(path).read()
+
+    server.reset_stats()
+    replaying = HighLevelClient(base_url=server.url)
+    replaying.mount(ReplayAdapter(path))
+    location = Location(token_data=token_data, id=dataset.location_id, api=replaying)
+    assert [contact["id"] for contact in location.get_contacts(limit=100)] == recorded
+    assert server.request_count == 0
@@ -0,0 +1,68 @@
+import pytest
+
+from highlevel_sdk.api import endpoints
+from highlevel_sdk.checkpoint import SQLiteCheckpointStore
+from highlevel_sdk.utils import timestamp_ms
+
+
+@pytest.fixture
+def service(client, dataset, tmp_path):
+    return endpoints.GoHighLevelService(
+        token="token",
+        id_location=dataset.location_id,
+        client=client,
+        watermarks=SQLiteCheckpointStore(str(tmp_path / "watermarks.db")),
+    )
+
+
+def test_contacts_sync_downloads_only_the_changes(service, server, dataset):
+    snapshot = service.sync_contacts_dataframe()
+    assert len(snapshot) == dataset.contacts
+
+    watermark = timestamp_ms(service.watermarks.load("contacts:" + dataset.location_id))
+    dataset.touch("contact", 7, watermark + 1000)
+    server.reset_stats()
+    changed = service.sync_contacts_dataframe()
+    assert server.request_count == 1
+    assert dataset.contact(7)["id"] in set(changed["id"])
+
+    merged = service.merge_upserts(snapshot, changed)
+    assert len(merged) == dataset.contacts
+
+
+def test_opportunities_sync_filters_a_full_scan(service, location, server, dataset):
+    first = service.sync_opportunities_dataframe()
+    assert len(first) == dataset.opportunities
+
+    watermark = timestamp_ms(
+        service.watermarks.load("opportunities:" + dataset.location_id)
+    )
+    dataset.touch("opportunity", 3, watermark + 1000)
+    server.reset_stats()
+    changed = service.sync_opportunities_dataframe()
+    # every page is still downloaded
+    assert server.request_count > 1
+    assert dataset.opportunity(3)["id"] in set(changed["id"])
+    updated = location.get_opportunities_updated_since(watermark + 1)
+    assert [opportunity["id"] for opportunity in updated] == [
+        dataset.opportunity(3)["id"]
+    ]
+
+
+def test_commit_false_keeps_the_stored_watermark(service, dataset):
+    service.sync_contacts_dataframe(commit=False)
+    key = "contacts:" + dataset.location_id
+    assert service.watermarks.load(key) is None
+    service.commit_watermarks()
+    assert service.watermarks.load(key) is not None
+
+
+def test_failed_syncs_leave_the_watermark(service, dataset, monkeypatch):
+    def fail(self):
+        raise ValueError("bad frame")
+
+    monkeypatch.setattr(endpoints.DataFrameFormatter, "to_dataframe", fail)
+    assert service.sync_contacts_dataframe().empty
+    assert service.sync_opportunities_dataframe().empty
+    assert service.watermarks.load("contacts:" + dataset.location_id) is None
+    assert service.watermarks.load("opportunities:" + dataset.location_id) is None
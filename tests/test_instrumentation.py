@@ -0,0 +1,68 @@
+import logging
+
+import pytest
+
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.exceptions import HighLevelRequestException
+from highlevel_sdk.instrumentation import (
+    Hooks,
+    LoggingSubscriber,
+    MetricsRegistry,
+    template_path,
+)
+from highlevel_sdk.retry import RetryPolicy
+
+
+def test_template_path_replaces_ids():
+    assert template_path("/contacts/ve9EPM428h8vShlRW1KT") == "/contacts/{id}"
+    assert (
+        template_path("/contacts/12345/appointments") == "/contacts/{id}/appointments"
+    )
+    assert template_path("/contacts/search") == "/contacts/search"
+
+
+def test_hooks_reject_unknown_events():
+    with pytest.raises(ValueError):
+        Hooks().subscribe("on_anything", print)
+
+
+def test_client_emits_request_response_and_page_events(location, client, dataset):
+    events = {event: [] for event in Hooks.EVENTS}
+    for event, seen in events.items():
+        client.hooks.subscribe(event, seen.append)
+
+    assert len(list(location.get_contacts(limit=100))) == dataset.contacts
+    location.get_contact(dataset.contact(0)["id"])
+
+    assert len(events["on_request"]) == len(events["on_response"]) == 4
+    assert [e["records"] for e in events["on_page"]] == [100, 100, 50]
+    response = events["on_response"][-1]
+    assert response["path"] == "/contacts/{id}"
+    assert response["status"] == 200
+    assert response["response_bytes"] > 0
+    assert not events["on_retry"]
+
+
+def test_metrics_and_logs_count_retries(server, dataset, caplog):
+    server.throttle_rate = 1.0
+    registry = MetricsRegistry()
+    policy = RetryPolicy(max_attempts=2, base_delay=0.01, max_delay=0.01)
+    with HighLevelClient(base_url=server.url, retry_policy=policy) as client:
+        client.hooks.add_subscriber(registry)
+        client.hooks.add_subscriber(LoggingSubscriber(level=logging.INFO))
+        with caplog.at_level(logging.INFO, logger="highlevel_sdk"):
+            with pytest.raises(HighLevelRequestException):
+                client._call(
+                    "GET",
+                    "/contacts/",
+                    token_data={"access_token": "token"},
+                    data={"locationId": dataset.location_id},
+                )
+
+    metrics = registry.render()
+    assert 'highlevel_retries_total{method="GET",path="/contacts/"} 1' in metrics
+    assert (
+        'highlevel_requests_total{method="GET",path="/contacts/",status="429"} 1'
+        in metrics
+    )
+    assert any("retrying GET /contacts/" in r.message for r in caplog.records)
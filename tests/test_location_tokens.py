@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from highlevel_sdk.client import AsyncHighLevelClient, HighLevelClient
+from highlevel_sdk.models import Agency
+from highlevel_sdk.testing import FakeHighLevelServer, SyntheticDataset
+
+MINT = ("POST", "/oauth/locationToken")
+AGENCY_TOKEN = {"access_token": "agency", "companyId": "company"}
+
+
+@pytest.fixture
+def server():
+    datasets = [
+        SyntheticDataset(location_id=f"loc{i:016d}", contacts=5, opportunities=5)
+        for i in range(6)
+    ]
+    with FakeHighLevelServer(
+        datasets[0], datasets=datasets[1:], latency=0.05
+    ) as server:
+        yield server
+
+
+def test_location_tokens_are_minted_once_and_reused(server):
+    with HighLevelClient(base_url=server.url) as client:
+        agency = Agency(token_data=dict(AGENCY_TOKEN), id="company", api=client)
+        locations = agency.get_locations_with_tokens()
+        assert len(locations) == 6
+        agency.get_location_tokens([location["id"] for location in locations])
+    assert server.stats[MINT] == 6
+
+
+def test_async_mints_are_coalesced_and_refreshable(server):
+    location_id = "loc0000000000000003"
+
+    async def main():
+        async with AsyncHighLevelClient(base_url=server.url) as client:
+            agency = Agency(token_data=dict(AGENCY_TOKEN), id="company", api=client)
+            tokens = await asyncio.gather(
+                *(agency._get_location_token_async(location_id) for _ in range(5))
+            )
+            assert all(token is tokens[0] for token in tokens)
+            assert server.stats[MINT] == 1
+
+            # refreshes run off the loop and mint again through it
+            manager = client.token_manager
+            assert manager.can_refresh(tokens[0])
+            await asyncio.to_thread(manager.refresh, tokens[0], "stale")
+            await asyncio.to_thread(manager.refresh, tokens[0])
+            assert server.stats[MINT] == 2
+
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+from highlevel_sdk.page_size import AdaptivePageSize
+
+
+def sizer(**kwargs):
+    kwargs.setdefault("initial", 10)
+    return AdaptivePageSize(
+        minimum=5, maximum=100, target_latency=1.0, max_bytes=10000, **kwargs
+    )
+
+
+def test_slow_start_doubles_then_grows_by_step():
+    page_size = sizer(step=5)
+    assert page_size.observe(10, latency=0.01) == 20
+    assert page_size.observe(20, latency=0.01) == 40
+    assert page_size.observe(40, latency=2.0) == 20
+    assert page_size.observe(20, latency=0.01) == 25
+
+
+def test_retries_and_heavy_pages_halve_the_size():
+    page_size = sizer(initial=80)
+    assert page_size.observe(80, retries=1) == 40
+    assert page_size.observe(40, response_bytes=20000) == 20
+
+
+def test_short_pages_leave_the_size_alone():
+    page_size = sizer(initial=40)
+    assert page_size.observe(3, latency=0.01) == 40
+
+
+def test_growth_is_capped_by_the_cost_per_record():
+    page_size = sizer(initial=10)
+    # 1000 bytes a record: 10 records fit in max_bytes
+    assert page_size.observe(10, response_bytes=10000) == 10
+    # 0.05s a record: 20 records fit in the target latency
+    page_size = sizer(initial=10)
+    assert page_size.observe(10, latency=0.5) == 20
+
+
+def test_timeouts_shrink_down_to_the_minimum():
+    page_size = sizer(initial=20)
+    assert page_size.on_timeout()
+    assert page_size.on_timeout()
+    assert page_size.size == 5
+    assert not page_size.on_timeout()
+
+
+def test_adaptive_cursor_returns_every_record(location, dataset):
+    cursor = location.get_contacts(limit=10).adaptive()
+    assert len({contact["id"] for contact in cursor}) == dataset.contacts
+    assert cursor._page_sizer.size > 10
@@ -0,0 +1,60 @@
+import asyncio
+import os
+
+import pandas as pd
+
+from highlevel_sdk.api.endpoints import GoHighLevelService
+from highlevel_sdk.client import Page
+
+
+def test_iter_pages_yields_numbered_pages(location, dataset):
+    pages = list(location.get_contacts(limit=100).iter_pages())
+    assert all(isinstance(page, Page) for page in pages)
+    assert [page.number for page in pages] == [1, 2, 3]
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert pages[0].meta.get("startAfterId")
+    assert len({c["id"] for page in pages for c in page}) == dataset.contacts
+
+
+def test_iter_pages_matches_across_cursor_modes(location):
+    ids = [c["id"] for c in location.get_contacts(limit=40)]
+    for cursor in (
+        location.get_contacts(limit=40, stream=True),
+        location.get_contacts(limit=40).prefetch(2),
+    ):
+        assert [c["id"] for page in cursor.iter_pages() for c in page] == ids
+
+
+def test_iter_pages_resumes_after_records(location, dataset):
+    cursor = location.get_contacts(limit=40)
+    first = next(cursor)
+    rest = [c["id"] for page in cursor.iter_pages() for c in page]
+    assert first["id"] not in rest
+    assert len(rest) == dataset.contacts - 1
+
+
+def test_exports_write_every_record(client, dataset, tmp_path):
+    service = GoHighLevelService(
+        token="token", id_location=dataset.location_id, client=client
+    )
+    assert service.export_contacts_csv(tmp_path, pages_per_chunk=1) == dataset.contacts
+    assert service.export_opportunities_csv(tmp_path) == dataset.opportunities
+    contacts = pd.read_csv(os.path.join(tmp_path, "contacts.csv"))
+    assert len(contacts) == contacts["id"].nunique() == dataset.contacts
+    assert len(pd.read_csv(os.path.join(tmp_path, "opportunities.csv"))) == (
+        dataset.opportunities
+    )
+
+
+def test_async_iter_pages(async_location, dataset):
+    async def main():
+        location = async_location()
+        try:
+            return [
+                len(page)
+                async for page in location.get_contacts(limit=100).iter_pages()
+            ]
+        finally:
+            await location.api.close()
+
+    assert asyncio.run(main()) == [100, 100, 50]
@@ -0,0 +1,124 @@
+import pytest
+
+from highlevel_sdk.client import Cursor
+from highlevel_sdk.exceptions import HighLevelError
+from highlevel_sdk.models import Contact
+from highlevel_sdk.object_parser import ObjectParser
+from highlevel_sdk.pagination import (
+    DatePagination,
+    MessagePagination,
+    MetaPagination,
+    PageNumberPagination,
+    SearchAfterPagination,
+)
+
+
+def test_meta_pagination_follows_start_after():
+    strategy = MetaPagination()
+    body = {"meta": {"nextPage": 2, "startAfter": 10, "startAfterId": "c9"}}
+    assert strategy.next_params({}, body, [{}]) == {
+        "startAfter": 10,
+        "startAfterId": "c9",
+    }
+    assert strategy.next_params({}, {"meta": {"nextPage": None}}, [{}]) is None
+    assert strategy.next_params({}, {}, [{}]) is None
+
+
+def test_date_pagination_needs_a_sorted_collection():
+    strategy = DatePagination()
+    records = [{"lastMessageDate": 1}, {"lastMessageDate": 2}]
+    assert strategy.next_params({"sortBy": "last_message_date"}, {}, records) == {
+        "startAfterDate": 2
+    }
+    assert strategy.next_params({}, {}, records) is None
+
+
+def test_message_pagination_reads_nested_and_top_level_blocks():
+    strategy = MessagePagination()
+    nested = {
+        "messages": {
+            "messages": [{"id": "m1"}],
+            "lastMessageId": "m1",
+            "nextPage": True,
+        }
+    }
+    assert strategy.records(nested) is nested["messages"]
+    assert strategy.next_params({}, nested, [{"id": "m1"}]) == {"lastMessageId": "m1"}
+
+    top_level = {"messages": [{"id": "m2"}], "nextPage": True}
+    assert strategy.records(top_level) == {"messages": [{"id": "m2"}]}
+    assert strategy.next_params({}, top_level, [{"id": "m2"}]) == {
+        "lastMessageId": "m2"
+    }
+    assert strategy.next_params({}, {"messages": [], "nextPage": False}, [{}]) is None
+
+
+def test_page_number_pagination_has_a_fixed_size():
+    strategy = PageNumberPagination()
+    assert strategy.size_key is None
+    body = {"submissions": [{"id": 1}], "meta": {"currentPage": "2", "nextPage": 3}}
+    assert strategy.records(body) == {"submissions": [{"id": 1}]}
+    assert strategy.next_params({}, body, [{}]) == {"page": 3}
+    assert strategy.next_params({}, {"meta": {"nextPage": None}}, [{}]) is None
+
+
+def test_search_after_pagination_stops_on_a_short_page():
+    strategy = SearchAfterPagination()
+    records = [{"searchAfter": [1, "a"]}, {"searchAfter": [2, "b"]}]
+    assert strategy.next_params({"pageLimit": 2}, {}, records) == {
+        "searchAfter": [2, "b"]
+    }
+    assert strategy.next_params({"pageLimit": 3}, {}, records) is None
+
+
+def test_cursors_page_through_every_strategy(location, dataset):
+    assert len(list(location.get_contacts(limit=40))) == dataset.contacts
+    assert len(list(location.get_opportunities(limit=40))) == dataset.opportunities
+    assert len(list(location.search_contacts(page_limit=40))) == dataset.contacts
+    assert len(list(location.get_conversations(limit=7))) == dataset.conversations
+    assert (
+        len(list(location.get_form_submissions(limit=30))) == dataset.form_submissions
+    )
+
+
+def _contacts_cursor(client, dataset, custom_pagination_fn):
+    return Cursor(
+        Contact,
+        {"locationId": dataset.location_id, "limit": 40},
+        "/contacts/",
+        {"access_token": "token"},
+        client,
+        ObjectParser,
+        custom_pagination_fn=custom_pagination_fn,
+    )
+
+
+def test_custom_pagination_fn_receives_the_page_body(client, dataset):
+    def paginate(cursor, body):
+        cursor._queue.extend(
+            ObjectParser.parse_multiple(body, Contact, cursor.token_data, client)
+        )
+        params = MetaPagination().next_params(cursor._params, body, cursor._queue)
+        cursor._params.update(params or {})
+        return params is not None
+
+    ids = [c["id"] for c in _contacts_cursor(client, dataset, paginate)]
+    assert len(set(ids)) == dataset.contacts
+
+
+def test_one_argument_custom_pagination_fn_still_loads_pages(client, dataset):
+    def paginate(cursor):
+        body = client._call(
+            "GET", "/contacts/", data=cursor._params, token_data=cursor.token_data
+        ).json()
+        cursor._queue = ObjectParser.parse_multiple(body, Contact, cursor.token_data)
+        meta = body["meta"]
+        cursor._params["startAfter"] = meta["startAfter"]
+        cursor._params["startAfterId"] = meta["startAfterId"]
+        return meta["nextPage"] is not None
+
+    cursor = _contacts_cursor(client, dataset, paginate)
+    ids = [c["id"] for c in cursor]
+    assert len(set(ids)) == len(ids) == dataset.contacts
+    with pytest.raises(HighLevelError):
+        _contacts_cursor(client, dataset, paginate).prefetch()
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from highlevel_sdk.exceptions import HighLevelError
+
+
+def _prefetch_threads():
+    return [t for t in threading.enumerate() if t.name == "highlevel-prefetch"]
+
+
+def test_prefetched_cursor_matches_plain_one(location, dataset):
+    plain = [c["id"] for c in location.get_contacts(limit=40)]
+    prefetched = [c["id"] for c in location.get_contacts(limit=40).prefetch(2)]
+    assert len(plain) == dataset.contacts
+    assert prefetched == plain
+
+
+def test_prefetch_follows_other_pagination_styles(location, dataset):
+    conversations = list(location.get_conversations(limit=10).prefetch(1))
+    assert len({c["id"] for c in conversations}) == len(conversations) > 10
+    messages = list(conversations[0].get_messages(limit=7).prefetch(3))
+    assert len({m["id"] for m in messages}) == dataset.messages_per_conversation
+
+
+def test_closing_stops_the_prefetch_thread(location):
+    cursor = location.get_contacts(limit=10).prefetch(2)
+    next(cursor)
+    cursor.close()
+    deadline = time.monotonic() + 2
+    while _prefetch_threads() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert not _prefetch_threads()
+
+
+def test_streamed_cursors_cannot_prefetch(location):
+    with pytest.raises(HighLevelError):
+        location.get_contacts(limit=10, stream=True).prefetch()
+
+
+def test_async_prefetch(async_location, location):
+    async def main():
+        location = async_location()
+        try:
+            return [c["id"] async for c in location.get_contacts(limit=40).prefetch(2)]
+        finally:
+            await location.api.close()
+
+    plain = [c["id"] for c in location.get_contacts(limit=40)]
+    assert asyncio.run(main()) == plain
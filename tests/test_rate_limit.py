@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from highlevel_sdk.config import HighLevelConfig
+from highlevel_sdk.exceptions import HighLevelRateLimitError
+from highlevel_sdk.rate_limit import RateLimiter, TokenBucket
+
+
+def test_reserve_paces_once_the_burst_is_spent():
+    bucket = TokenBucket(capacity=2, interval=10)
+    assert bucket.reserve(0) == 0.0
+    assert bucket.reserve(0) == 0.0
+    assert bucket.reserve(0) == pytest.approx(5.0)
+
+
+def test_sync_never_hands_back_reserved_tokens():
+    bucket = TokenBucket(capacity=10, interval=10)
+    bucket.reserve(0)
+    bucket.sync(0, remaining=50)
+    assert bucket.tokens == 9
+    bucket.sync(0, remaining=3)
+    assert bucket.tokens == 3
+
+
+def test_daily_remaining_follows_the_server_less_calls_in_flight():
+    bucket = TokenBucket(capacity=100, interval=10)
+    bucket.reserve(0)
+    bucket.reserve(0)
+    bucket.sync(0, daily_remaining=500)
+    assert bucket.in_flight == 1
+    assert bucket.daily_remaining == 499
+
+
+def test_daily_budget_recovers_when_the_window_rolls_over():
+    bucket = TokenBucket(capacity=100, interval=10)
+    bucket.reserve(0)
+    bucket.sync(0, daily_remaining=0)
+    with pytest.raises(HighLevelRateLimitError):
+        bucket.reserve(1)
+
+    # a probe goes through once the interval has passed, and its response
+    # reports the new day
+    later = HighLevelConfig.RATE_LIMIT_DAILY_PROBE_INTERVAL + 1
+    assert bucket.reserve(later) == 0.0
+    bucket.sync(later, daily_remaining=199999)
+    assert bucket.daily_remaining == 199999
+    bucket.reserve(later)
+    assert bucket.daily_remaining == 199998
+
+
+def test_probes_are_spaced_out():
+    bucket = TokenBucket(capacity=100, interval=10)
+    bucket.reserve(0)
+    bucket.sync(0, daily_remaining=0)
+    probe = HighLevelConfig.RATE_LIMIT_DAILY_PROBE_INTERVAL
+    bucket.reserve(probe)
+    bucket.sync(probe, daily_remaining=0)
+    with pytest.raises(HighLevelRateLimitError):
+        bucket.reserve(probe + 1)
+    bucket.reserve(2 * probe)
+
+
+def test_release_frees_calls_without_a_response():
+    limiter = RateLimiter(capacity=10, interval=10)
+    limiter.acquire("loc")
+    limiter.release("loc")
+    limiter.update("loc", {"X-RateLimit-Daily-Remaining": "40"})
+    assert limiter.budget("loc")["daily_remaining"] == 40
+
+
+def test_update_reads_headers_and_drains_on_429():
+    limiter = RateLimiter(capacity=10, interval=10)
+    limiter.update(
+        "loc",
+        {
+            "X-RateLimit-Max": "20",
+            "X-RateLimit-Interval-Milliseconds": "2000",
+            "X-RateLimit-Limit-Daily": "1000",
+        },
+        status_code=429,
+    )
+    budget = limiter.budget("loc")
+    assert budget["capacity"] == 20
+    assert budget["interval"] == 2.0
+    assert budget["daily_limit"] == 1000
+    assert budget["tokens"] < 1
+
+
+def test_key_for_prefers_location_then_company():
+    assert RateLimiter.key_for({"locationId": "l", "companyId": "c"}) == "l"
+    assert RateLimiter.key_for({"companyId": "c", "access_token": "t"}) == "c"
+    assert RateLimiter.key_for({"access_token": "t"}) == "t"
+    assert RateLimiter.key_for(None) is None
+
+
+def _in_flight(limiter):
+    return sum(bucket.in_flight for bucket in limiter._buckets.values())
+
+
+def test_timed_out_async_calls_free_their_slots(async_location, server, dataset):
+    server.latency = 0.3
+
+    async def main():
+        location = async_location()
+        try:
+            for _ in range(3):
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        location.get_contact(dataset.contact(0)["id"]), 0.05
+                    )
+            limiter = location.api.rate_limiter
+            assert _in_flight(limiter) == 0
+            server.latency = 0
+            await location.get_contact(dataset.contact(1)["id"])
+            return limiter.budget("token")
+        finally:
+            await location.api.close()
+
+    budget = asyncio.run(main())
+    assert budget["daily_remaining"] == server.daily_limit - server.request_count
+
+
+def test_cancelled_waits_free_their_slots():
+    limiter = RateLimiter(capacity=1, interval=10)
+
+    async def main():
+        await limiter.acquire_async("key")
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire_async("key"), 0.05)
+
+    asyncio.run(main())
+    assert limiter._buckets["key"].in_flight == 1
+
+
+def test_other_errors_free_their_slots(client, location, dataset):
+    def fail(event):
+        raise RuntimeError("hook failed")
+
+    client.hooks.subscribe("on_request", fail)
+    with pytest.raises(RuntimeError):
+        location.get_contact(dataset.contact(0)["id"])
+    assert _in_flight(client.rate_limiter) == 0
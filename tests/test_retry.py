@@ -0,0 +1,109 @@
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.exceptions import HighLevelRequestException
+from highlevel_sdk.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def test_budget_allows_a_share_of_calls():
+    budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_should_retry_only_idempotent_calls_on_retry_statuses():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry("GET", 1, status_code=503)
+    assert not policy.should_retry("GET", 1, status_code=400)
+    assert not policy.should_retry("POST", 1, status_code=503)
+    assert policy.should_retry("POST", 1, status_code=503, idempotent=True)
+    assert policy.should_retry("GET", 1, exception=ConnectionError())
+    assert not policy.should_retry("GET", 3, status_code=503)
+
+
+def test_retry_after_over_max_delay_is_not_retried():
+    policy = RetryPolicy(max_delay=10, budget=RetryBudget(max_tokens=1))
+    assert not policy.should_retry("GET", 1, 429, headers={"Retry-After": "60"})
+    assert policy.should_retry("GET", 1, 429, headers={"Retry-After": "10"})
+
+
+def test_should_retry_draws_from_the_budget():
+    policy = RetryPolicy(budget=RetryBudget(min_per_second=0, max_tokens=1))
+    assert policy.should_retry("GET", 1, status_code=429)
+    assert not policy.should_retry("GET", 1, status_code=429)
+
+
+def test_backoff_never_waits_less_than_retry_after():
+    policy = RetryPolicy(base_delay=1, max_delay=10)
+    assert policy.backoff(headers={"Retry-After": "3"}) == 3
+    assert policy.backoff(headers={"Retry-After": "60"}) == 60
+    for _ in range(20):
+        assert 1 <= policy.backoff(2) <= 6
+
+
+def test_parse_retry_after_takes_seconds_and_dates():
+    assert parse_retry_after({"Retry-After": "2.5"}) == 2.5
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after(None) is None
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    seconds = parse_retry_after({"Retry-After": format_datetime(retry_at, usegmt=True)})
+    assert 25 < seconds <= 30
+
+
+def test_client_retries_throttled_gets(server, dataset):
+    server.throttle_rate = 1.0
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.01)
+    with HighLevelClient(base_url=server.url, retry_policy=policy) as client:
+        with pytest.raises(HighLevelRequestException) as raised:
+            client._call(
+                "GET",
+                "/contacts/",
+                token_data={"access_token": "token"},
+                data={"locationId": dataset.location_id},
+            )
+    assert raised.value.http_status() == 429
+    assert server.request_count == 3
+
+
+def test_client_does_not_retry_posts(server, dataset):
+    server.throttle_rate = 1.0
+    policy = RetryPolicy(base_delay=0.01, max_delay=0.01)
+    with HighLevelClient(base_url=server.url, retry_policy=policy) as client:
+        with pytest.raises(HighLevelRequestException):
+            client._call(
+                "POST",
+                "/contacts/",
+                token_data={"access_token": "token"},
+                data={"locationId": dataset.location_id, "firstName": "A"},
+            )
+    assert server.request_count == 1
+
+
+def test_client_raises_when_retry_after_is_too_long(server, dataset):
+    server.rate_limit = 1
+    server.rate_limit_interval = 120
+    policy = RetryPolicy(base_delay=0.01, max_delay=5)
+    with HighLevelClient(
+        base_url=server.url, retry_policy=policy, rate_limiter=False
+    ) as client:
+        call = dict(
+            method="GET",
+            path="/contacts/",
+            token_data={"access_token": "token"},
+            data={"locationId": dataset.location_id},
+        )
+        client._call(**call)
+        started = time.monotonic()
+        with pytest.raises(HighLevelRequestException) as raised:
+            client._call(**call)
+    assert raised.value.http_status() == 429
+    assert time.monotonic() - started < 1
+    assert server.request_count == 2
@@ -0,0 +1,38 @@
+import json
+
+from highlevel_sdk import serialization
+from highlevel_sdk.client import HighLevelResponse
+
+
+def test_dumps_is_compact_and_round_trips(monkeypatch):
+    payload = {"name": "Zoë", "tags": ["a", "b"], "count": 2}
+    for orjson in (serialization.orjson, None):
+        monkeypatch.setattr(serialization, "orjson", orjson)
+        body = serialization.dumps(payload)
+        assert isinstance(body, bytes)
+        assert b" " not in body
+        assert serialization.loads(body) == payload
+        assert serialization.loads(body.decode()) == payload
+
+
+def test_response_decodes_its_body_once():
+    body = json.dumps({"contacts": [{"id": "a"}]}).encode()
+    response = HighLevelResponse(body, {}, 200, {})
+    assert response.json() is response.json()
+    assert response.content() is body
+    assert response.text() == body.decode()
+
+
+def test_copies_decode_on_their_own():
+    response = HighLevelResponse(b'{"id": "a"}', {}, 200, {})
+    copy = response.copy()
+    copy.json()["id"] = "b"
+    assert response.json() == {"id": "a"}
+    assert copy.body is response.body
+
+
+def test_error_responses_keep_their_text():
+    response = HighLevelResponse(b'{"message": "nope"}', {}, 422, {})
+    assert response.is_error()
+    assert response.error().http_status() == 422
+    assert response.error().body() == {"message": "nope"}
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from highlevel_sdk.exceptions import HighLevelError
+from highlevel_sdk.sharding import ShardedScan, _Window
+
+
+@pytest.mark.parametrize("shards", [1, 3, 8])
+def test_sharded_scans_hand_out_each_record_once(location, dataset, shards):
+    ids = [contact["id"] for contact in location.get_contacts(limit=20, shards=shards)]
+    assert len(ids) == dataset.contacts
+    assert set(ids) == {contact["id"] for contact in location.get_contacts(limit=100)}
+
+
+def test_sharded_opportunities(location, dataset):
+    ids = {
+        opportunity["id"]
+        for opportunity in location.get_opportunities(limit=20, shards=4)
+    }
+    assert len(ids) == dataset.opportunities
+
+
+def test_async_sharded_scan(async_location, dataset):
+    async def main():
+        location = async_location()
+        try:
+            return [
+                contact["id"]
+                async for contact in location.get_contacts(limit=20, shards=4)
+            ]
+        finally:
+            await location.api.close()
+
+    ids = asyncio.run(main())
+    assert len(ids) == len(set(ids)) == dataset.contacts
+
+
+def test_sharded_scans_cannot_stream(location):
+    with pytest.raises(HighLevelError):
+        location.get_contacts(limit=20, stream=True, shards=2)
+
+
+def test_undated_records_are_handed_out_once():
+    scan = ShardedScan(None, "dateAdded", shards=3)
+    first, last = _Window(None, 100), _Window(100, 200, open_ended=True)
+    page = [{"id": "undated"}, {"name": "no id"}, {"id": "a", "dateAdded": 150}]
+
+    admitted = [
+        record
+        for window in (first, last, _Window(100, 200, open_ended=True))
+        for record in scan._admit(window, page)[0]
+    ]
+    assert admitted.count(page[0]) == 1
+    assert admitted.count(page[1]) == 1
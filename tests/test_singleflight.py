@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from highlevel_sdk.client import HighLevelClient
+from highlevel_sdk.singleflight import SingleFlight
+
+
+def test_concurrent_threads_share_one_call():
+    flight = SingleFlight(share=dict)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"n": 1}
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(flight.do, "key", fn)
+        started.wait(5)
+        followers = [pool.submit(flight.do, "key", fn) for _ in range(3)]
+        time.sleep(0.1)
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+    assert len(calls) == 1
+    assert results == [{"n": 1}] * 4
+    assert len({id(result) for result in results}) == 4
+
+
+def test_followers_get_the_leader_error():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "key", fn)
+        started.wait(5)
+        follower = pool.submit(flight.do, "key", lambda: "not called")
+        release.set()
+        with pytest.raises(ValueError):
+            leader.result()
+        with pytest.raises(ValueError):
+            follower.result()
+
+
+def test_async_callers_share_one_call_and_get_their_own_copy():
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"n": 1}
+
+    async def main():
+        flight = SingleFlight(share=dict)
+        return await asyncio.gather(*(flight.do_async("key", fn) for _ in range(3)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert results == [{"n": 1}] * 3
+    assert len({id(result) for result in results}) == 3
+
+
+def test_cancelling_the_leader_does_not_cancel_followers():
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        flight = SingleFlight()
+        leader = asyncio.ensure_future(flight.do_async("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_async("key", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "done"
+    assert len(calls) == 1
+
+
+def test_call_is_cancelled_once_every_caller_gives_up():
+    cancelled = []
+
+    async def fn():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+
+    async def main():
+        flight = SingleFlight()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(flight.do_async("key", fn), 0.01)
+        await asyncio.sleep(0)
+        assert not flight._flights
+
+    asyncio.run(main())
+    assert cancelled == [1]
+
+
+def test_coalesced_responses_decode_separately(server, dataset):
+    server.latency = 0.1
+    token_data = {"access_token": "token"}
+    params = {"locationId": dataset.location_id, "limit": 5}
+    with HighLevelClient(base_url=server.url) as client:
+        with ThreadPoolExecutor(3) as pool:
+            responses = list(
+                pool.map(
+                    lambda _: client._call("GET", "/contacts/", token_data, params),
+                    range(3),
+                )
+            )
+    assert server.request_count == 1
+    responses[0].json()["contacts"][0]["firstName"] = "changed"
+    assert responses[1].json()["contacts"][0]["firstName"] != "changed"
+    assert responses[1].body is responses[0].body
+
+
+def test_calls_with_other_tokens_are_not_coalesced():
+    client = HighLevelClient()
+    first = {"access_token": "A", "locationId": "L"}
+    second = {"access_token": "B", "locationId": "L"}
+    params = {"locationId": "L"}
+    assert client._flight_key("GET", "/contacts/", first, params) != (
+        client._flight_key("GET", "/contacts/", second, params)
+    )
+    assert client._flight_key("GET", "/contacts/", first, params) == (
+        client._flight_key("GET", "/contacts/", dict(first), params)
+    )
@@ -0,0 +1,41 @@
+import io
+import json
+
+import pytest
+
+from highlevel_sdk import streaming
+from highlevel_sdk.streaming import iter_records
+
+BODY = {
+    "contacts": [{"id": "a", "tags": ["x"]}, {"id": "b", "customFields": [{"v": 1.5}]}],
+    "meta": {"total": 2, "startAfterId": "b"},
+}
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def parser(request, monkeypatch):
+    if request.param == "fallback":
+        monkeypatch.setattr(streaming, "ijson", None)
+    elif streaming.ijson is None:
+        pytest.skip("ijson is not installed")
+
+
+def test_iter_records_splits_records_from_meta(parser):
+    meta = {}
+    fp = io.BytesIO(json.dumps(BODY).encode())
+    assert list(iter_records(fp, skip_keys=("meta",), meta=meta)) == BODY["contacts"]
+    assert meta == {"meta": BODY["meta"]}
+
+
+def test_streamed_pages_match_buffered_ones(location, dataset, parser):
+    buffered = [dict(c) for c in location.get_contacts(limit=40)]
+    streamed = [dict(c) for c in location.get_contacts(limit=40, stream=True)]
+    assert len(streamed) == dataset.contacts
+    assert streamed == buffered
+
+
+def test_abandoned_stream_leaves_the_client_usable(location, dataset):
+    cursor = location.get_contacts(limit=40, stream=True)
+    next(cursor)
+    del cursor
+    assert len(list(location.get_contacts(limit=40))) == dataset.contacts